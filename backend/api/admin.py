@@ -1,3 +1,12 @@
 from django.contrib import admin
 
+from .models import SimulationJob
+
 # Register your models here.
+
+
+@admin.register(SimulationJob)
+class SimulationJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'status', 'progress', 'created_at', 'finished_at')
+    list_filter = ('kind', 'status')
+    readonly_fields = ('created_at', 'started_at', 'finished_at')
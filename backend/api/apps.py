@@ -4,3 +4,32 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+    
+    def ready(self):
+        import os
+        from django.conf import settings
+        from .result_cache import simulation_cache
+        
+        # numpy-backed modules are only imported here when configured to
+        # preload; otherwise the first request that needs them imports them
+        if settings.PHYSICS_TABLE_PATH or settings.PHYSICS_TABLES_PRELOAD:
+            from .physics import physics_engine
+            
+            physics_engine.lookup_tables.path = settings.PHYSICS_TABLE_PATH or None
+            if settings.PHYSICS_TABLES_PRELOAD:
+                physics_engine.lookup_tables.get()
+        
+        # Warm start: serve the last saved catalog without calling NASA
+        snapshot_path = settings.NEO_CATALOG_SNAPSHOT_PATH
+        if snapshot_path and os.path.exists(snapshot_path):
+            from .catalog_store import catalog_store
+            
+            try:
+                catalog_store.load_snapshot(snapshot_path)
+            except (OSError, ValueError) as e:
+                catalog_store.last_sync = {'error': f'Catalog snapshot not loaded: {e}'}
+        
+        simulation_cache.enabled = settings.SIMULATION_CACHE_ENABLED
+        simulation_cache.max_entries = settings.SIMULATION_CACHE_SIZE
+        simulation_cache.ttl_seconds = settings.SIMULATION_CACHE_TTL
+        simulation_cache.coord_precision = settings.SIMULATION_CACHE_COORD_PRECISION
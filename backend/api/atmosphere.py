@@ -0,0 +1,287 @@
+"""
+Atmospheric Entry Model for Asteroid Impact Simulation
+Pancake (Chyba / Hills & Goda style) fragmentation model, vectorized over many bodies
+"""
+import math
+
+import numpy as np
+
+
+class AtmosphericEntry:
+    """Integrate atmospheric entry for a batch of bodies at once"""
+    
+    # Atmosphere (isothermal exponential model)
+    SURFACE_AIR_DENSITY = 1.225  # kg/m^3
+    SCALE_HEIGHT_M = 8000  # m
+    ENTRY_ALTITUDE_M = 100000  # m, top of the integration
+    
+    # Body / flow coefficients
+    DRAG_COEFFICIENT = 2.0
+    HEAT_TRANSFER_COEFFICIENT = 0.1
+    ABLATION_HEAT_J_KG = 8e6  # heat of ablation
+    PANCAKE_FACTOR = 7.0  # radius growth at which the swarm is treated as dispersed
+    
+    GRAVITY = 9.81  # m/s^2
+    EARTH_RADIUS_M = 6371000  # m
+    JOULES_PER_KILOTON = 4.184e12  # true kiloton of TNT, used for blast scaling
+    
+    # Integrator controls
+    ALTITUDE_STEP_M = 2000.0  # nominal altitude drop per step
+    MAX_RELATIVE_CHANGE = 0.1  # max fractional change of v, m or r per step
+    MAX_STEPS = 4000
+    MIN_PATH_ANGLE_DEG = 1.0  # grazing bodies are not allowed to skip back out
+    
+    # Ground overpressure thresholds (Pa), matched to ImpactPhysics blast zones
+    OVERPRESSURE_THRESHOLDS = {
+        'total_destruction_radius_km': 138000,  # 20 psi
+        'severe_damage_radius_km': 34500,  # 5 psi
+        'moderate_damage_radius_km': 13800,  # 2 psi
+        'window_breakage_radius_km': 6900,  # 1 psi
+    }
+    
+    def yield_strength(self, density):
+        """
+        Estimate bulk strength from density (Collins et al. 2005, eq. 10)
+        
+        Args:
+            density: Bulk density in kg/m^3 (scalar or array)
+        
+        Returns:
+            Yield strength in Pa
+        """
+        return 10 ** (2.107 + 0.0624 * np.sqrt(density))
+    
+    def air_density(self, altitude_m):
+        """Atmospheric density at altitude (kg/m^3)"""
+        return self.SURFACE_AIR_DENSITY * np.exp(-np.maximum(altitude_m, 0) / self.SCALE_HEIGHT_M)
+    
+    def _derivatives(self, v, m, theta, z, r, u, rho_m, strength, fragmented):
+        """
+        Right-hand side of the entry ODEs for the whole batch
+        
+        State: velocity v, mass m, path angle theta (from horizontal),
+        altitude z, radius r and radial spreading rate u = dr/dt.
+        """
+        rho_a = self.air_density(z)
+        area = math.pi * r ** 2
+        sin_t = np.sin(theta)
+        cos_t = np.cos(theta)
+        
+        dv = -self.DRAG_COEFFICIENT * rho_a * area * v ** 2 / (2 * m) + self.GRAVITY * sin_t
+        dm = -self.HEAT_TRANSFER_COEFFICIENT * rho_a * area * v ** 3 / (2 * self.ABLATION_HEAT_J_KG)
+        dtheta = self.GRAVITY * cos_t / v - v * cos_t / (self.EARTH_RADIUS_M + z)
+        dz = -v * sin_t
+        
+        # Pancake spreading only once ram pressure has exceeded the strength
+        fragmented = fragmented | (rho_a * v ** 2 > strength)
+        dr = np.where(fragmented, u, 0.0)
+        du = np.where(fragmented, self.DRAG_COEFFICIENT * rho_a * v ** 2 / (2 * rho_m * r), 0.0)
+        
+        return dv, dm, dtheta, dz, dr, du
+    
+    def simulate_batch(self, diameter_km, velocity_kmps, impact_angle=45, density=3000):
+        """
+        Integrate atmospheric entry for many bodies with one vectorized RK4 loop
+        
+        Each body takes its own step size (a nominal altitude drop, shortened
+        wherever velocity or radius would change by more than
+        MAX_RELATIVE_CHANGE), so a batch never needs a per-body Python loop.
+        
+        Args:
+            diameter_km: Diameters in kilometers (scalar or array)
+            velocity_kmps: Entry velocities in km/s (scalar or array)
+            impact_angle: Entry angles from horizontal in degrees (scalar or array)
+            density: Bulk densities in kg/m^3 (scalar or array)
+        
+        Returns:
+            dict: Arrays (one element per body) describing the entry outcome
+        """
+        diameter_km, velocity_kmps, impact_angle, density = np.broadcast_arrays(
+            np.asarray(diameter_km, dtype=float),
+            np.asarray(velocity_kmps, dtype=float),
+            np.asarray(impact_angle, dtype=float),
+            np.asarray(density, dtype=float),
+        )
+        shape = diameter_km.shape
+        
+        r0 = diameter_km.ravel() * 500.0
+        rho_m = density.ravel()
+        n = r0.size
+        
+        # Final state per body (filled in as bodies finish)
+        v = velocity_kmps.ravel() * 1000.0
+        m = rho_m * (4 / 3) * math.pi * r0 ** 3
+        z = np.full(n, float(self.ENTRY_ALTITUDE_M))
+        initial_energy = 0.5 * m * v ** 2
+        breakup_altitude = np.full(n, np.nan)
+        burst_altitude = np.full(n, np.nan)
+        peak_altitude = np.zeros(n)
+        
+        # Working set: only bodies still in flight are integrated
+        idx = np.flatnonzero(r0 > 0)
+        wv, wm, wz = v[idx], m[idx], z[idx]
+        wtheta = np.radians(np.clip(impact_angle.ravel()[idx], self.MIN_PATH_ANGLE_DEG, 90.0))
+        wr = r0[idx].copy()
+        wu = np.zeros(idx.size)
+        wr0, wrho = r0[idx], rho_m[idx]
+        wstrength = self.yield_strength(wrho)
+        we0 = initial_energy[idx]
+        wfrag = np.zeros(idx.size, dtype=bool)
+        wpeak = np.zeros(idx.size)
+        wpeak_alt = np.zeros(idx.size)
+        
+        for _ in range(self.MAX_STEPS):
+            if idx.size == 0:
+                break
+            
+            state = (wv, wm, wtheta, wz, wr, wu)
+            params = (wrho, wstrength, wfrag)
+            k1 = self._derivatives(*state, *params)
+            
+            # Per-body step: nominal altitude drop, limited by how fast v, m and r change
+            descent_rate = np.maximum(wv * np.sin(wtheta), 1.0)
+            dt = np.minimum(self.ALTITUDE_STEP_M, np.maximum(wz, 1.0)) / descent_rate
+            dt = np.minimum(dt, self.MAX_RELATIVE_CHANGE * wv / np.maximum(np.abs(k1[0]), 1e-12))
+            dt = np.minimum(dt, self.MAX_RELATIVE_CHANGE * wm / np.maximum(np.abs(k1[1]), 1e-12))
+            dt = np.minimum(dt, self.MAX_RELATIVE_CHANGE * wr / np.maximum(np.abs(k1[4]), 1e-12))
+            # Spreading acceleration as if already fragmented, so a breakup
+            # inside the step cannot blow the radius up in one go
+            spread = self.DRAG_COEFFICIENT * self.air_density(wz) * wv ** 2 / (2 * wrho * wr)
+            dt = np.minimum(dt, np.sqrt(self.MAX_RELATIVE_CHANGE * wr / np.maximum(spread, 1e-12)))
+            
+            k2 = self._derivatives(*[s + 0.5 * dt * k for s, k in zip(state, k1)], *params)
+            k3 = self._derivatives(*[s + 0.5 * dt * k for s, k in zip(state, k2)], *params)
+            k4 = self._derivatives(*[s + dt * k for s, k in zip(state, k3)], *params)
+            new_v, new_m, new_theta, new_z, new_r, new_u = [
+                s + dt / 6 * (a + 2 * b + 2 * c + d)
+                for s, a, b, c, d in zip(state, k1, k2, k3, k4)
+            ]
+            new_v = np.maximum(new_v, 1.0)
+            new_m = np.maximum(new_m, 1e-9 * wm)
+            new_theta = np.clip(new_theta, math.radians(self.MIN_PATH_ANGLE_DEG), math.pi / 2)
+            
+            # Track the altitude of peak energy deposition per unit altitude
+            drop = np.maximum(wz - new_z, 1e-9)
+            rate = (0.5 * wm * wv ** 2 - 0.5 * new_m * new_v ** 2) / drop
+            is_peak = rate > wpeak
+            wpeak = np.where(is_peak, rate, wpeak)
+            wpeak_alt = np.where(is_peak, 0.5 * (wz + new_z), wpeak_alt)
+            
+            just_fragmented = ~wfrag & (self.air_density(new_z) * new_v ** 2 > wstrength)
+            breakup_altitude[idx[just_fragmented]] = new_z[just_fragmented]
+            wfrag = wfrag | just_fragmented
+            
+            wv, wm, wtheta, wz, wr, wu = new_v, new_m, new_theta, new_z, new_r, new_u
+            
+            # A body is done when it disperses (airburst), reaches the ground,
+            # or has shed essentially all of its kinetic energy
+            dispersed = wr >= self.PANCAKE_FACTOR * wr0
+            exhausted = 0.5 * wm * wv ** 2 < 1e-3 * we0
+            done = dispersed | (wz <= 1.0) | exhausted
+            if done.any():
+                finished = idx[done]
+                v[finished], m[finished], z[finished] = wv[done], wm[done], wz[done]
+                peak_altitude[finished] = wpeak_alt[done]
+                burst_altitude[idx[dispersed]] = np.maximum(wz[dispersed], 0.0)
+                
+                keep = ~done
+                idx = idx[keep]
+                wv, wm, wtheta, wz, wr, wu = wv[keep], wm[keep], wtheta[keep], wz[keep], wr[keep], wu[keep]
+                wr0, wrho, wstrength, we0 = wr0[keep], wrho[keep], wstrength[keep], we0[keep]
+                wfrag, wpeak, wpeak_alt = wfrag[keep], wpeak[keep], wpeak_alt[keep]
+        
+        # Bodies still in flight after MAX_STEPS keep their last state
+        v[idx], m[idx], z[idx] = wv, wm, wz
+        peak_altitude[idx] = wpeak_alt
+        
+        is_airburst = ~np.isnan(burst_altitude) & (burst_altitude > 0)
+        stalled = np.isnan(burst_altitude) & (z > 1.0)
+        # Bodies that shed their energy aloft without dispersing burst at peak deposition
+        burst_altitude = np.where(stalled, peak_altitude, burst_altitude)
+        is_airburst = is_airburst | stalled
+        burst_altitude = np.where(is_airburst, burst_altitude, 0.0)
+        
+        final_energy = np.where(is_airburst, 0.0, 0.5 * m * v ** 2)
+        energy_deposited = initial_energy - final_energy
+        
+        overpressure = self.ground_overpressure_radii(energy_deposited, burst_altitude)
+        overpressure = {
+            key: np.where(is_airburst, value, np.nan)
+            for key, value in overpressure.items()
+        }
+        
+        result = {
+            'is_airburst': is_airburst,
+            'breakup_altitude_m': breakup_altitude,
+            'burst_altitude_m': burst_altitude,
+            'peak_deposition_altitude_m': peak_altitude,
+            'initial_energy_joules': initial_energy,
+            'energy_deposited_joules': energy_deposited,
+            'energy_deposited_fraction': np.divide(
+                energy_deposited, initial_energy,
+                out=np.zeros_like(initial_energy), where=initial_energy > 0
+            ),
+            'impact_velocity_kmps': np.where(is_airburst, 0.0, v / 1000.0),
+            'impact_mass_kg': np.where(is_airburst, 0.0, m),
+            'impact_energy_joules': final_energy,
+        }
+        result.update(overpressure)
+        return {key: value.reshape(shape) for key, value in result.items()}
+    
+    def ground_overpressure_radii(self, energy_joules, burst_altitude_m):
+        """
+        Ground ranges at which each overpressure threshold is reached
+        
+        Uses the 1 kt surface-burst overpressure curve of Collins et al. (2005)
+        evaluated at slant range, with cube-root yield scaling.
+        
+        Args:
+            energy_joules: Energy released at the burst point (array)
+            burst_altitude_m: Burst altitude in meters (array)
+        
+        Returns:
+            dict: Ground ranges in kilometers per threshold
+        """
+        yield_kt = np.maximum(np.asarray(energy_joules, dtype=float) / self.JOULES_PER_KILOTON, 1e-12)
+        height = np.asarray(burst_altitude_m, dtype=float)
+        scale = yield_kt ** (1 / 3)
+        
+        radii = {}
+        for key, threshold in self.OVERPRESSURE_THRESHOLDS.items():
+            slant_m = self._overpressure_range_1kt(threshold) * scale
+            ground_m = np.sqrt(np.maximum(slant_m ** 2 - height ** 2, 0.0))
+            radii[key] = ground_m / 1000.0
+        return radii
+    
+    def _overpressure_range_1kt(self, pressure_pa):
+        """Invert p(r) = (px rx / 4r)(1 + 3 (rx/r)^1.3) for a 1 kt burst"""
+        px, rx = 75000.0, 290.0
+        lo, hi = 1.0, 1e6
+        for _ in range(60):
+            mid = math.sqrt(lo * hi)
+            p = px * rx / (4 * mid) * (1 + 3 * (rx / mid) ** 1.3)
+            if p > pressure_pa:
+                lo = mid
+            else:
+                hi = mid
+        return math.sqrt(lo * hi)
+    
+    def simulate(self, diameter_km, velocity_kmps, impact_angle=45, density=3000):
+        """
+        Atmospheric entry for a single body
+        
+        Returns:
+            dict: Entry outcome with plain Python values
+        """
+        batch = self.simulate_batch(diameter_km, velocity_kmps, impact_angle, density)
+        result = {}
+        for key, value in batch.items():
+            value = value.item()
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+            result[key] = value
+        return result
+
+
+# Singleton instance
+atmospheric_entry = AtmosphericEntry()
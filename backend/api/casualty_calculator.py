@@ -311,7 +311,8 @@ class CasualtyCalculator:
         }
     
     def calculate_casualties(self, impact_lat: float, impact_lon: float,
-                            blast_radius_km: float, energy_megatons: float) -> Dict:
+                            blast_radius_km: float, energy_megatons: float,
+                            location_info: Optional[Dict] = None) -> Dict:
         """
         Calculate estimated casualties from asteroid impact
         
@@ -320,12 +321,15 @@ class CasualtyCalculator:
             impact_lon: Impact longitude
             blast_radius_km: Total destruction radius in kilometers
             energy_megatons: Impact energy in megatons of TNT
+            location_info: Result of get_location_info_from_api for these
+                coordinates, if already known (skips the geocoding call)
         
         Returns:
             Dict with casualty estimates and location info
         """
         # Get location info using geocoding API
-        location_info = self.get_location_info_from_api(impact_lat, impact_lon)
+        if location_info is None:
+            location_info = self.get_location_info_from_api(impact_lat, impact_lon)
         
         # If water impact, return 0 casualties
         if location_info['is_water']:
@@ -0,0 +1,491 @@
+"""
+Array-backed NEO Catalog
+Column-oriented storage of parsed asteroids (one numpy array per field plus a
+shared string table) and the ?format=columnar binary encoding built from it
+
+Columnar layout (all integers little-endian):
+    b'NEOC' | uint32 version | uint32 header length | header JSON | pad to 8
+    followed by the data section; every buffer starts on an 8-byte boundary
+    at header offset (relative to the start of the data section).
+    
+    header = {
+        "count": rows,
+        "columns": [{"name", "dtype", "kind", "offset", "nbytes"}, ...],
+        "strings": {"offsets": {...}, "data": {...}}
+    }
+    
+    kind "float"/"bool" columns are plain arrays of their numpy dtype
+    ("<f8", "<f4", "|b1"); kind "string" columns are "<i4" indices into the
+    string table (-1 = null). String i is
+    data[offsets[i]:offsets[i + 1]].decode('utf-8').
+
+Benchmark (manage.py benchmark_catalog_formats, 5000 asteroids):
+    format        size     gzip     encode    decode
+    JSON          5.9 MB   1.24 MB  76 ms     48 ms
+    columnar      1.5 MB   0.84 MB  0.2 ms    0.1 ms
+    columnar f32  1.1 MB   0.46 MB  0.3 ms    0.1 ms
+    (building the catalog from parsed dicts once costs ~77 ms)
+"""
+import json
+import struct
+
+import numpy as np
+
+
+MAGIC = b'NEOC'
+VERSION = 1
+ALIGNMENT = 8
+
+
+def _float_or_nan(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class StringTable:
+    """Read-only string list backed by (offsets, utf-8 data) arrays, decoded on access"""
+    
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+        self._cache = {}
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, index):
+        value = self._cache.get(index)
+        if value is None:
+            start, stop = self.offsets[index], self.offsets[index + 1]
+            value = self.data[start:stop].tobytes().decode('utf-8')
+            self._cache[index] = value
+        return value
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class NEOCatalog:
+    """Parsed asteroids stored as one array per field"""
+    
+    # (column name, kind); dotted names live under 'orbital_data'
+    FIELDS = (
+        ('id', 'string'),
+        ('name', 'string'),
+        ('nasa_jpl_url', 'string'),
+        ('absolute_magnitude', 'float'),
+        ('is_potentially_hazardous', 'bool'),
+        ('diameter_km', 'float'),
+        ('diameter_min_km', 'float'),
+        ('diameter_max_km', 'float'),
+        ('diameter_meters', 'float'),
+        ('velocity_kmps', 'float'),
+        ('velocity_kmph', 'float'),
+        ('velocity_mph', 'float'),
+        ('miss_distance_km', 'float'),
+        ('miss_distance_lunar', 'float'),
+        ('miss_distance_au', 'float'),
+        ('close_approach_date', 'string'),
+        ('close_approach_date_full', 'string'),
+        ('orbiting_body', 'string'),
+        ('orbital_data.orbit_id', 'string'),
+        ('orbital_data.orbit_determination_date', 'string'),
+        ('orbital_data.orbit_uncertainty', 'string'),
+        ('orbital_data.semi_major_axis', 'float'),
+        ('orbital_data.eccentricity', 'float'),
+        ('orbital_data.inclination', 'float'),
+        ('orbital_data.ascending_node_longitude', 'float'),
+        ('orbital_data.orbital_period', 'float'),
+        ('orbital_data.perihelion_distance', 'float'),
+        ('orbital_data.aphelion_distance', 'float'),
+        ('orbital_data.perihelion_argument', 'float'),
+        ('orbital_data.mean_anomaly', 'float'),
+    )
+    KINDS = dict(FIELDS)
+    
+    def __init__(self, columns, strings):
+        """
+        Args:
+            columns: Field name -> numpy array (string fields hold int32 indices)
+            strings: Distinct strings the indices refer to (list or StringTable)
+        """
+        self.columns = columns
+        self.strings = strings
+        # Columns present (all of FIELDS unless built from a projection)
+        self.fields = tuple((name, kind) for name, kind in self.FIELDS if name in columns)
+        self._string_arrays = None
+    
+    def __len__(self):
+        return len(self.columns[self.fields[0][0]]) if self.fields else 0
+    
+    @classmethod
+    def from_records(cls, records, fields=None):
+        """
+        Build a catalog from parsed asteroids (NEORecord objects or their to_dict() form)
+        
+        Args:
+            records: Iterable of parsed asteroids
+            fields: Optional NEORecord.parse_fields projection; 'orbital_data'
+                    selects all orbital_data.* columns
+        
+        Returns:
+            NEOCatalog
+        """
+        records = list(records)
+        selected = cls.FIELDS
+        if fields is not None:
+            selected = tuple(
+                (name, kind) for name, kind in cls.FIELDS
+                if name.split('.', 1)[0] in fields
+            )
+        if any(name.startswith('orbital_data.') for name, _ in selected):
+            orbitals = [record.get('orbital_data') or {} for record in records]
+        strings, string_index = [], {}
+        columns = {}
+        
+        for name, kind in selected:
+            if name.startswith('orbital_data.'):
+                key = name.split('.', 1)[1]
+                values = [orbital.get(key) for orbital in orbitals]
+            else:
+                values = [record.get(name) for record in records]
+            if kind == 'float':
+                columns[name] = np.array([_float_or_nan(v) for v in values], dtype='<f8')
+            elif kind == 'bool':
+                columns[name] = np.array([bool(v) for v in values], dtype='|b1')
+            else:
+                indices = np.empty(len(values), dtype='<i4')
+                for i, value in enumerate(values):
+                    if value is None:
+                        indices[i] = -1
+                        continue
+                    value = str(value)
+                    if value not in string_index:
+                        string_index[value] = len(strings)
+                        strings.append(value)
+                    indices[i] = string_index[value]
+                columns[name] = indices
+        
+        return cls(columns, strings)
+    
+    def select(self, rows=None, fields=None):
+        """
+        Catalog of some rows and/or fields sharing this one's string table
+        
+        Without rows the column arrays themselves are shared (no copy).
+        
+        Args:
+            rows: Row numbers to keep, in order (None = all rows)
+            fields: Optional NEORecord.parse_fields projection
+        """
+        columns = {
+            name: self.columns[name] if rows is None else self.columns[name][rows]
+            for name, _ in self.fields
+            if fields is None or name.split('.', 1)[0] in fields
+        }
+        catalog = type(self)(columns, self.strings)
+        catalog._string_arrays = self._string_table_arrays()
+        return catalog
+    
+    def value(self, name, row):
+        """Python value of one cell (None for nulls / NaN)"""
+        kind = self.KINDS[name]
+        cell = self.columns[name][row]
+        if kind == 'string':
+            return self.strings[cell] if cell >= 0 else None
+        if kind == 'bool':
+            return bool(cell)
+        return None if np.isnan(cell) else float(cell)
+    
+    def to_records(self):
+        """Rebuild the parsed-asteroid dicts (orbital elements as strings, like NASA sends them)"""
+        return [self.record(row) for row in range(len(self))]
+    
+    def record(self, row, fields=None):
+        """
+        One parsed-asteroid dict
+        
+        Args:
+            row: Row number
+            fields: Optional NEORecord.parse_fields projection
+        """
+        record = {}
+        orbital = {}
+        for name, kind in self.fields:
+            if fields is not None and name.split('.', 1)[0] not in fields:
+                continue
+            value = self.value(name, row)
+            if name.startswith('orbital_data.'):
+                if kind == 'float' and value is not None:
+                    value = repr(value)
+                orbital[name.split('.', 1)[1]] = value
+            else:
+                record[name] = value
+        if orbital:
+            record['orbital_data'] = orbital
+        return record
+    
+    # Columnar encoding -------------------------------------------------------
+    
+    def to_columnar_chunks(self, float_dtype='<f8'):
+        """
+        Yield the columnar encoding as a header followed by the raw column buffers
+        
+        Column arrays are passed as memoryviews of the catalog's own storage
+        (no per-value encoding or copying); only float32 output needs a cast.
+        
+        Args:
+            float_dtype: '<f8' or '<f4' for float columns
+        """
+        buffers = []
+        descriptors = []
+        offset = 0
+        
+        def add(array):
+            nonlocal offset
+            array = np.ascontiguousarray(array)
+            start = offset
+            buffers.append(array)
+            offset += array.nbytes
+            padding = -offset % ALIGNMENT
+            if padding:
+                buffers.append(b'\0' * padding)
+                offset += padding
+            return {'dtype': array.dtype.str, 'offset': start, 'nbytes': array.nbytes}
+        
+        for name, kind in self.fields:
+            array = self.columns[name]
+            if kind == 'float' and array.dtype.str != float_dtype:
+                array = array.astype(float_dtype)
+            descriptors.append(dict(add(array), name=name, kind=kind))
+        
+        string_offsets, string_data = self._string_table_arrays()
+        strings = {
+            'offsets': add(string_offsets),
+            'data': add(string_data)
+        }
+        
+        header = json.dumps({
+            'count': len(self),
+            'columns': descriptors,
+            'strings': strings
+        }).encode('utf-8')
+        prefix = MAGIC + struct.pack('<II', VERSION, len(header)) + header
+        yield prefix + b'\0' * (-len(prefix) % ALIGNMENT)
+        
+        for buffer in buffers:
+            yield memoryview(buffer).cast('B') if isinstance(buffer, np.ndarray) else buffer
+    
+    def _string_table_arrays(self):
+        """(offsets, data) arrays of the string table, built once per catalog"""
+        if self._string_arrays is None:
+            if isinstance(self.strings, StringTable):
+                self._string_arrays = (self.strings.offsets, self.strings.data)
+            else:
+                encoded = [value.encode('utf-8') for value in self.strings]
+                offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+                np.cumsum([len(value) for value in encoded], out=offsets[1:])
+                data = np.frombuffer(b''.join(encoded), dtype='|u1')
+                self._string_arrays = (offsets, data)
+        return self._string_arrays
+    
+    def to_columnar_bytes(self, float_dtype='<f8'):
+        return b''.join(self.to_columnar_chunks(float_dtype))
+    
+    @classmethod
+    def from_columnar(cls, buffer):
+        """
+        Decode a columnar buffer; columns are numpy views into it (zero-copy)
+        
+        Args:
+            buffer: bytes, memoryview or mmap holding the encoding
+        
+        Returns:
+            NEOCatalog
+        """
+        view = memoryview(buffer)
+        if bytes(view[:4]) != MAGIC:
+            raise ValueError('Not a columnar NEO catalog')
+        version, header_length = struct.unpack('<II', view[4:12])
+        if version != VERSION:
+            raise ValueError(f'Unsupported columnar version {version}')
+        
+        header = json.loads(bytes(view[12:12 + header_length]))
+        data_start = 12 + header_length
+        data_start += -data_start % ALIGNMENT
+        
+        def array(descriptor):
+            start = data_start + descriptor['offset']
+            dtype = np.dtype(descriptor['dtype'])
+            count = descriptor['nbytes'] // dtype.itemsize
+            return np.frombuffer(view, dtype=dtype, count=count, offset=start)
+        
+        columns = {descriptor['name']: array(descriptor) for descriptor in header['columns']}
+        
+        strings = StringTable(array(header['strings']['offsets']), array(header['strings']['data']))
+        
+        return cls(columns, strings)
+
+
+class CatalogIndex:
+    """
+    Range index over an NEOCatalog
+    
+    Each queryable column gets a stable argsort (built on first use) so a
+    range predicate is two searchsorted calls. A query starts from the most
+    selective predicate's rows and checks the remaining predicates against
+    those rows only, so cost follows the smallest match set rather than the
+    catalog size.
+    """
+    
+    # Approach dates are indexed as days since 1970-01-01
+    DATE_COLUMNS = ('close_approach_date',)
+    
+    def __init__(self, catalog, derived=None):
+        """
+        Args:
+            catalog: NEOCatalog to index
+            derived: Optional {name: float array} of extra per-row values
+                     (e.g. impact energy) queryable like catalog columns
+        """
+        self.catalog = catalog
+        self.derived = dict(derived or {})
+        self._values = {}
+        self._sorted = {}
+    
+    @property
+    def columns(self):
+        """Names usable in range predicates and sorts"""
+        return tuple(
+            name for name, kind in self.catalog.fields
+            if kind == 'float' or name in self.DATE_COLUMNS
+        ) + tuple(self.derived)
+    
+    def values(self, name):
+        """Numeric values of a column (NaN where missing)"""
+        if name not in self._values:
+            if name in self.derived:
+                self._values[name] = self.derived[name]
+            elif name in self.DATE_COLUMNS:
+                self._values[name] = self._date_values(name)
+            elif self.catalog.KINDS.get(name) == 'float' and name in self.catalog.columns:
+                self._values[name] = self.catalog.columns[name]
+            else:
+                raise ValueError(f'Cannot query on {name}')
+        return self._values[name]
+    
+    @staticmethod
+    def day_number(date):
+        """Days since 1970-01-01 for a YYYY-MM-DD string (ValueError if malformed)"""
+        return float(np.datetime64(date, 'D').astype('int64'))
+    
+    def _date_values(self, name):
+        # Parse each distinct date string once
+        indices = self.catalog.columns[name]
+        unique = np.unique(indices)
+        days = np.full(len(unique), np.nan)
+        for i, index in enumerate(unique):
+            if index >= 0:
+                try:
+                    days[i] = self.day_number(self.catalog.strings[index])
+                except ValueError:
+                    pass
+        return days[np.searchsorted(unique, indices)]
+    
+    def _sorted_column(self, name):
+        if name not in self._sorted:
+            values = self.values(name)
+            order = np.argsort(values, kind='stable').astype('<i4')  # NaN sorts last
+            self._sorted[name] = (order, values[order])
+        return self._sorted[name]
+    
+    def to_arrays(self):
+        """
+        Every array the index uses, built now, keyed 'kind:column'
+        
+        'derived', 'values' (date day numbers), 'order' (argsort) and
+        'sorted' (values in that order); from_arrays() takes them back.
+        """
+        arrays = {f'derived:{name}': values for name, values in self.derived.items()}
+        for name in self.columns:
+            order, ordered = self._sorted_column(name)
+            arrays[f'order:{name}'] = order
+            arrays[f'sorted:{name}'] = ordered
+            if name in self.DATE_COLUMNS:
+                arrays[f'values:{name}'] = self.values(name)
+        return arrays
+    
+    @classmethod
+    def from_arrays(cls, catalog, arrays):
+        """Index over catalog with nothing left to build (arrays from to_arrays(), e.g. memory-mapped)"""
+        parts = {}
+        for key, array in arrays.items():
+            kind, name = key.split(':', 1)
+            parts.setdefault(kind, {})[name] = array
+        index = cls(catalog, derived=parts.get('derived'))
+        index._values.update(parts.get('values', {}))
+        for name, order in parts.get('order', {}).items():
+            index._sorted[name] = (order, parts['sorted'][name])
+        return index
+    
+    def range_rows(self, name, low=None, high=None):
+        """Rows with low <= value <= high (either bound optional), in value order"""
+        order, ordered = self._sorted_column(name)
+        start = 0 if low is None else np.searchsorted(ordered, low, side='left')
+        stop = np.searchsorted(ordered, np.inf if high is None else high, side='right')
+        return order[start:stop]
+    
+    def query(self, ranges=None, equals=None, sort=None, descending=False, offset=0, limit=100):
+        """
+        Multi-predicate range query
+        
+        Args:
+            ranges: {column: (low, high)} inclusive bounds, None = open
+            equals: {column: value} exact matches on bool columns
+            sort: Column to order by (None = catalog order); NaN rows come last
+            descending: Reverse the sort
+            offset, limit: Window of the sorted matches
+        
+        Returns:
+            tuple: (total matches, row numbers of the window)
+        
+        Raises:
+            ValueError: Unknown column
+        """
+        ranges = ranges or {}
+        equals = equals or {}
+        
+        for name in equals:
+            if self.catalog.KINDS.get(name) != 'bool' or name not in self.catalog.columns:
+                raise ValueError(f'Cannot match on {name}')
+        
+        if ranges:
+            # Most selective predicate first: its rows come straight from the index
+            candidates = {name: self.range_rows(name, *bounds) for name, bounds in ranges.items()}
+            first = min(candidates, key=lambda name: len(candidates[name]))
+            rows = np.sort(candidates[first])
+            for name, (low, high) in ranges.items():
+                if name == first:
+                    continue
+                values = self.values(name)[rows]
+                keep = ~np.isnan(values)
+                if low is not None:
+                    keep &= values >= low
+                if high is not None:
+                    keep &= values <= high
+                rows = rows[keep]
+        else:
+            rows = np.arange(len(self.catalog))
+        
+        for name, value in equals.items():
+            rows = rows[self.catalog.columns[name][rows] == bool(value)]
+        
+        total = len(rows)
+        if sort is not None:
+            values = self.values(sort)[rows]
+            order = np.argsort(-values if descending else values, kind='stable')
+            rows = rows[order]
+        
+        return total, rows[offset:offset + limit]
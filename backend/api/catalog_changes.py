@@ -0,0 +1,134 @@
+"""
+Catalog Change Feed
+Versioned record of which asteroids each sync added, updated or removed,
+backing /api/asteroids/changes?since=<version>
+"""
+from django.db import transaction
+
+from .models import CatalogChange, CatalogEntry, CatalogVersion
+
+
+class ChangeLog:
+    """Diffs each synced catalog against the stored state and records a new version"""
+    
+    # Entry field -> catalog column compared between syncs
+    TRACKED_FIELDS = (
+        ('orbit_id', 'orbital_data.orbit_id'),
+        ('close_approach_date', 'close_approach_date'),
+        ('is_potentially_hazardous', 'is_potentially_hazardous'),
+    )
+    
+    # Primary key of the CatalogVersion counter row
+    COUNTER_ID = 1
+    
+    def current_version(self):
+        return CatalogVersion.objects.filter(pk=self.COUNTER_ID).values_list('version', flat=True).first() or 0
+    
+    def record(self, catalog, complete=True):
+        """
+        Store the differences between the last recorded catalog and this one
+        
+        Nothing is written when nothing changed, so the version only moves
+        when there is something to fetch. Syncs that stopped early
+        (complete=False) cannot tell a removed asteroid from an unvisited
+        page, so they record additions and updates only. The version counter
+        row is locked (select_for_update) before the stored state is read,
+        so concurrent syncs from other processes diff and write one after
+        the other, each under its own version.
+        
+        Args:
+            catalog: NEOCatalog after a sync
+            complete: Whether the sync covered the whole catalog
+        
+        Returns:
+            dict: version, added, updated, removed
+        """
+        names = [name for name, _ in self.TRACKED_FIELDS]
+        current = {}
+        for row in range(len(catalog)):
+            current[catalog.value('id', row)] = tuple(
+                self._normalise(name, catalog.value(column, row))
+                for name, column in self.TRACKED_FIELDS
+            )
+        
+        with transaction.atomic():
+            counter, _ = CatalogVersion.objects.select_for_update().get_or_create(pk=self.COUNTER_ID)
+            previous = {
+                values[0]: tuple(values[1:])
+                for values in CatalogEntry.objects.values_list('asteroid_id', *names)
+            }
+            version = counter.version + 1
+            
+            changes, created, updated = [], [], []
+            for asteroid_id, state in current.items():
+                old = previous.get(asteroid_id)
+                if old == state:
+                    continue
+                entry = CatalogEntry(asteroid_id=asteroid_id, version=version, **dict(zip(names, state)))
+                if old is None:
+                    created.append(entry)
+                    fields = {name: [None, new] for name, new in zip(names, state)}
+                    changes.append(CatalogChange(
+                        version=version, asteroid_id=asteroid_id,
+                        change=CatalogChange.ADDED, fields=fields
+                    ))
+                else:
+                    updated.append(entry)
+                    fields = {
+                        name: [before, after]
+                        for name, before, after in zip(names, old, state) if before != after
+                    }
+                    changes.append(CatalogChange(
+                        version=version, asteroid_id=asteroid_id,
+                        change=CatalogChange.UPDATED, fields=fields
+                    ))
+            
+            removed = [i for i in previous if i not in current] if complete else []
+            for asteroid_id in removed:
+                changes.append(CatalogChange(
+                    version=version, asteroid_id=asteroid_id, change=CatalogChange.REMOVED,
+                    fields={name: [before, None] for name, before in zip(names, previous[asteroid_id])}
+                ))
+            
+            if not changes:
+                return {'version': version - 1, 'added': 0, 'updated': 0, 'removed': 0}
+            
+            counter.version = version
+            counter.save(update_fields=['version'])
+            CatalogChange.objects.bulk_create(changes, batch_size=1000)
+            CatalogEntry.objects.bulk_create(created, batch_size=1000)
+            CatalogEntry.objects.bulk_update(updated, names + ['version'], batch_size=1000)
+            for start in range(0, len(removed), 500):
+                CatalogEntry.objects.filter(asteroid_id__in=removed[start:start + 500]).delete()
+        
+        return {
+            'version': version,
+            'added': len(created),
+            'updated': len(updated),
+            'removed': len(removed)
+        }
+    
+    @staticmethod
+    def _normalise(name, value):
+        # Stored as non-null CharFields / BooleanField
+        if name == 'is_potentially_hazardous':
+            return bool(value)
+        return value or ''
+    
+    def changes_since(self, since, after_id=None, limit=1000):
+        """
+        Changes recorded after a version, oldest first
+        
+        Args:
+            since: Version the client already has (0 = everything)
+            after_id: Last change id of the previous page of the same request
+            limit: Maximum changes returned
+        
+        Returns:
+            tuple: (list of CatalogChange, more pages remaining)
+        """
+        changes = CatalogChange.objects.filter(version__gt=since).order_by('id')
+        if after_id is not None:
+            changes = changes.filter(id__gt=after_id)
+        page = list(changes[:limit + 1])
+        return page[:limit], len(page) > limit
@@ -0,0 +1,143 @@
+"""
+Catalog Snapshot Files
+The local catalog, its range index arrays and derived physics saved in one
+file that a fresh process memory-maps instead of walking /neo/browse again
+
+Layout (all integers little-endian):
+    b'NEOS' | uint32 version | uint32 header length | header JSON | pad to 8
+    followed by the data section; every buffer starts on an 8-byte boundary
+    at header offset (relative to the start of the data section).
+    
+    header = {
+        "created_at": unix time,
+        "metadata": {...},  # e.g. synced_at, last sync summary, statistics
+        "arrays": [{"name", "dtype", "offset", "nbytes"}, ...],  # CatalogIndex.to_arrays()
+        "catalog": {"offset", "nbytes"}  # NEOCatalog columnar encoding
+    }
+
+Loading parses only the header: columns, string table and index arrays are
+numpy views into the read-only mapping, so the file's pages are shared with
+every other process that maps it.
+"""
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from .catalog import ALIGNMENT, CatalogIndex, NEOCatalog
+
+
+MAGIC = b'NEOS'
+VERSION = 1
+
+
+def save_snapshot(path, index, metadata=None):
+    """
+    Write index (catalog included) to path
+    
+    The file is written next to path and renamed over it, so readers see
+    either the old snapshot or the new one, never a partial file.
+    
+    Args:
+        path: Destination file
+        index: CatalogIndex to save (its arrays are built if needed)
+        metadata: JSON-serialisable dict stored in the header
+    
+    Returns:
+        int: Bytes written
+    """
+    chunks = []
+    descriptors = []
+    offset = 0
+    
+    def add(buffer, nbytes):
+        nonlocal offset
+        start = offset
+        chunks.append(buffer)
+        offset += nbytes
+        padding = -offset % ALIGNMENT
+        if padding:
+            chunks.append(b'\0' * padding)
+            offset += padding
+        return start
+    
+    for name, array in index.to_arrays().items():
+        array = np.ascontiguousarray(array)
+        start = add(memoryview(array).cast('B'), array.nbytes)
+        descriptors.append({'name': name, 'dtype': array.dtype.str, 'offset': start, 'nbytes': array.nbytes})
+    
+    # Catalog column buffers are written as they are, not joined into one copy
+    catalog_offset = offset
+    for chunk in index.catalog.to_columnar_chunks():
+        chunks.append(chunk)
+        offset += len(chunk)
+    catalog_nbytes = offset - catalog_offset
+    
+    header = json.dumps({
+        'created_at': time.time(),
+        'metadata': metadata or {},
+        'arrays': descriptors,
+        'catalog': {'offset': catalog_offset, 'nbytes': catalog_nbytes}
+    }).encode('utf-8')
+    prefix = MAGIC + struct.pack('<II', VERSION, len(header)) + header
+    prefix += b'\0' * (-len(prefix) % ALIGNMENT)
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix='.catalog-', suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as handle:
+            handle.write(prefix)
+            for chunk in chunks:
+                handle.write(chunk)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return len(prefix) + offset
+
+
+def load_snapshot(path):
+    """
+    Memory-map a snapshot file
+    
+    Args:
+        path: Snapshot written by save_snapshot()
+    
+    Returns:
+        tuple: (CatalogIndex over the mapped file, header dict)
+    
+    Raises:
+        OSError: File missing or unreadable
+        ValueError: Not a snapshot, or an unsupported version
+    """
+    with open(path, 'rb') as handle:
+        mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapping)
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError(f'{path} is not a catalog snapshot')
+    version, header_length = struct.unpack('<II', view[4:12])
+    if version != VERSION:
+        raise ValueError(f'Unsupported snapshot version {version}')
+    
+    header = json.loads(bytes(view[12:12 + header_length]))
+    data_start = 12 + header_length
+    data_start += -data_start % ALIGNMENT
+    
+    arrays = {}
+    for descriptor in header['arrays']:
+        dtype = np.dtype(descriptor['dtype'])
+        arrays[descriptor['name']] = np.frombuffer(
+            view, dtype=dtype, count=descriptor['nbytes'] // dtype.itemsize,
+            offset=data_start + descriptor['offset']
+        )
+    
+    start = data_start + header['catalog']['offset']
+    catalog = NEOCatalog.from_columnar(view[start:start + header['catalog']['nbytes']])
+    return CatalogIndex.from_arrays(catalog, arrays), header
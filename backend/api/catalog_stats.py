@@ -0,0 +1,227 @@
+"""
+Catalog Statistics
+Materialized aggregates over the local catalog (counts by size class,
+hazard flag and approach month, energy histogram, quantile sketches),
+updated by per-asteroid deltas on each sync
+"""
+import math
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch-style) that also supports removal
+    
+    Positive values fall in buckets growing by gamma = (1 + a) / (1 - a),
+    so any quantile is reported within relative accuracy a. Zero and
+    negative values are counted in a separate bucket reported as 0.
+    """
+    
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = Counter()
+        self.zeros = 0
+        self.count = 0
+    
+    def add(self, value, weight=1):
+        """Add (weight 1) or remove (weight -1) a value"""
+        self.count += weight
+        if value <= 0:
+            self.zeros += weight
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] += weight
+        if not self.buckets[key]:
+            del self.buckets[key]
+    
+    def quantile(self, q):
+        """Value at quantile q (0-1), or None when empty"""
+        if self.count <= 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class CatalogStats:
+    """Aggregates kept in step with the catalog store"""
+    
+    # NEO size classes by diameter (m)
+    SIZE_CLASSES = (
+        (25, 'under_25m'),
+        (140, '25m_to_140m'),
+        (1000, '140m_to_1km'),
+        (math.inf, 'over_1km'),
+    )
+    SKETCHED = ('diameter_km', 'velocity_kmps', 'miss_distance_lunar', 'energy_megatons_tnt')
+    QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+    RELATIVE_ACCURACY = 0.01
+    
+    def __init__(self, engine):
+        """
+        Args:
+            engine: ImpactPhysics used for the impact energies
+        """
+        self.engine = engine
+        self._entries = {}
+        self._lock = threading.Lock()
+        
+        self.total = 0
+        self.hazardous = 0
+        self.by_size = Counter()
+        self.by_size_hazardous = Counter()
+        self.by_month = Counter()
+        self.energy_decades = Counter()
+        self.energy_total = 0.0
+        self.sketches = {name: QuantileSketch(self.RELATIVE_ACCURACY) for name in self.SKETCHED}
+        self.updated_at = None
+        self._snapshot = self._build_snapshot()
+    
+    def update(self, catalog):
+        """
+        Apply the differences between the previous catalog and this one
+        
+        Only asteroids that were added, removed or changed touch the aggregates.
+        
+        Args:
+            catalog: NEOCatalog after a sync
+        
+        Returns:
+            dict: Counts of added, removed and changed asteroids
+        """
+        entries = self._catalog_entries(catalog)
+        added = removed = changed = 0
+        with self._lock:
+            for asteroid_id, entry in self._entries.items():
+                if asteroid_id not in entries:
+                    self._apply(entry, -1)
+                    removed += 1
+            for asteroid_id, entry in entries.items():
+                previous = self._entries.get(asteroid_id)
+                if previous == entry:
+                    continue
+                if previous is None:
+                    added += 1
+                else:
+                    self._apply(previous, -1)
+                    changed += 1
+                self._apply(entry, 1)
+            
+            self._entries = entries
+            self.updated_at = time.time()
+            self._snapshot = self._build_snapshot()
+        
+        return {'added': added, 'removed': removed, 'changed': changed}
+    
+    def _catalog_entries(self, catalog):
+        """asteroid id -> (hazardous, size class, month, *sketched values) with None for missing"""
+        columns = catalog.columns
+        diameter = columns['diameter_km']
+        velocity = columns['velocity_kmps']
+        energy = self.engine.calculate_impact_energy(
+            self.engine.calculate_mass(diameter), velocity
+        )['energy_megatons_tnt']
+        size_class = np.searchsorted(
+            [bound for bound, _ in self.SIZE_CLASSES], diameter * 1000, side='right'
+        )
+        
+        def number(value):
+            return None if np.isnan(value) else float(value)
+        
+        entries = {}
+        for row in range(len(catalog)):
+            date = catalog.value('close_approach_date', row)
+            entries[catalog.value('id', row)] = (
+                bool(columns['is_potentially_hazardous'][row]),
+                self.SIZE_CLASSES[size_class[row]][1] if not np.isnan(diameter[row]) else None,
+                date[:7] if date else None,
+                number(diameter[row]),
+                number(velocity[row]),
+                number(columns['miss_distance_lunar'][row]),
+                number(energy[row])
+            )
+        return entries
+    
+    def _apply(self, entry, weight):
+        hazardous, size_class, month, *values = entry
+        self.total += weight
+        self.hazardous += weight * hazardous
+        for counter, key in (
+            (self.by_size, size_class),
+            (self.by_size_hazardous, size_class if hazardous else None),
+            (self.by_month, month),
+        ):
+            if key is not None:
+                counter[key] += weight
+                if not counter[key]:
+                    del counter[key]
+        
+        for name, value in zip(self.SKETCHED, values):
+            if value is not None:
+                self.sketches[name].add(value, weight)
+        
+        energy = values[-1]
+        if energy is not None:
+            self.energy_total += weight * energy
+            if energy > 0:
+                decade = math.floor(math.log10(energy))
+                self.energy_decades[decade] += weight
+                if not self.energy_decades[decade]:
+                    del self.energy_decades[decade]
+    
+    def _build_snapshot(self):
+        return {
+            'count': self.total,
+            'hazardous': self.hazardous,
+            'by_size_class': {
+                label: {
+                    'count': self.by_size.get(label, 0),
+                    'hazardous': self.by_size_hazardous.get(label, 0)
+                }
+                for _, label in self.SIZE_CLASSES
+            },
+            'by_approach_month': dict(sorted(self.by_month.items())),
+            'energy': {
+                'total_megatons_tnt': self.energy_total,
+                # Count of asteroids per decade: key k covers [10^k, 10^(k+1)) megatons
+                'histogram_log10_megatons': {
+                    str(decade): count for decade, count in sorted(self.energy_decades.items())
+                }
+            },
+            'quantiles': {
+                name: {
+                    f'p{round(q * 100)}': sketch.quantile(q) for q in self.QUANTILES
+                }
+                for name, sketch in self.sketches.items()
+            },
+            'relative_accuracy': self.RELATIVE_ACCURACY,
+            'updated_at': self.updated_at
+        }
+    
+    def restore(self, snapshot):
+        """
+        Serve a saved snapshot() (e.g. from a catalog snapshot file) until the next update
+        
+        Only used before any update: the counters stay empty, so the next
+        update() counts every asteroid as added and rebuilds the aggregates.
+        """
+        with self._lock:
+            if snapshot and not self._entries:
+                self._snapshot = snapshot
+    
+    def snapshot(self):
+        """Aggregates as of the last sync (prebuilt, so serving is constant time)"""
+        return self._snapshot
+
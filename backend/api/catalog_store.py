@@ -0,0 +1,341 @@
+"""
+Local NEO Catalog
+Process-wide copy of the /neo/browse catalog as an NEOCatalog with its
+range index, name index, aggregate statistics and versioned change log,
+used by /api/asteroids/query, /search, /stats and /changes. With a snapshot
+path set, every sync is saved to a catalog snapshot file and a new process
+starts from that file instead of NASA.
+"""
+import contextlib
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process refresh lock
+    fcntl = None
+
+from .catalog import CatalogIndex, NEOCatalog
+from .catalog_changes import ChangeLog
+from .catalog_snapshot import load_snapshot, save_snapshot
+from .catalog_stats import CatalogStats
+from .nasa_api import nasa_api
+from .name_index import NameIndex
+from .physics import physics_engine
+
+
+class CatalogStore:
+    """Holds the current catalog, its indexes and statistics, and refreshes them from NASA"""
+    
+    def __init__(self, client, max_pages=100, ttl_seconds=6 * 60 * 60, snapshot_path=None,
+                 snapshot_check_seconds=30):
+        """
+        Args:
+            client: NASANeoAPI used for the browse walk
+            max_pages: Browse pages per sync (0 = the whole catalog)
+            ttl_seconds: Age after which get() starts a background refresh
+            snapshot_path: Catalog snapshot file written after each sync and
+                           reloaded when another process replaces it (None = off)
+            snapshot_check_seconds: Minimum interval between checks of the snapshot
+                                    file, and between attempts after a failed sync
+        """
+        self.client = client
+        self.max_pages = max_pages
+        self.ttl_seconds = ttl_seconds
+        self.snapshot_path = snapshot_path
+        self.index = None
+        self.names = NameIndex()
+        self.stats = CatalogStats(physics_engine)
+        self.changes = ChangeLog()
+        self.synced_at = None
+        self.last_sync = None
+        self.snapshot_check_seconds = snapshot_check_seconds
+        self.snapshot_version = None
+        self._sync_lock = threading.Lock()
+        self._state_lock = threading.Lock()  # Guards _refreshing and the check/retry times
+        self._refreshing = False
+        self._snapshot_file = None
+        self._next_snapshot_check = 0
+        self._next_refresh = 0
+        self._threads = []
+    
+    def get(self, block=False):
+        """
+        The current CatalogIndex
+        
+        Nothing loaded yet and a stale catalog are both handled by one
+        background sync: a cold process returns None (views answer 503) until
+        it is done, a stale catalog is returned as is. With a snapshot path,
+        a newer snapshot written by another process (worker, job or
+        import_catalog) is mapped and swapped in; requests already holding
+        the previous index keep using it.
+        
+        Args:
+            block: Sync in this thread if nothing is loaded (jobs and commands)
+        
+        Returns:
+            CatalogIndex or None if not loaded (yet)
+        """
+        now = time.monotonic()
+        with self._state_lock:
+            check_snapshot = self.snapshot_path and now >= self._next_snapshot_check
+            if check_snapshot:
+                self._next_snapshot_check = now + self.snapshot_check_seconds
+        if check_snapshot:
+            self._reload_if_changed()
+        
+        if self.index is None and block:
+            self.sync()
+            return self.index
+        
+        with self._state_lock:
+            if (not self._refreshing and now >= self._next_refresh
+                    and (self.index is None or time.time() - self.synced_at > self.ttl_seconds)):
+                self._refreshing = True
+                self._start(self._background_sync)
+        return self.index
+    
+    @property
+    def loading(self):
+        """True while a background sync is running"""
+        return self._refreshing
+    
+    def _start(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+        thread.start()
+    
+    def join_background(self, timeout=None):
+        """Wait for background refreshes and name-index builds (threads do not survive fork)"""
+        for thread in list(self._threads):
+            thread.join(timeout)
+    
+    def _background_sync(self):
+        try:
+            with _snapshot_sync_lock(self.snapshot_path) as acquired:
+                # Another process may be syncing, or have just written a fresh snapshot
+                if acquired:
+                    self._reload_if_changed()
+                    if self.index is None or time.time() - self.synced_at > self.ttl_seconds:
+                        result = self.sync()
+                        if 'error' in result:
+                            self._retry_later()
+                else:
+                    self._retry_later()
+        finally:
+            with self._state_lock:
+                self._refreshing = False
+            close_old_connections()
+    
+    def _retry_later(self):
+        with self._state_lock:
+            self._next_refresh = time.monotonic() + self.snapshot_check_seconds
+    
+    def _reload_if_changed(self):
+        """Map the snapshot file if it was replaced since it was last read"""
+        if not self.snapshot_path:
+            return
+        try:
+            stat = os.stat(self.snapshot_path)
+        except OSError:
+            return
+        if (stat.st_ino, stat.st_mtime_ns) != self._snapshot_file:
+            try:
+                self.load_snapshot(self.snapshot_path)
+            except (OSError, ValueError):
+                pass
+    
+    def sync(self, max_pages=None, progress=None):
+        """
+        Walk /neo/browse (cached pages are reused) and swap in a new index
+        
+        Args:
+            max_pages: Override for self.max_pages (0 = whole catalog)
+            progress: Optional progress(fraction, message) callback
+        
+        Returns:
+            dict: Sync summary, or {'error': ...} if nothing could be fetched
+        """
+        max_pages = self.max_pages if max_pages is None else max_pages
+        started = time.perf_counter()
+        
+        with self._sync_lock:
+            records = []
+            cursor = None
+            pages = 0
+            complete = False
+            
+            while True:
+                result = self.client.browse(cursor=cursor)
+                if 'error' in result:
+                    if not records:
+                        self.last_sync = result
+                        return result
+                    break
+                records.extend(result['asteroids'])
+                pages += result['pages_scanned']
+                cursor = result['next_cursor']
+                
+                total = result['total_pages'] or 1
+                if progress is not None:
+                    progress(pages / (min(total, max_pages) if max_pages else total),
+                             f'{pages} of {total} pages')
+                
+                if cursor is None:
+                    complete = True
+                    break
+                if max_pages and pages >= max_pages:
+                    break
+                if result['pages_scanned'] == 0:
+                    break  # NASA quota reserve reached or page failing
+            
+            catalog = NEOCatalog.from_records(records)
+            names = self._update_names(catalog)
+            stats = self.stats.update(catalog)
+            changes = self.changes.record(catalog, complete=complete)
+            self.index = CatalogIndex(catalog, derived=self.derive_physics(catalog))
+            self.synced_at = time.time()
+            self.last_sync = {
+                'asteroids': len(catalog),
+                'pages': pages,
+                'complete': complete,
+                'names': names,
+                'stats': stats,
+                'changes': changes,
+                'seconds': round(time.perf_counter() - started, 3)
+            }
+            if self.snapshot_path:
+                try:
+                    self.last_sync['snapshot_bytes'] = self.save_snapshot(self.snapshot_path)
+                except OSError as e:
+                    self.last_sync['snapshot_error'] = str(e)
+            return self.last_sync
+    
+    def _update_names(self, catalog):
+        return self.names.update(
+            (catalog.value('id', row), catalog.value('name', row)) for row in range(len(catalog))
+        )
+    
+    @staticmethod
+    def derive_physics(catalog):
+        """Per-asteroid impact physics kept beside the catalog columns (queryable, saved in snapshots)"""
+        diameter = catalog.columns['diameter_km']
+        mass = physics_engine.calculate_mass(diameter)
+        energy = physics_engine.calculate_impact_energy(mass, catalog.columns['velocity_kmps'])
+        return {'mass_kg': mass, 'energy_megatons_tnt': energy['energy_megatons_tnt']}
+    
+    def save_snapshot(self, path):
+        """
+        Write the current catalog, index arrays and statistics to a snapshot file
+        
+        Returns:
+            int: Bytes written
+        """
+        if self.index is None:
+            raise ValueError('No catalog loaded')
+        changes = (self.last_sync or {}).get('changes') or {}
+        written = save_snapshot(path, self.index, {
+            'version': changes.get('version'),
+            'synced_at': self.synced_at,
+            'last_sync': self.last_sync,
+            'stats': self.stats.snapshot()
+        })
+        if path == self.snapshot_path:
+            # Our own write: nothing to reload
+            stat = os.stat(path)
+            self._snapshot_file = (stat.st_ino, stat.st_mtime_ns)
+            self.snapshot_version = changes.get('version')
+        return written
+    
+    def load_snapshot(self, path):
+        """
+        Serve the catalog from a snapshot file (memory-mapped, no NASA requests)
+        
+        The range index and statistics are usable at once; the name index is
+        updated in a background thread. Nothing is locked: the new index is
+        swapped in by assignment, and requests holding the previous one keep
+        its mapping, which stays valid after the file is replaced. A snapshot
+        older than ttl_seconds is refreshed by the next get() as usual.
+        
+        Raises:
+            OSError / ValueError: Missing or invalid file
+        
+        Returns:
+            dict: Load summary
+        """
+        started = time.perf_counter()
+        stat = os.stat(path)
+        index, header = load_snapshot(path)
+        metadata = header['metadata']
+        
+        stats = CatalogStats(physics_engine)
+        stats.restore(metadata.get('stats'))
+        self.stats = stats
+        self.index = index
+        self.synced_at = metadata.get('synced_at') or header['created_at']
+        self.snapshot_version = metadata.get('version')
+        self.last_sync = dict(
+            metadata.get('last_sync') or {},
+            snapshot=path,
+            loaded_seconds=round(time.perf_counter() - started, 3)
+        )
+        if path == self.snapshot_path:
+            self._snapshot_file = (stat.st_ino, stat.st_mtime_ns)
+        self._start(self._load_names, index.catalog)
+        return self.last_sync
+    
+    def _load_names(self, catalog):
+        if len(self.names):
+            self._update_names(catalog)  # Small diff: brief lock
+        else:
+            # Build aside and swap, so searches never wait for a full build
+            names = NameIndex()
+            names.update(
+                (catalog.value('id', row), catalog.value('name', row)) for row in range(len(catalog))
+            )
+            self.names = names
+    
+    def status(self):
+        return {
+            'loaded': self.index is not None,
+            'snapshot_path': self.snapshot_path,
+            'snapshot_version': self.snapshot_version,
+            'asteroids': len(self.index.catalog) if self.index is not None else 0,
+            'synced_at': self.synced_at,
+            'last_sync': self.last_sync
+        }
+
+
+@contextlib.contextmanager
+def _snapshot_sync_lock(snapshot_path):
+    """
+    Non-blocking lock shared by every process using snapshot_path, so only
+    one of them refreshes from NASA; yields whether it was acquired
+    """
+    if not snapshot_path or fcntl is None:
+        yield True
+        return
+    with open(f'{snapshot_path}.lock', 'a') as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+# Singleton instance
+catalog_store = CatalogStore(
+    nasa_api,
+    max_pages=settings.NEO_CATALOG_SYNC_PAGES,
+    ttl_seconds=settings.NEO_CATALOG_TTL,
+    snapshot_path=settings.NEO_CATALOG_SNAPSHOT_PATH or None,
+    snapshot_check_seconds=settings.NEO_CATALOG_SNAPSHOT_CHECK
+)
@@ -0,0 +1,104 @@
+"""
+Conditional GET
+Strong ETags and Cache-Control for cacheable GET views, with If-None-Match
+answered from remembered validators before the view runs
+"""
+import functools
+import hashlib
+
+from django.conf import settings
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+
+from .result_cache import ResultCache
+
+
+class ConditionalGet:
+    """
+    ETag validators for one view, remembered for max_age seconds
+    
+    The ETag is a hash of the rendered body, taken once when the response
+    is first rendered. While it is remembered, a request for the same URL
+    and Accept header whose If-None-Match lists it gets a 304 straight
+    away, without calling the view (so neither NASA nor the serializer is
+    touched). Once it expires the view runs again, and a body that hashes
+    the same is still turned into a 304.
+    """
+    
+    def __init__(self, max_age, max_entries=None):
+        """
+        Args:
+            max_age: Seconds the validator is trusted; also sent as Cache-Control max-age
+            max_entries: Validators kept (default settings.CONDITIONAL_GET_CACHE_SIZE)
+        """
+        self.max_age = max_age
+        self.validators = ResultCache(
+            max_entries=max_entries or settings.CONDITIONAL_GET_CACHE_SIZE,
+            ttl_seconds=max_age
+        )
+    
+    def __call__(self, view):
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            
+            key = self.request_key(request)
+            etag = self.validators.get(key)
+            if etag is not None and self._matches(request, etag):
+                return self._not_modified(etag)
+            
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            
+            if getattr(response, 'is_rendered', True):
+                return self._finalize(request, key, response)
+            response.add_post_render_callback(lambda rendered: self._finalize(request, key, rendered))
+            return response
+        
+        return wrapped
+    
+    def request_key(self, request):
+        """Validator key: path, query parameters in any order and Accept header"""
+        return self.validators.make_key(request.path, {
+            'query': sorted(request.GET.lists()),
+            'accept': request.META.get('HTTP_ACCEPT', '')
+        })
+    
+    def _finalize(self, request, key, response):
+        etag = f'"{hashlib.sha256(response.content).hexdigest()[:32]}"'
+        self.validators.set(key, etag)
+        if self._matches(request, etag):
+            return self._not_modified(etag)
+        response['ETag'] = etag
+        self._patch_headers(response)
+        return response
+    
+    def _not_modified(self, etag):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        self._patch_headers(response)
+        return response
+    
+    def _patch_headers(self, response):
+        patch_cache_control(response, public=True, max_age=self.max_age)
+        patch_vary_headers(response, ('Accept',))
+    
+    @staticmethod
+    def _matches(request, etag):
+        header = request.META.get('HTTP_IF_NONE_MATCH')
+        if not header:
+            return False
+        etags = parse_etags(header)
+        return '*' in etags or etag in etags
+
+
+def conditional_get(max_age):
+    """
+    Decorator adding ETag / If-None-Match handling and Cache-Control max-age
+    
+    Apply above @api_view so 304s are answered before DRF dispatch.
+    """
+    return ConditionalGet(max_age)
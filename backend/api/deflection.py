@@ -0,0 +1,574 @@
+"""
+Deflection Sweep Optimizer
+Evaluates deflection methods over parameter grids (vectorized, optionally
+across a process pool) and reduces the results to a Pareto frontier of
+deployed mass vs effectiveness vs lead time
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .physics import physics_engine
+
+
+# Default grids: {"min", "max", "num", "scale"} specs or explicit value lists
+DEFAULT_GRIDS = {
+    'impactor_mass_kg': {'min': 100, 'max': 20000, 'num': 24, 'scale': 'log'},
+    'impactor_velocity_kmps': {'min': 5, 'max': 15, 'num': 11, 'scale': 'linear'},
+    'asteroid_mass_kg': [1e12],
+    'spacecraft_mass_kg': {'min': 500, 'max': 20000, 'num': 12, 'scale': 'log'},
+    'duration_days': {'min': 30, 'max': 3650, 'num': 25, 'scale': 'linear'},
+    'yield_megatons': {'min': 0.01, 'max': 10, 'num': 16, 'scale': 'log'},
+}
+
+# Swept parameters of each method (asteroid mass is the scenario, swept for all)
+METHOD_PARAMETERS = {
+    'kinetic_impactor': ('impactor_mass_kg', 'impactor_velocity_kmps'),
+    'gravity_tractor': ('spacecraft_mass_kg', 'duration_days'),
+    'nuclear': ('yield_megatons',),
+}
+
+
+def _evaluate_chunk(method, columns, original_velocity_kmps, engine=None):
+    """
+    Delta-v and effectiveness for flattened parameter columns of one method
+    
+    Module-level so it can run in a worker process (which uses its own
+    physics_engine).
+    """
+    engine = engine or physics_engine
+    delta_v = np.broadcast_to(
+        engine.deflection_delta_v(method, columns), columns['asteroid_mass_kg'].shape
+    ).astype(float)
+    effectiveness = np.minimum(np.abs(delta_v / original_velocity_kmps) * 100, 100)
+    return delta_v, effectiveness
+
+
+class DeflectionOptimizer:
+    """Parameter sweeps and Pareto frontiers over the deflection methods"""
+    
+    # Deployed mass of a nuclear device per megaton of yield (B83-class, ~1.1 kt/kg)
+    NUCLEAR_KG_PER_MEGATON = 1000 / 1.1
+    
+    # Largest total grid evaluated in one sweep (background jobs; the
+    # synchronous endpoint passes the lower DEFLECTION_SWEEP_MAX_POINTS)
+    MAX_GRID_POINTS = 2000000
+    
+    # Values per grid axis; also bounds the distinct lead times and masses
+    # the Pareto frontier iterates over
+    MAX_AXIS_POINTS = 2000
+    
+    # Grids smaller than this are evaluated in-process even when workers > 1
+    PARALLEL_MIN_POINTS = 200000
+    
+    # Heliocentric constants for miss-distance propagation
+    SUN_GM_KM3_S2 = 1.32712440018e11
+    AU_KM = 1.495978707e8
+    EARTH_ORBITAL_SPEED_KMPS = 29.78
+    EARTH_ESCAPE_VELOCITY_KMPS = 11.186
+    
+    # Default curves for miss_distance_curves
+    DEFAULT_LEAD_TIMES = {'min': 0.1, 'max': 20, 'num': 60, 'scale': 'linear'}
+    DEFAULT_DELTA_V = {'min': 1e-7, 'max': 1e-4, 'num': 31, 'scale': 'log'}
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self._pool = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
+    
+    def parse_grid(self, spec):
+        """
+        Turn a grid spec into a 1-D array
+        
+        Args:
+            spec: Number, list of numbers, or {"min", "max", "num", "scale": "linear"|"log"}
+        
+        Returns:
+            ndarray: Grid values
+        """
+        if isinstance(spec, dict):
+            low, high = float(spec['min']), float(spec['max'])
+            num = int(spec.get('num', 10))
+            if num < 1 or low > high:
+                raise ValueError('Grid needs num >= 1 and min <= max')
+            if num > self.MAX_AXIS_POINTS:
+                raise ValueError(f'Grid num is limited to {self.MAX_AXIS_POINTS}')
+            if spec.get('scale', 'linear') == 'log':
+                if low <= 0:
+                    raise ValueError('Log grids need a positive min')
+                return np.geomspace(low, high, num)
+            return np.linspace(low, high, num)
+        
+        values = np.atleast_1d(np.asarray(spec, dtype=float))
+        if values.ndim != 1 or values.size == 0:
+            raise ValueError('Grid values must be a non-empty list of numbers')
+        if values.size > self.MAX_AXIS_POINTS:
+            raise ValueError(f'Grids are limited to {self.MAX_AXIS_POINTS} values')
+        return values
+    
+    def deployed_mass(self, method, columns):
+        """Mass that has to be launched for each configuration (kg)"""
+        if method == 'kinetic_impactor':
+            return columns['impactor_mass_kg']
+        if method == 'gravity_tractor':
+            return columns['spacecraft_mass_kg']
+        return columns['yield_megatons'] * self.NUCLEAR_KG_PER_MEGATON
+    
+    @staticmethod
+    def lead_time(method, columns):
+        """
+        Lead time each configuration needs to deliver its delta-v (days)
+        
+        The gravity tractor has to pull for its whole duration; impulsive
+        methods deliver their delta-v at intercept.
+        """
+        if method == 'gravity_tractor':
+            return columns['duration_days']
+        return np.zeros_like(columns['asteroid_mass_kg'])
+    
+    def parse_sweep_request(self, data):
+        """
+        Keyword arguments for sweep() from a /api/deflection-sweep body
+        
+        Methods and grids are checked here (against MAX_GRID_POINTS), so a
+        queued sweep is rejected when it is submitted. The process-pool size
+        is left to the caller.
+        """
+        original_velocity = float(data.get('original_velocity_kmps', 0))
+        if original_velocity <= 0:
+            raise ValueError('Invalid velocity')
+        
+        grids = dict(data.get('grids') or {})
+        if 'asteroid_mass_kg' in grids:
+            # Each mass is a scenario; a repeated one would be swept twice
+            grids['asteroid_mass_kg'] = np.unique(self.parse_grid(grids['asteroid_mass_kg'])).tolist()
+        
+        methods = data.get('methods')
+        self._sweep_axes(methods, grids)
+        
+        target_delta_v = data.get('target_delta_v_kmps')
+        return {
+            'original_velocity_kmps': original_velocity,
+            'methods': methods,
+            'grids': grids,
+            'target_delta_v_kmps': float(target_delta_v) if target_delta_v is not None else None,
+            'max_frontier_points': int(data.get('max_frontier_points', 200))
+        }
+    
+    def sweep(self, original_velocity_kmps, methods=None, grids=None,
+              target_delta_v_kmps=None, workers=1, max_frontier_points=200, max_points=None):
+        """
+        Evaluate every method over its parameter grid
+        
+        Args:
+            original_velocity_kmps: Asteroid velocity (for effectiveness)
+            methods: Methods to sweep (default: all three)
+            grids: Overrides of DEFAULT_GRIDS
+            target_delta_v_kmps: If set, report the lightest configuration reaching it
+            workers: Process-pool size for large grids (1 = in-process)
+            max_frontier_points: Frontier points returned per scenario (evenly thinned)
+            max_points: Limit on the total grid (default MAX_GRID_POINTS)
+        
+        Returns:
+            dict: Per asteroid mass scenario, the Pareto frontier and minimum masses
+        """
+        methods, axes, grid_sizes = self._sweep_axes(methods, grids, max_points)
+        asteroid_masses = axes['asteroid_mass_kg']
+        total_points = sum(grid_sizes.values())
+        
+        # Flattened columns per method (asteroid mass varies slowest)
+        blocks = {}
+        for method in methods:
+            names = ('asteroid_mass_kg',) + METHOD_PARAMETERS[method]
+            mesh = np.meshgrid(*(axes[name] for name in names), indexing='ij')
+            blocks[method] = {name: grid.ravel() for name, grid in zip(names, mesh)}
+        
+        workers = max(1, int(workers))
+        if total_points < self.PARALLEL_MIN_POINTS:
+            workers = 1
+        outputs = self._evaluate(blocks, original_velocity_kmps, workers)
+        
+        scenarios = []
+        for asteroid_mass in asteroid_masses:
+            points = self._scenario_points(blocks, outputs, asteroid_mass)
+            frontier = self.pareto_frontier(
+                points['mass_kg'], points['effectiveness'], points['lead_time_days']
+            )
+            frontier = frontier[np.lexsort((
+                points['lead_time_days'][frontier], points['mass_kg'][frontier]
+            ))]
+            
+            frontier_size = int(frontier.size)
+            truncated = frontier_size > max_frontier_points
+            if truncated:
+                keep = np.linspace(0, frontier_size - 1, max_frontier_points).round().astype(int)
+                frontier = frontier[np.unique(keep)]
+            
+            scenario = {
+                'asteroid_mass_kg': float(asteroid_mass),
+                'frontier_size': frontier_size,
+                'truncated': bool(truncated),
+                'pareto_frontier': [self._point(points, i) for i in frontier],
+            }
+            if target_delta_v_kmps is not None:
+                scenario['minimum_mass'] = self._minimum_mass(
+                    points, methods, float(target_delta_v_kmps), asteroid_mass, axes
+                )
+            scenarios.append(scenario)
+        
+        return {
+            'original_velocity_kmps': original_velocity_kmps,
+            'methods': methods,
+            'grid_sizes': grid_sizes,
+            'evaluated_points': total_points,
+            'workers': workers,
+            'target_delta_v_kmps': target_delta_v_kmps,
+            'assumptions': {
+                'nuclear_kg_per_megaton': self.NUCLEAR_KG_PER_MEGATON,
+                'lead_time': 'gravity tractor duration; 0 for impulsive methods'
+            },
+            'scenarios': scenarios
+        }
+    
+    def _sweep_axes(self, methods, grids, max_points=None):
+        """
+        Check a sweep's methods and grids
+        
+        Returns:
+            tuple: (methods, parsed axes by name, grid points per method)
+        """
+        methods = list(methods or METHOD_PARAMETERS)
+        for method in methods:
+            if method not in METHOD_PARAMETERS:
+                raise ValueError(f'Unknown deflection method: {method}')
+        
+        specs = dict(DEFAULT_GRIDS, **(grids or {}))
+        axes = {name: self.parse_grid(specs[name]) for name in DEFAULT_GRIDS}
+        if np.any(axes['asteroid_mass_kg'] <= 0):
+            raise ValueError('asteroid_mass_kg values must be positive')
+        
+        grid_sizes = {}
+        for method in methods:
+            sizes = [axes[name].size for name in METHOD_PARAMETERS[method]]
+            grid_sizes[method] = int(axes['asteroid_mass_kg'].size * np.prod(sizes))
+        total_points = sum(grid_sizes.values())
+        max_points = max_points or self.MAX_GRID_POINTS
+        if total_points > max_points:
+            raise ValueError(f'Sweep has {total_points} points; the limit is {max_points}')
+        return methods, axes, grid_sizes
+    
+    def _evaluate(self, blocks, original_velocity_kmps, workers):
+        """Evaluate every block, in chunks over a process pool when workers > 1"""
+        if workers == 1:
+            return {
+                method: _evaluate_chunk(method, columns, original_velocity_kmps, self.engine)
+                for method, columns in blocks.items()
+            }
+        
+        pool = self._get_pool(workers)
+        futures = {}
+        for method, columns in blocks.items():
+            size = columns['asteroid_mass_kg'].size
+            bounds = np.linspace(0, size, workers + 1).astype(int)
+            futures[method] = [
+                pool.submit(
+                    _evaluate_chunk, method,
+                    {name: values[start:stop] for name, values in columns.items()},
+                    original_velocity_kmps
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start
+            ]
+        
+        outputs = {}
+        for method, chunks in futures.items():
+            results = [future.result() for future in chunks]
+            outputs[method] = (
+                np.concatenate([delta_v for delta_v, _ in results]),
+                np.concatenate([effectiveness for _, effectiveness in results])
+            )
+        return outputs
+    
+    def _get_pool(self, workers):
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ProcessPoolExecutor(max_workers=workers)
+                self._pool_workers = workers
+            return self._pool
+    
+    def _scenario_points(self, blocks, outputs, asteroid_mass):
+        """Concatenate every method's configurations for one asteroid mass"""
+        parts = []
+        for method, columns in blocks.items():
+            selected = columns['asteroid_mass_kg'] == asteroid_mass
+            subset = {name: values[selected] for name, values in columns.items()}
+            delta_v, effectiveness = outputs[method]
+            parts.append({
+                'method': np.full(subset['asteroid_mass_kg'].size, method, dtype=object),
+                'columns': subset,
+                'mass_kg': self.deployed_mass(method, subset),
+                'lead_time_days': self.lead_time(method, subset),
+                'delta_v_kmps': delta_v[selected],
+                'effectiveness': effectiveness[selected],
+            })
+        
+        points = {
+            key: np.concatenate([part[key] for part in parts])
+            for key in ('method', 'mass_kg', 'lead_time_days', 'delta_v_kmps', 'effectiveness')
+        }
+        points['params'] = [
+            {name: values for name, values in part['columns'].items() if name != 'asteroid_mass_kg'}
+            for part in parts
+        ]
+        points['offsets'] = np.cumsum([0] + [part['mass_kg'].size for part in parts])
+        return points
+    
+    @staticmethod
+    def pareto_frontier(mass, effectiveness, lead_time):
+        """
+        Indices of the non-dominated points
+        
+        Minimises mass and lead time, maximises effectiveness. One sort by
+        lead time (then mass, best effectiveness first) and one pass over the
+        lead-time groups: each group is reduced to its mass/effectiveness
+        staircase with a running maximum, its points are dropped if the
+        merged staircase of all shorter lead times does at least as well,
+        and the survivors are merged into that staircase.
+        
+        Returns:
+            ndarray: Point indices (exact duplicates keep one representative)
+        """
+        order = np.lexsort((-effectiveness, mass, lead_time))
+        leads = lead_time[order]
+        bounds = np.concatenate((np.flatnonzero(np.diff(leads)) + 1, [order.size]))
+        
+        kept = []
+        stair_mass = np.empty(0)  # Staircase of shorter lead times: mass ascending,
+        stair_best = np.empty(0)  # best effectiveness at or below that mass
+        start = 0
+        for stop in bounds:
+            group = order[start:stop]
+            start = stop
+            best_before = np.maximum.accumulate(
+                np.concatenate(([-np.inf], effectiveness[group][:-1]))
+            )
+            stair = group[effectiveness[group] > best_before]
+            
+            if stair_mass.size:
+                position = np.searchsorted(stair_mass, mass[stair], side='right') - 1
+                dominated = (position >= 0) & (
+                    stair_best[np.maximum(position, 0)] >= effectiveness[stair]
+                )
+                stair = stair[~dominated]
+            if not stair.size:
+                continue
+            kept.append(stair)
+            
+            masses = np.concatenate((stair_mass, mass[stair]))
+            best = np.concatenate((stair_best, effectiveness[stair]))
+            merged = np.lexsort((-best, masses))
+            masses, best = masses[merged], np.maximum.accumulate(best[merged])
+            rises = np.concatenate(([True], best[1:] > best[:-1]))
+            stair_mass, stair_best = masses[rises], best[rises]
+        
+        return np.concatenate(kept) if kept else np.array([], dtype=int)
+    
+    def _point(self, points, index):
+        part = int(np.searchsorted(points['offsets'], index, side='right') - 1)
+        local = index - points['offsets'][part]
+        return {
+            'method': points['method'][index],
+            'mass_kg': float(points['mass_kg'][index]),
+            'effectiveness': float(points['effectiveness'][index]),
+            'lead_time_days': float(points['lead_time_days'][index]),
+            'delta_v_kmps': float(points['delta_v_kmps'][index]),
+            'params': {name: float(values[local]) for name, values in points['params'][part].items()}
+        }
+    
+    def _minimum_mass(self, points, methods, target_delta_v_kmps, asteroid_mass, axes):
+        """Lightest configuration per method reaching the target delta-v"""
+        result = {}
+        for method in methods:
+            candidates = np.flatnonzero(
+                (points['method'] == method) & (points['delta_v_kmps'] >= target_delta_v_kmps)
+            )
+            if candidates.size == 0:
+                result[method] = None
+                continue
+            best = candidates[np.lexsort((
+                -points['delta_v_kmps'][candidates],
+                points['lead_time_days'][candidates],
+                points['mass_kg'][candidates]
+            ))[0]]
+            result[method] = self._point(points, best)
+        
+        if 'kinetic_impactor' in methods:
+            # Continuous optimum at the fastest swept impactor velocity: m = dv * M / v
+            fastest = float(axes['impactor_velocity_kmps'].max())
+            result['kinetic_impactor_analytic_mass_kg'] = (
+                target_delta_v_kmps * float(asteroid_mass) / fastest if fastest > 0 else None
+            )
+        return result
+    
+    def parse_miss_distance_request(self, data):
+        """
+        Keyword arguments for miss_distance_curves() from a
+        /api/deflection-miss-distance body, plus the asteroid summary
+        
+        An asteroid_id takes its orbit and approach speed from NASA;
+        otherwise semi_major_axis_au and velocity_kmps are required.
+        
+        Returns:
+            tuple: (kwargs, asteroid_info or None)
+        
+        Raises:
+            LookupError: NASA could not provide the asteroid
+        """
+        from .nasa_api import nasa_api
+        
+        asteroid_id = data.get('asteroid_id')
+        asteroid_info = None
+        
+        if asteroid_id:
+            asteroid_data = nasa_api.get_asteroid_by_id(asteroid_id)
+            
+            if 'error' in asteroid_data:
+                raise LookupError(asteroid_data['error'])
+            
+            orbital_elements = asteroid_data.orbital_elements
+            semi_major_axis = orbital_elements['semi_major_axis']
+            eccentricity = orbital_elements['eccentricity']
+            velocity_kmps = asteroid_data.velocity_kmps
+            asteroid_info = {
+                'id': asteroid_data['id'],
+                'name': asteroid_data['name'],
+                'is_potentially_hazardous': asteroid_data['is_potentially_hazardous']
+            }
+        else:
+            semi_major_axis = data.get('semi_major_axis_au')
+            eccentricity = data.get('eccentricity', 0)
+            velocity_kmps = data.get('velocity_kmps')
+        
+        if semi_major_axis is None or velocity_kmps is None:
+            raise ValueError('Provide asteroid_id or semi_major_axis_au and velocity_kmps')
+        
+        kwargs = {
+            'semi_major_axis_au': float(semi_major_axis),
+            'eccentricity': float(eccentricity or 0),
+            'v_inf_kmps': float(velocity_kmps),
+            'lead_time_years': data.get('lead_time_years'),
+            'delta_v_kmps': data.get('delta_v_kmps'),
+            'impact_parameter_km': float(data.get('impact_parameter_km', 0))
+        }
+        self._check_orbit(kwargs['semi_major_axis_au'], kwargs['eccentricity'], kwargs['v_inf_kmps'])
+        self._curve_grids(kwargs['lead_time_years'], kwargs['delta_v_kmps'])
+        return kwargs, asteroid_info
+    
+    def miss_distance_curves(self, semi_major_axis_au, eccentricity, v_inf_kmps,
+                             lead_time_years=None, delta_v_kmps=None, impact_parameter_km=0.0):
+        """
+        B-plane miss-distance shift from an along-track delta-v applied T before encounter
+        
+        Linearized secular drift: an along-track dv changes the semi-major
+        axis by da = 2 a^2 v dv / mu, so each orbit the asteroid arrives
+        (3/2) dP/P later; after lead time T the arrival-time shift is
+        dt = 3 T a v dv / mu. Earth moves v_E sin(theta) * dt across the
+        B-plane in that time, theta being the angle between Earth's velocity
+        and the asteroid's geocentric approach velocity. Short-period terms
+        are ignored, so curves are optimistic for T below about one orbit.
+        
+        Args:
+            semi_major_axis_au: Orbit semi-major axis (AU)
+            eccentricity: Orbit eccentricity
+            v_inf_kmps: Geocentric approach speed (km/s)
+            lead_time_years: Grid spec of lead times (years)
+            delta_v_kmps: Grid spec of along-track delta-v values (km/s)
+            impact_parameter_km: Undeflected B-plane distance from Earth's centre
+        
+        Returns:
+            dict: Miss shift matrix (lead time x delta-v), hit/miss flags and
+                  the delta-v / lead time needed to clear Earth
+        """
+        a = float(semi_major_axis_au)
+        e = float(eccentricity)
+        v_inf = float(v_inf_kmps)
+        self._check_orbit(a, e, v_inf)
+        lead_years, delta_v = self._curve_grids(lead_time_years, delta_v_kmps)
+        
+        # Encounter at 1 AU, or the nearest point of an orbit that does not reach it
+        r_au = min(max(1.0, a * (1 - e)), a * (1 + e))
+        a_km = a * self.AU_KM
+        v_helio = (self.SUN_GM_KM3_S2 * (2 / (r_au * self.AU_KM) - 1 / a_km)) ** 0.5
+        
+        # Approach geometry from |v_ast|^2 = v_E^2 + v_inf^2 + 2 v_E v_inf cos(theta)
+        v_earth = self.EARTH_ORBITAL_SPEED_KMPS
+        cos_theta = (v_helio ** 2 - v_earth ** 2 - v_inf ** 2) / (2 * v_earth * v_inf)
+        sin_theta = (1 - min(max(cos_theta, -1.0), 1.0) ** 2) ** 0.5
+        
+        # B-plane shift per (second of lead time x km/s of delta-v)
+        shift_rate = 3 * a_km * v_helio * v_earth * sin_theta / self.SUN_GM_KM3_S2
+        year_seconds = 365.25 * 86400
+        lead_seconds = lead_years * year_seconds
+        shift_km = shift_rate * np.outer(lead_seconds, delta_v)
+        
+        # Gravitationally focused capture radius
+        capture_radius_km = self.engine.EARTH_RADIUS_KM * (
+            1 + (self.EARTH_ESCAPE_VELOCITY_KMPS / v_inf) ** 2
+        ) ** 0.5
+        needed_km = max(capture_radius_km - abs(float(impact_parameter_km)), 0.0)
+        
+        if shift_rate > 0:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                required_delta_v = needed_km / (shift_rate * lead_seconds)
+                minimum_lead_years = needed_km / (shift_rate * delta_v) / year_seconds
+        else:
+            required_delta_v = np.full(lead_seconds.shape, np.inf)
+            minimum_lead_years = np.full(delta_v.shape, np.inf)
+        
+        return {
+            'orbit': {
+                'semi_major_axis_au': a,
+                'eccentricity': e,
+                'encounter_distance_au': r_au,
+                'heliocentric_speed_kmps': v_helio,
+                'v_inf_kmps': v_inf,
+                'approach_angle_deg': float(np.degrees(np.arcsin(sin_theta)))
+            },
+            'capture_radius_km': capture_radius_km,
+            'impact_parameter_km': float(impact_parameter_km),
+            'lead_time_years': lead_years.tolist(),
+            'delta_v_kmps': delta_v.tolist(),
+            'miss_shift_km': shift_km.tolist(),
+            'misses_earth': (shift_km >= needed_km).tolist(),
+            'required_delta_v_kmps': [_finite_or_none(x) for x in required_delta_v],
+            'minimum_lead_time_years': [_finite_or_none(x) for x in minimum_lead_years],
+            'model': 'linearized along-track drift (3 T a v dv / mu), B-plane projection'
+        }
+    
+    @staticmethod
+    def _check_orbit(a, e, v_inf):
+        if a <= 0 or not 0 <= e < 1 or v_inf <= 0:
+            raise ValueError('Need a > 0, 0 <= e < 1 and a positive approach speed')
+    
+    def _curve_grids(self, lead_time_years, delta_v_kmps):
+        """Lead-time and delta-v grids of miss_distance_curves (defaults when None)"""
+        if lead_time_years is None:
+            lead_time_years = self.DEFAULT_LEAD_TIMES
+        if delta_v_kmps is None:
+            delta_v_kmps = self.DEFAULT_DELTA_V
+        lead_years = self.parse_grid(lead_time_years)
+        delta_v = self.parse_grid(delta_v_kmps)
+        if lead_years.size * delta_v.size > self.MAX_GRID_POINTS:
+            raise ValueError(f'Curve grid is limited to {self.MAX_GRID_POINTS} points')
+        return lead_years, delta_v
+
+
+def _finite_or_none(value):
+    return float(value) if np.isfinite(value) else None
+
+
+# Singleton instance
+deflection_optimizer = DeflectionOptimizer(physics_engine)
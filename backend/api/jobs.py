@@ -0,0 +1,335 @@
+"""
+Background Simulation Jobs
+Database-backed job queue executed by a local thread pool, so long sweeps
+and batch runs don't hold a web worker past the request timeout. Queue state
+lives in the SimulationJob table; no external broker is needed.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import SimulationJob
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when its job was cancelled"""
+
+
+class JobQueue:
+    """Registry of job handlers plus the worker pool that runs them"""
+    
+    # Minimum seconds between progress writes to the database
+    PROGRESS_INTERVAL = 0.5
+    
+    def __init__(self):
+        self.handlers = {}
+        self.validators = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self._resumed = False
+    
+    def register(self, kind, validate=None):
+        """
+        Decorator registering handler(params, progress) for a job kind
+        
+        The handler returns a JSON-serialisable result and may call
+        progress(fraction, message) to report progress; that call raises
+        JobCancelled once the job has been cancelled. validate(params), if
+        given, runs at submit time and raises ValueError (or TypeError,
+        KeyError, LookupError) for params the handler would reject.
+        """
+        def decorator(handler):
+            self.handlers[kind] = handler
+            if validate is not None:
+                self.validators[kind] = validate
+            return handler
+        return decorator
+    
+    def submit(self, kind, params):
+        """
+        Store a queued job and hand it to the local worker pool
+        
+        Returns:
+            SimulationJob: The new job
+        """
+        if kind not in self.handlers:
+            raise ValueError(
+                f"Unknown job kind '{kind}'. Choose: {', '.join(sorted(self.handlers))}"
+            )
+        params = params or {}
+        if kind in self.validators:
+            self.validators[kind](params)
+        
+        self._start()
+        self.purge_expired()
+        
+        job = SimulationJob.objects.create(kind=kind, params=params)
+        self._executor.submit(self._run, job.id)
+        return job
+    
+    def cancel(self, job_id):
+        """
+        Cancel a queued or running job
+        
+        Queued jobs never start; running jobs stop at their next progress report.
+        
+        Returns:
+            bool: True if the job was still unfinished
+        """
+        return SimulationJob.objects.filter(
+            id=job_id, status__in=(SimulationJob.QUEUED, SimulationJob.RUNNING)
+        ).update(
+            status=SimulationJob.CANCELLED,
+            finished_at=timezone.now(),
+            expires_at=timezone.now() + timedelta(seconds=settings.JOB_RESULT_TTL)
+        ) == 1
+    
+    def purge_expired(self):
+        """
+        Delete finished jobs past their TTL and fail jobs stuck in "running"
+        (e.g. their worker process was restarted)
+        """
+        now = timezone.now()
+        SimulationJob.objects.filter(expires_at__lt=now).delete()
+        SimulationJob.objects.filter(
+            status=SimulationJob.RUNNING,
+            started_at__lt=now - timedelta(seconds=settings.JOB_TIMEOUT)
+        ).update(
+            status=SimulationJob.FAILED,
+            error='Job timed out or its worker stopped',
+            finished_at=now,
+            expires_at=now + timedelta(seconds=settings.JOB_RESULT_TTL)
+        )
+    
+    def _start(self):
+        """Create the pool and pick up jobs queued before a restart (first use only)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.JOB_WORKERS, thread_name_prefix='simulation-job'
+                )
+            if self._resumed:
+                return
+            self._resumed = True
+        
+        for job_id in SimulationJob.objects.filter(
+            status=SimulationJob.QUEUED
+        ).values_list('id', flat=True):
+            self._executor.submit(self._run, job_id)
+    
+    def _run(self, job_id):
+        close_old_connections()
+        try:
+            # Claim the job; another process (or a resumed copy) may have taken it
+            claimed = SimulationJob.objects.filter(
+                id=job_id, status=SimulationJob.QUEUED
+            ).update(status=SimulationJob.RUNNING, started_at=timezone.now())
+            if not claimed:
+                return
+            
+            job = SimulationJob.objects.get(id=job_id)
+            try:
+                result = self.handlers[job.kind](job.params, self._progress_reporter(job_id))
+                # Strict JSON (no NaN/inf), as Postgres and the API renderer require
+                json.dumps(result, allow_nan=False)
+                self._finish(
+                    job_id, status=SimulationJob.SUCCEEDED, result=result, progress=1.0, message='Done'
+                )
+            except JobCancelled:
+                return
+            except Exception as e:
+                # Handler errors and results that could not be saved
+                self._finish(job_id, status=SimulationJob.FAILED, error=f'{type(e).__name__}: {e}')
+        finally:
+            close_old_connections()
+    
+    def _finish(self, job_id, **fields):
+        now = timezone.now()
+        # A job cancelled while running keeps its cancelled status
+        SimulationJob.objects.filter(id=job_id, status=SimulationJob.RUNNING).update(
+            finished_at=now,
+            expires_at=now + timedelta(seconds=settings.JOB_RESULT_TTL),
+            **fields
+        )
+    
+    def _progress_reporter(self, job_id):
+        last_write = [0.0]
+        
+        def progress(fraction, message=''):
+            now = time.monotonic()
+            if now - last_write[0] < self.PROGRESS_INTERVAL and fraction < 1:
+                return
+            last_write[0] = now
+            
+            updated = SimulationJob.objects.filter(
+                id=job_id, status=SimulationJob.RUNNING
+            ).update(progress=min(max(float(fraction), 0.0), 1.0), message=message[:255])
+            if not updated:
+                raise JobCancelled()
+        
+        return progress
+
+
+def _json_array(values):
+    """numpy array -> list with NaN as None"""
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        return [None if np.isnan(x) else float(x) for x in values]
+    return values.tolist()
+
+
+# Singleton instance
+job_queue = JobQueue()
+
+
+# Job handlers ---------------------------------------------------------------
+
+def _parse_sweep(params):
+    from .deflection import deflection_optimizer
+    
+    return deflection_optimizer.parse_sweep_request(params)
+
+
+@job_queue.register('deflection_sweep', validate=_parse_sweep)
+def _deflection_sweep_job(params, progress):
+    """params: the /api/deflection-sweep body"""
+    from .deflection import deflection_optimizer
+    
+    progress(0.0, 'Evaluating grid')
+    return deflection_optimizer.sweep(
+        workers=settings.DEFLECTION_SWEEP_WORKERS if params.get('parallel') else 1,
+        **_parse_sweep(params)
+    )
+
+
+def _parse_miss_distance(params):
+    from .deflection import deflection_optimizer
+    
+    return deflection_optimizer.parse_miss_distance_request(params)
+
+
+@job_queue.register('deflection_miss_distance', validate=_parse_miss_distance)
+def _deflection_miss_distance_job(params, progress):
+    """params: the /api/deflection-miss-distance body (asteroid_id or an explicit orbit)"""
+    from .deflection import deflection_optimizer
+    
+    kwargs, asteroid_info = _parse_miss_distance(params)
+    progress(0.0, 'Propagating')
+    result = deflection_optimizer.miss_distance_curves(**kwargs)
+    if asteroid_info:
+        result['asteroid_info'] = asteroid_info
+    return result
+
+
+def _parse_max_pages(params):
+    max_pages = params.get('max_pages')
+    return int(max_pages) if max_pages is not None else None
+
+
+@job_queue.register('catalog_sync', validate=_parse_max_pages)
+def _catalog_sync_job(params, progress):
+    """params: optional max_pages (0 = whole catalog)"""
+    from .catalog_store import catalog_store
+    
+    progress(0.0, 'Browsing NASA catalog')
+    result = catalog_store.sync(max_pages=_parse_max_pages(params), progress=progress)
+    if 'error' in result:
+        raise RuntimeError(result['error'])
+    return result
+
+
+@job_queue.register('threat_ranking')
+def _threat_ranking_job(params, progress):
+    """Score the local catalog into the ThreatScore table; params: optional sync (bool)"""
+    from .catalog_store import catalog_store
+    from .threats import threat_ranker
+    
+    if params.get('sync'):
+        progress(0.0, 'Syncing catalog')
+        catalog_store.sync()
+    index = catalog_store.get(block=True)
+    if index is None:
+        raise RuntimeError('Asteroid catalog unavailable')
+    
+    progress(0.2, f'Scoring {len(index.catalog)} asteroids')
+    return threat_ranker.rank(index, progress)
+
+
+def _impact_grid_axes(params):
+    """Diameter, velocity and angle grids of an impact_grid job, and their point count"""
+    from .deflection import deflection_optimizer
+    
+    defaults = (('diameter_km', [1.0]), ('velocity_kmps', [20.0]), ('impact_angle', [45.0]))
+    axes = [deflection_optimizer.parse_grid(params.get(name, default)) for name, default in defaults]
+    total = int(np.prod([axis.size for axis in axes]))
+    if total > settings.JOB_MAX_GRID_POINTS:
+        raise ValueError(
+            f'Grid has {total} points; the limit is {settings.JOB_MAX_GRID_POINTS} '
+            '(stream larger grids from /api/stream/impact-grid)'
+        )
+    return axes, total
+
+
+@job_queue.register('impact_grid', validate=_impact_grid_axes)
+def _impact_grid_job(params, progress):
+    """
+    Impact effects over the product of diameter, velocity and angle grids
+    
+    params: diameter_km, velocity_kmps, impact_angle (lists or
+    {"min", "max", "num", "scale"} specs), density (optional)
+    """
+    from .physics import physics_engine
+    
+    axes, total = _impact_grid_axes(params)
+    mesh = [grid.ravel() for grid in np.meshgrid(*axes, indexing='ij')]
+    
+    chunk_size = 5000
+    chunks = []
+    for start in range(0, total, chunk_size):
+        progress(start / total, f'{start} of {total} impacts')
+        stop = min(start + chunk_size, total)
+        chunks.append(physics_engine.calculate_batch_impact_effects(
+            mesh[0][start:stop], mesh[1][start:stop], mesh[2][start:stop], params.get('density')
+        ))
+    
+    effects = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+    return {
+        'count': total,
+        'diameter_km': _json_array(mesh[0]),
+        'velocity_kmps': _json_array(mesh[1]),
+        'impact_angle': _json_array(mesh[2]),
+        'effects': {key: _json_array(values) for key, values in effects.items()}
+    }
+
+
+def _parse_monte_carlo(params):
+    from .streaming import simulation_streams
+    
+    return simulation_streams.parse_monte_carlo(params, settings.JOB_MAX_SAMPLES)
+
+
+@job_queue.register('monte_carlo', validate=_parse_monte_carlo)
+def _monte_carlo_job(params, progress):
+    """
+    Monte Carlo impact ensemble; the result is the final percentile summary
+    
+    params: the /api/stream/monte-carlo query parameters, with samples up to
+    JOB_MAX_SAMPLES
+    """
+    from .streaming import simulation_streams
+    
+    params = _parse_monte_carlo(params)
+    # Cancellation arrives through progress() raising JobCancelled
+    summary = {}
+    for event, data in simulation_streams.monte_carlo(params, threading.Event()):
+        if event == 'progress':
+            summary = data
+            progress(data['completed'] / data['total'], f"{data['completed']} of {data['total']} samples")
+    return summary
@@ -0,0 +1,163 @@
+"""
+Streaming JSON Reader
+Walks a large JSON document chunk by chunk and yields the elements of the
+arrays at a key path one at a time, so memory is bounded by one element
+(plus one chunk) instead of the whole document
+"""
+import codecs
+import json
+import re
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_TAIL = re.compile(r'[0-9+\-.eE]*\Z')
+
+
+class JSONStream:
+    """
+    Incremental reader over an iterable of byte chunks (e.g. response.iter_content)
+    
+    Each element is decoded by the C json decoder once the buffer holds all
+    of it; the buffer grows geometrically while an element is incomplete, so
+    an element is decoded at most about twice. Values next to the streamed
+    arrays (NASA's 'page', 'links', 'element_count') are decoded whole and
+    kept in values, keyed by their key path, once they have been read.
+    Malformed input raises ValueError.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, chunks):
+        self.values = {}
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+    
+    def iter_items(self, path, limits=None):
+        """
+        Yield the elements of the array(s) at path
+        
+        Args:
+            path: Tuple of object keys leading to the array; '*' matches
+                  every key (('near_earth_objects', '*') walks the feed's
+                  per-date arrays)
+            limits: Optional {key: n} keeping only the first n items of
+                    those array members of each element; the rest are
+                    skipped without being kept
+        
+        Yields:
+            Decoded elements, in document order
+        """
+        yield from self._walk(tuple(path), (), limits)
+    
+    def _walk(self, path, at, limits):
+        if not path:
+            self._expect('[')
+            if self._peek() == ']':
+                self._pos += 1
+                return
+            while True:
+                yield self._decode_item(limits) if limits else self._decode_value()
+                if self._expect(',]') == ']':
+                    return
+        
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if path[0] in ('*', key):
+                yield from self._walk(path[1:], at + (key,), limits)
+            else:
+                self.values[at + (key,)] = self._decode_value()
+            if self._expect(',}') == '}':
+                return
+    
+    def _decode_item(self, limits):
+        """An element with the limited arrays cut short while reading"""
+        if self._peek() != '{':
+            return self._decode_value()
+        self._pos += 1
+        item = {}
+        if self._peek() == '}':
+            self._pos += 1
+            return item
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if key in limits and self._peek() == '[':
+                self._pos += 1
+                kept = []
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        value = self._decode_value()
+                        if len(kept) < limits[key]:
+                            kept.append(value)
+                        if self._expect(',]') == ']':
+                            break
+                item[key] = kept
+            else:
+                item[key] = self._decode_value()
+            if self._expect(',}') == '}':
+                return item
+    
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if self._eof:
+                    raise
+            else:
+                # A number cut at the end of the buffer ("12." of "12.5") may
+                # continue in the next chunk
+                if self._eof or not _NUMBER_TAIL.match(self._buffer, end):
+                    self._pos = end
+                    return value
+            self._grow()
+    
+    def _grow(self):
+        """Read until the unconsumed text has doubled (or the input ends)"""
+        target = 2 * (len(self._buffer) - self._pos) + 1
+        while len(self._buffer) - self._pos < target and self._fill():
+            pass
+    
+    def _peek(self):
+        """Next non-whitespace character without consuming it ('' at the end of input)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+    
+    def _expect(self, allowed):
+        char = self._peek()
+        if not char or char not in allowed:
+            raise ValueError(f'Expected one of {allowed!r} at character {self._pos}, got {char!r}')
+        self._pos += 1
+        return char
+    
+    def _fill(self):
+        """Append the next chunk, dropping consumed text; False at the end of input"""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._text.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._text.decode(b'', final=True)
+        self._eof = True
+        return False
@@ -0,0 +1,53 @@
+"""
+Lazy Imports
+Stand-ins for heavy modules (the numpy-backed engines) and their
+singletons that import them on first use, so starting a process and
+answering its first light request (/api/health) do not pay for them
+"""
+import importlib
+
+from django.utils.functional import SimpleLazyObject
+
+
+# Modules deferred with lazy_import(), imported by warm_up()
+_deferred = set()
+
+
+def lazy_import(module, attribute=None):
+    """
+    Proxy for a module, or for an attribute of one, imported on first access
+    
+    Attribute access, calls and comparisons are forwarded to the real
+    object, so the proxy is used exactly like the import it replaces. Patches
+    applied to the real module are seen too.
+    
+    Args:
+        module: Dotted module name, e.g. 'api.physics'
+        attribute: Module-level name to proxy instead, e.g. 'physics_engine'
+    """
+    _deferred.add(module)
+    
+    def load():
+        imported = importlib.import_module(module)
+        return getattr(imported, attribute) if attribute else imported
+    
+    return SimpleLazyObject(load)
+
+
+def warm_up():
+    """
+    Import the URLconf, the views and everything deferred with lazy_import()
+    
+    Called where start-up time is free, e.g. in the gunicorn master before
+    workers are forked, so workers inherit the imports instead of paying
+    for them on their first requests.
+    
+    Returns:
+        int: Deferred modules imported
+    """
+    from django.urls import get_resolver
+    
+    get_resolver().url_patterns
+    for module in sorted(_deferred):
+        importlib.import_module(module)
+    return len(_deferred)
@@ -0,0 +1,348 @@
+"""
+Precomputed Lookup Tables for Approximate Impact Physics
+Log-spaced diameter x velocity x angle grids with trilinear interpolation
+
+Error bounds against the exact path (measured with measure_error() over
+20,000 log-uniform samples inside the default 96 x 32 x 18 grid):
+    - Blast, thermal, fireball and seismic outputs are power laws in
+      diameter and velocity, so interpolating their logarithms over
+      log(diameter), log(velocity) is exact to rounding (< 1e-13).
+    - Crater diameter: the sin(angle)^0.5 factor is the only error source,
+      median 0.06%, 95th percentile 1%, max 3% (at the shallowest angles).
+    - Airburst vs ground impact classification agrees for 99.3% of samples;
+      mismatches sit within one grid cell of the boundary.
+    - Burst altitude: median 0.08 km, 95th percentile 1.2 km, max 9 km.
+    - Airburst overpressure radii: median < 0.1%, 95th percentile < 6%
+      relative error; the worst cases are where a threshold radius is just
+      appearing at ground level (radius near zero).
+    - Non-default densities are outside the tables and use the exact path.
+The bounds actually measured when a table is built are stored with it and
+reported by error_bounds.
+"""
+import json
+import math
+import threading
+
+import numpy as np
+
+from .atmosphere import atmospheric_entry
+
+
+class ImpactLookupTables:
+    """Interpolated crater, blast and seismic outputs for instant approximate physics"""
+    
+    # Default grids (log-spaced in diameter and velocity, linear in angle)
+    DIAMETER_RANGE_KM = (0.001, 50.0)
+    VELOCITY_RANGE_KMPS = (11.0, 75.0)
+    ANGLE_RANGE_DEG = (5.0, 90.0)
+    GRID_SHAPE = (96, 32, 18)
+    
+    # Outputs interpolated in log space (strictly positive power laws)
+    LOG_FIELDS = (
+        'crater_diameter_km',
+        'fireball_radius_km',
+        'total_destruction_radius_km',
+        'severe_damage_radius_km',
+        'moderate_damage_radius_km',
+        'thermal_radiation_radius_km',
+    )
+    
+    # Outputs interpolated linearly
+    LINEAR_FIELDS = (
+        'richter_magnitude',
+        'airburst_fraction',
+        'burst_altitude_m',
+        'energy_deposited_fraction',
+    )
+    
+    AIRBURST_RADII = (
+        'total_destruction_radius_km',
+        'severe_damage_radius_km',
+        'moderate_damage_radius_km',
+        'window_breakage_radius_km',
+    )
+    
+    def __init__(self, engine, path=None):
+        """
+        Args:
+            engine: ImpactPhysics instance used to build the tables
+            path: Optional .npz file to load tables from (and save to after a build)
+        """
+        self.engine = engine
+        self.path = path
+        self.tables = None
+        self.axes = None
+        self.error_bounds = None
+        self._lock = threading.Lock()
+    
+    @property
+    def is_ready(self):
+        return self.tables is not None
+    
+    def get(self):
+        """
+        Return the tables, loading or building them on first use
+        
+        A build takes seconds and holds the lock, so servers call this at
+        start-up (gunicorn's when_ready) rather than on a request.
+        """
+        if self.tables is None:
+            with self._lock:
+                if self.tables is None:
+                    if not (self.path and self.load(self.path)):
+                        self.build()
+                        if self.path:
+                            self.save(self.path)
+        return self
+    
+    def build(self, shape=None):
+        """
+        Evaluate the exact vectorized physics over the whole grid
+        
+        Args:
+            shape: Grid shape (n_diameter, n_velocity, n_angle)
+        """
+        n_d, n_v, n_a = shape or self.GRID_SHAPE
+        log_d = np.linspace(*np.log(self.DIAMETER_RANGE_KM), n_d)
+        log_v = np.linspace(*np.log(self.VELOCITY_RANGE_KMPS), n_v)
+        angle = np.linspace(*self.ANGLE_RANGE_DEG, n_a)
+        
+        d, v, a = np.meshgrid(np.exp(log_d), np.exp(log_v), angle, indexing='ij')
+        tables = self._evaluate(d, v, a)
+        
+        for field in self.LOG_FIELDS:
+            tables[field] = np.log(tables[field])
+        
+        axes = (log_d, log_v, angle)
+        self.error_bounds = self.measure_error(tables=tables, axes=axes)
+        self.axes = axes
+        # Published last: readers check tables before using the rest
+        self.tables = tables
+    
+    def _evaluate(self, diameter_km, velocity_kmps, impact_angle):
+        """Exact outputs in table layout (ground and airburst kept separate)"""
+        ground = self.engine.calculate_batch_ground_effects(diameter_km, velocity_kmps, impact_angle)
+        entry = atmospheric_entry.simulate_batch(
+            diameter_km, velocity_kmps, impact_angle, self.engine.ASTEROID_DENSITY
+        )
+        airburst = entry['is_airburst']
+        
+        tables = {field: ground[field] for field in self.LOG_FIELDS}
+        tables['richter_magnitude'] = ground['richter_magnitude']
+        tables['airburst_fraction'] = airburst.astype(float)
+        tables['burst_altitude_m'] = entry['burst_altitude_m']
+        tables['energy_deposited_fraction'] = entry['energy_deposited_fraction']
+        return tables
+    
+    def airburst_radii(self, diameter_km, velocity_kmps, burst_altitude_m):
+        """
+        Airburst overpressure radii from an interpolated burst altitude
+        
+        The radii have a kink where each threshold first reaches the ground,
+        so they are recomputed from burst altitude and energy (both smooth)
+        instead of being interpolated directly.
+        """
+        mass_kg = (4/3) * math.pi * (np.asarray(diameter_km) * 500) ** 3 * self.engine.ASTEROID_DENSITY
+        energy_joules = 0.5 * mass_kg * (np.asarray(velocity_kmps) * 1000) ** 2
+        return atmospheric_entry.ground_overpressure_radii(energy_joules, burst_altitude_m)
+    
+    def covers(self, diameter_km, velocity_kmps, impact_angle):
+        """True if the point lies inside the tabulated grid"""
+        (d_lo, d_hi), (v_lo, v_hi), (a_lo, a_hi) = (
+            self.DIAMETER_RANGE_KM, self.VELOCITY_RANGE_KMPS, self.ANGLE_RANGE_DEG
+        )
+        return (d_lo <= diameter_km <= d_hi and v_lo <= velocity_kmps <= v_hi
+                and a_lo <= impact_angle <= a_hi)
+    
+    def interpolate(self, diameter_km, velocity_kmps, impact_angle, tables=None, axes=None):
+        """
+        Trilinear interpolation of every table at the given points
+        
+        Args:
+            diameter_km, velocity_kmps, impact_angle: scalars or arrays (broadcast)
+            tables, axes: Tables to use instead of the published ones (during a build)
+        
+        Returns:
+            dict: Interpolated outputs (log fields already exponentiated)
+        """
+        if tables is None:
+            tables, axes = self.tables, self.axes
+        
+        coords = np.broadcast_arrays(
+            np.log(np.asarray(diameter_km, dtype=float)),
+            np.log(np.asarray(velocity_kmps, dtype=float)),
+            np.asarray(impact_angle, dtype=float),
+        )
+        
+        # Cell index and fractional position along each uniform axis
+        indices, weights = [], []
+        for axis, x in zip(axes, coords):
+            step = axis[1] - axis[0]
+            pos = np.clip((x - axis[0]) / step, 0, len(axis) - 1)
+            i = np.minimum(pos.astype(int), len(axis) - 2)
+            indices.append(i)
+            weights.append(pos - i)
+        
+        (i, j, k), (wi, wj, wk) = indices, weights
+        result = {}
+        for field, table in tables.items():
+            c00 = table[i, j, k] * (1 - wk) + table[i, j, k + 1] * wk
+            c01 = table[i, j + 1, k] * (1 - wk) + table[i, j + 1, k + 1] * wk
+            c10 = table[i + 1, j, k] * (1 - wk) + table[i + 1, j, k + 1] * wk
+            c11 = table[i + 1, j + 1, k] * (1 - wk) + table[i + 1, j + 1, k + 1] * wk
+            value = (c00 * (1 - wj) + c01 * wj) * (1 - wi) + (c10 * (1 - wj) + c11 * wj) * wi
+            result[field] = np.exp(value) if field in self.LOG_FIELDS else value
+        return result
+    
+    def lookup_effects(self, diameter_km, velocity_kmps, impact_angle):
+        """
+        Approximate crater, blast, seismic and entry results for one body
+        
+        Returns:
+            tuple: (crater, blast, seismic, entry) dicts shaped like the exact path
+        """
+        values = {key: float(value) for key, value in
+                  self.interpolate(diameter_km, velocity_kmps, impact_angle).items()}
+        is_airburst = values['airburst_fraction'] >= 0.5
+        
+        energy = self.engine.calculate_impact_energy(self.engine.calculate_mass(diameter_km), velocity_kmps)
+        energy_megatons = energy['energy_megatons_tnt']
+        
+        crater_diameter_km = 0 if is_airburst else values['crater_diameter_km']
+        crater = {
+            'crater_diameter_km': crater_diameter_km,
+            'crater_diameter_m': crater_diameter_km * 1000,
+            'crater_depth_km': crater_diameter_km / 7,
+            'crater_depth_m': crater_diameter_km / 7 * 1000,
+            'impact_angle': impact_angle,
+            'formed': not is_airburst
+        }
+        
+        blast = {
+            'fireball_radius_km': values['fireball_radius_km'],
+            'total_destruction_radius_km': values['total_destruction_radius_km'],
+            'severe_damage_radius_km': values['severe_damage_radius_km'],
+            'moderate_damage_radius_km': values['moderate_damage_radius_km'],
+            'thermal_radiation_radius_km': values['thermal_radiation_radius_km'],
+            'energy_megatons': energy_megatons
+        }
+        
+        # Same keys as the exact entry model; values the tables do not hold
+        # (breakup and peak-deposition altitudes, ground-impact velocity and
+        # mass) are None
+        initial_energy = energy['energy_joules']
+        deposited_fraction = 1.0 if is_airburst else values['energy_deposited_fraction']
+        entry = {
+            'is_airburst': is_airburst,
+            'breakup_altitude_m': None,
+            'burst_altitude_m': max(values['burst_altitude_m'], 0.0) if is_airburst else 0.0,
+            'peak_deposition_altitude_m': None,
+            'initial_energy_joules': initial_energy,
+            'energy_deposited_joules': initial_energy * deposited_fraction,
+            'energy_deposited_fraction': deposited_fraction,
+            'impact_velocity_kmps': 0.0 if is_airburst else None,
+            'impact_mass_kg': 0.0 if is_airburst else None,
+            'impact_energy_joules': initial_energy * (1 - deposited_fraction),
+        }
+        if is_airburst:
+            radii = self.airburst_radii(diameter_km, velocity_kmps, entry['burst_altitude_m'])
+            for key in self.AIRBURST_RADII:
+                entry[key] = blast[key] = float(radii[key])
+            blast['burst_altitude_km'] = entry['burst_altitude_m'] / 1000
+        else:
+            for key in self.AIRBURST_RADII:
+                entry[key] = None
+        
+        magnitude = values['richter_magnitude']
+        seismic = {
+            'richter_magnitude': magnitude,
+            'seismic_radius_km': magnitude * 100,
+            'description': self.engine._get_seismic_description(magnitude)
+        }
+        
+        return crater, blast, seismic, entry
+    
+    def measure_error(self, samples=20000, seed=0, tables=None, axes=None):
+        """
+        Compare interpolated outputs with the exact path at random points
+        
+        tables and axes default to the published tables.
+        
+        Returns:
+            dict: Relative error statistics per output
+        """
+        rng = np.random.default_rng(seed)
+        d = np.exp(rng.uniform(*np.log(self.DIAMETER_RANGE_KM), samples))
+        v = np.exp(rng.uniform(*np.log(self.VELOCITY_RANGE_KMPS), samples))
+        a = rng.uniform(*self.ANGLE_RANGE_DEG, samples)
+        
+        exact = self._evaluate(d, v, a)
+        approx = self.interpolate(d, v, a, tables, axes)
+        exact_airburst = exact['airburst_fraction'] >= 0.5
+        approx_airburst = approx['airburst_fraction'] >= 0.5
+        agree = exact_airburst == approx_airburst
+        
+        bounds = {'airburst_classification_agreement': float(agree.mean())}
+        for field in self.LOG_FIELDS + ('richter_magnitude',):
+            rel = np.abs(approx[field] / exact[field] - 1)
+            bounds[field] = self._summarize(rel)
+        
+        # Airburst outputs, where both paths agree the body bursts
+        both = agree & exact_airburst
+        altitude_error_km = np.abs(approx['burst_altitude_m'] - exact['burst_altitude_m'])[both] / 1000
+        bounds['burst_altitude_abs_error_km'] = self._summarize(altitude_error_km)
+        
+        exact_radii = self.airburst_radii(d, v, exact['burst_altitude_m'])
+        approx_radii = self.airburst_radii(d, v, np.maximum(approx['burst_altitude_m'], 0.0))
+        for key in self.AIRBURST_RADII:
+            mask = both & (exact_radii[key] > 0)
+            rel = np.abs(approx_radii[key][mask] / exact_radii[key][mask] - 1)
+            bounds['airburst_' + key] = self._summarize(rel)
+        return bounds
+    
+    def _summarize(self, rel):
+        if rel.size == 0:
+            return {'median': 0.0, 'p95': 0.0, 'max': 0.0}
+        return {
+            'median': float(np.median(rel)),
+            'p95': float(np.percentile(rel, 95)),
+            'max': float(rel.max())
+        }
+    
+    def save(self, path):
+        """Write the tables to a compressed .npz file"""
+        np.savez_compressed(
+            path,
+            axis_log_diameter=self.axes[0],
+            axis_log_velocity=self.axes[1],
+            axis_angle=self.axes[2],
+            error_bounds=np.array(json.dumps(self.error_bounds)),
+            **{'table_' + field: table for field, table in self.tables.items()}
+        )
+    
+    def load(self, path):
+        """
+        Load tables from a .npz file written by save()
+        
+        Returns:
+            bool: True if the file existed and was loaded
+        """
+        try:
+            data = np.load(path)
+        except (OSError, ValueError):
+            return False
+        
+        with data:
+            axes = (data['axis_log_diameter'], data['axis_log_velocity'], data['axis_angle'])
+            tables = {
+                key[len('table_'):]: data[key] for key in data.files if key.startswith('table_')
+            }
+            error_bounds = json.loads(str(data['error_bounds']))
+        self.DIAMETER_RANGE_KM = tuple(math.exp(x) for x in (axes[0][0], axes[0][-1]))
+        self.VELOCITY_RANGE_KMPS = tuple(math.exp(x) for x in (axes[1][0], axes[1][-1]))
+        self.ANGLE_RANGE_DEG = (float(axes[2][0]), float(axes[2][-1]))
+        self.axes = axes
+        self.error_bounds = error_bounds
+        # Published last: readers check tables before using the ranges and axes
+        self.tables = tables
+        return True
@@ -0,0 +1,109 @@
+"""
+Compare JSON and columnar catalog encodings (payload size, encode/decode time)
+
+Usage: python manage.py benchmark_catalog_formats --count 5000
+"""
+import gzip
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.catalog import NEOCatalog
+from api.nasa_api import nasa_api
+
+
+def _synthetic_neo(index, rng):
+    """Raw NASA NEO record with realistic field formats"""
+    diameter_min = 10 ** rng.uniform(-2.5, 0.5)
+    velocity = rng.uniform(3, 40)
+    miss_au = rng.uniform(0.001, 0.5)
+    a = rng.uniform(0.6, 4.0)
+    e = rng.uniform(0.0, 0.9)
+    return {
+        'id': str(2000000 + index),
+        'name': f'({1990 + index % 35} {chr(65 + index % 26)}{chr(65 + index // 26 % 26)}{index % 100})',
+        'nasa_jpl_url': f'https://ssd.jpl.nasa.gov/tools/sbdb_lookup.html#/?sstr={2000000 + index}',
+        'absolute_magnitude_h': round(rng.uniform(14, 32), 2),
+        'is_potentially_hazardous_asteroid': rng.random() < 0.15,
+        'estimated_diameter': {'kilometers': {
+            'estimated_diameter_min': diameter_min,
+            'estimated_diameter_max': diameter_min * 2.236,
+        }},
+        'close_approach_data': [{
+            'close_approach_date': '2025-10-%02d' % (index % 28 + 1),
+            'close_approach_date_full': '2025-Oct-%02d 12:34' % (index % 28 + 1),
+            'relative_velocity': {
+                'kilometers_per_second': repr(velocity),
+                'kilometers_per_hour': repr(velocity * 3600),
+                'miles_per_hour': repr(velocity * 2236.94),
+            },
+            'miss_distance': {
+                'astronomical': repr(miss_au),
+                'lunar': repr(miss_au * 389.17),
+                'kilometers': repr(miss_au * 149597870.7),
+            },
+            'orbiting_body': 'Earth',
+        }],
+        'orbital_data': {
+            'orbit_id': str(rng.randint(1, 400)),
+            'orbit_determination_date': '2025-06-01 06:12:45',
+            'orbit_uncertainty': str(rng.randint(0, 9)),
+            'semi_major_axis': repr(a),
+            'eccentricity': repr(e),
+            'inclination': repr(rng.uniform(0, 40)),
+            'ascending_node_longitude': repr(rng.uniform(0, 360)),
+            'orbital_period': repr(365.25 * a ** 1.5),
+            'perihelion_distance': repr(a * (1 - e)),
+            'aphelion_distance': repr(a * (1 + e)),
+            'perihelion_argument': repr(rng.uniform(0, 360)),
+            'mean_anomaly': repr(rng.uniform(0, 360)),
+        },
+    }
+
+
+class Command(BaseCommand):
+    help = 'Benchmark JSON vs columnar encoding of the asteroid catalog'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=5000, help='Number of asteroids')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Timing repetitions (best is reported)')
+        parser.add_argument('--seed', type=int, default=0)
+    
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        records = [
+            nasa_api._extract_asteroid_info(_synthetic_neo(i, rng))
+            for i in range(options['count'])
+        ]
+        payload = {'count': len(records), 'asteroids': [record.to_dict() for record in records]}
+        
+        def best(function):
+            timings = []
+            for _ in range(options['repeat']):
+                start = time.perf_counter()
+                output = function()
+                timings.append(time.perf_counter() - start)
+            return min(timings), output
+        
+        build_time, catalog = best(lambda: NEOCatalog.from_records(records))
+        
+        json_encode, json_bytes = best(lambda: json.dumps(payload).encode('utf-8'))
+        json_decode, _ = best(lambda: json.loads(json_bytes))
+        
+        rows = [('json', len(json_bytes), len(gzip.compress(json_bytes)), json_encode, json_decode)]
+        for label, float_dtype in (('columnar', '<f8'), ('columnar f32', '<f4')):
+            encode, encoded = best(lambda: catalog.to_columnar_bytes(float_dtype))
+            decode, _ = best(lambda: NEOCatalog.from_columnar(encoded))
+            rows.append((label, len(encoded), len(gzip.compress(encoded)), encode, decode))
+        
+        self.stdout.write(
+            f"{options['count']} asteroids (catalog build from dicts: {build_time * 1000:.1f} ms)"
+        )
+        self.stdout.write(f"{'format':<14}{'bytes':>12}{'gzip':>12}{'encode ms':>12}{'decode ms':>12}")
+        for label, size, gzipped, encode, decode in rows:
+            self.stdout.write(
+                f'{label:<14}{size:>12,}{gzipped:>12,}{encode * 1000:>12.2f}{decode * 1000:>12.2f}'
+            )
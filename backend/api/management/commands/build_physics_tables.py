@@ -0,0 +1,39 @@
+"""
+Build the impact physics lookup tables and write them to a file
+
+Usage: python manage.py build_physics_tables --output physics_tables.npz
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.lookup_tables import ImpactLookupTables
+from api.physics import physics_engine
+
+
+class Command(BaseCommand):
+    help = 'Precompute the crater/blast/seismic lookup tables used by table mode'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.PHYSICS_TABLE_PATH,
+                            help='Destination .npz file (default: PHYSICS_TABLE_PATH)')
+        parser.add_argument('--shape', type=int, nargs=3, metavar=('N_DIAMETER', 'N_VELOCITY', 'N_ANGLE'),
+                            help='Grid shape (default: %s)' % (ImpactLookupTables.GRID_SHAPE,))
+    
+    def handle(self, *args, **options):
+        output = options['output']
+        if not output:
+            raise CommandError('No output file: pass --output or set PHYSICS_TABLE_PATH')
+        
+        tables = ImpactLookupTables(physics_engine)
+        tables.build(shape=options['shape'])
+        tables.save(output)
+        
+        self.stdout.write(self.style.SUCCESS(f'Wrote lookup tables to {output}'))
+        for field, bounds in tables.error_bounds.items():
+            if isinstance(bounds, dict):
+                self.stdout.write(
+                    f"  {field}: median {bounds['median']:.2e}, "
+                    f"p95 {bounds['p95']:.2e}, max {bounds['max']:.2e}"
+                )
+            else:
+                self.stdout.write(f'  {field}: {bounds:.4f}')
@@ -0,0 +1,37 @@
+"""
+Write the local NEO catalog to a snapshot file for warm starts
+
+Usage: python manage.py export_catalog --output catalog.neos --max-pages 0
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.catalog_store import catalog_store
+
+
+class Command(BaseCommand):
+    help = 'Sync the asteroid catalog (unless a snapshot is already loaded) and save it as a snapshot file'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.NEO_CATALOG_SNAPSHOT_PATH,
+                            help='Destination file (default: NEO_CATALOG_SNAPSHOT_PATH)')
+        parser.add_argument('--max-pages', type=int, default=None,
+                            help='Browse pages to sync (0 = whole catalog, default: NEO_CATALOG_SYNC_PAGES)')
+        parser.add_argument('--sync', action='store_true',
+                            help='Sync from NASA even if a snapshot was loaded at startup')
+    
+    def handle(self, *args, **options):
+        output = options['output']
+        if not output:
+            raise CommandError('No output file: pass --output or set NEO_CATALOG_SNAPSHOT_PATH')
+        
+        if catalog_store.index is None or options['sync']:
+            sync = catalog_store.sync(max_pages=options['max_pages'])
+            if 'error' in sync:
+                raise CommandError(sync['error'])
+            self.stdout.write(f"Synced {sync['asteroids']} asteroids from {sync['pages']} pages")
+        
+        written = catalog_store.save_snapshot(output)
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {len(catalog_store.index.catalog)} asteroids to {output} ({written / 1e6:.1f} MB)'
+        ))
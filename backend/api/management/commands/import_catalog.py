@@ -0,0 +1,57 @@
+"""
+Install a catalog snapshot file as the one workers load at startup and swap to
+
+Usage: python manage.py import_catalog catalog.neos
+"""
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.catalog_snapshot import load_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Validate a catalog snapshot and copy it to NEO_CATALOG_SNAPSHOT_PATH'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('snapshot', help='Snapshot file written by export_catalog')
+        parser.add_argument('--output', default=settings.NEO_CATALOG_SNAPSHOT_PATH,
+                            help='Installed location (default: NEO_CATALOG_SNAPSHOT_PATH)')
+    
+    def handle(self, *args, **options):
+        source, output = options['snapshot'], options['output']
+        if not output:
+            raise CommandError('No destination: pass --output or set NEO_CATALOG_SNAPSHOT_PATH')
+        
+        try:
+            index, header = load_snapshot(source)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Invalid snapshot {source}: {e}')
+        count = len(index.catalog)
+        del index
+        
+        if os.path.abspath(source) != os.path.abspath(output):
+            # Copy beside the destination, then rename over it, so running
+            # workers never map a half-written file
+            descriptor, temporary = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(output)), prefix='.catalog-', suffix='.tmp'
+            )
+            os.close(descriptor)
+            try:
+                shutil.copyfile(source, temporary)
+                os.chmod(temporary, 0o644)
+                os.replace(temporary, output)
+            except OSError as e:
+                os.unlink(temporary)
+                raise CommandError(f'Could not install snapshot: {e}')
+        
+        synced_at = header['metadata'].get('synced_at')
+        self.stdout.write(self.style.SUCCESS(
+            f'Installed {count} asteroids at {output}'
+            + (f' (synced {datetime.fromtimestamp(synced_at).isoformat(timespec="seconds")})' if synced_at else '')
+            + f'; running workers map it within {settings.NEO_CATALOG_SNAPSHOT_CHECK}s'
+        ))
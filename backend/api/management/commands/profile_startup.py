@@ -0,0 +1,125 @@
+"""
+Measure cold start: Django setup, time to first response and per-module
+import cost, checked against a start-up budget
+
+Usage: python manage.py profile_startup --url /api/health --top 20 --budget-ms 1000
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Runs in a fresh interpreter: set up Django, then answer one GET through
+# the WSGI handler (no test client, whose imports would be counted)
+_PROBE = '''
+import io, json, sys, time
+started = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+setup = time.perf_counter()
+if sys.argv[2] == "preload":
+    from api.lazy import warm_up
+    warm_up()
+warmed = time.perf_counter()
+path, _, query = sys.argv[1].partition("?")
+statuses = []
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": query,
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "HTTP_HOST": "localhost",
+    "wsgi.input": io.BytesIO(), "wsgi.url_scheme": "http", "wsgi.errors": sys.stderr,
+}
+b"".join(application(environ, lambda status, headers, exc_info=None: statuses.append(status)))
+done = time.perf_counter()
+print(json.dumps({
+    "setup_ms": (setup - started) * 1000,
+    "preload_ms": (warmed - setup) * 1000,
+    "first_response_ms": (done - warmed) * 1000,
+    "status": statuses[0] if statuses else None,
+    "numpy": "numpy" in sys.modules,
+    "modules": len(sys.modules),
+}))
+'''
+
+
+class Command(BaseCommand):
+    help = 'Profile process start-up and the first response, and fail if it is over the start-up budget'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='/api/health', help='Path of the first request')
+        parser.add_argument('--top', type=int, default=20, help='Slowest modules and packages to list')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Timed runs; the fastest is compared with the budget')
+        parser.add_argument('--budget-ms', type=float, default=settings.STARTUP_BUDGET_MS,
+                            help='Budget for setup + first response (default: STARTUP_BUDGET_MS, 0 = no check)')
+        parser.add_argument('--preload', action='store_true',
+                            help='Import everything deferred before the request, as the gunicorn master does')
+    
+    def handle(self, *args, **options):
+        mode = 'preload' if options['preload'] else 'cold'
+        
+        # Timed runs without -X importtime, whose bookkeeping slows imports down
+        runs = [self._probe(options['url'], mode)[0] for _ in range(max(options['repeat'], 1))]
+        best = min(runs, key=lambda run: run['setup_ms'] + run['preload_ms'] + run['first_response_ms'])
+        total = best['setup_ms'] + best['first_response_ms']
+        
+        _, imports = self._probe(options['url'], mode, importtime=True)
+        self._report_imports(imports, options['top'])
+        
+        self.stdout.write('')
+        self.stdout.write(f"Django setup:   {best['setup_ms']:8.1f} ms")
+        if options['preload']:
+            self.stdout.write(f"Preload:        {best['preload_ms']:8.1f} ms (before fork, not counted)")
+        self.stdout.write(
+            f"First response: {best['first_response_ms']:8.1f} ms "
+            f"(GET {options['url']} -> {best['status']}, numpy {'loaded' if best['numpy'] else 'not loaded'})"
+        )
+        self.stdout.write(f"Total:          {total:8.1f} ms, {best['modules']} modules "
+                          f"(fastest of {len(runs)} runs)")
+        
+        budget = options['budget_ms']
+        if budget:
+            if total > budget:
+                raise CommandError(f'Start-up took {total:.0f} ms, over the {budget:.0f} ms budget')
+            self.stdout.write(self.style.SUCCESS(f'Within the {budget:.0f} ms start-up budget'))
+    
+    def _probe(self, url, mode, importtime=False):
+        """Run _PROBE in a new interpreter; returns (timings, [(module, self_us, cumulative_us)])"""
+        command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', _PROBE, url, mode]
+        environ = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get(
+            'DJANGO_SETTINGS_MODULE', 'backend.settings'
+        ))
+        result = subprocess.run(command, cwd=settings.BASE_DIR, env=environ,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise CommandError(f'Start-up probe failed:\n{result.stderr[-2000:]}')
+        
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            self_us, cumulative_us, module = line[len('import time:'):].split('|')
+            if self_us.strip().isdigit():
+                imports.append((module.strip(), int(self_us), int(cumulative_us)))
+        return json.loads(result.stdout.strip().splitlines()[-1]), imports
+    
+    def _report_imports(self, imports, top):
+        packages = defaultdict(int)
+        for module, self_us, _ in imports:
+            packages[module.split('.')[0]] += self_us
+        
+        self.stdout.write(f"Imports: {len(imports)} modules, {sum(packages.values()) / 1000:.1f} ms "
+                          f"(with -X importtime overhead)")
+        self.stdout.write('')
+        self.stdout.write(f"{'package':<40}{'self ms':>10}")
+        for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f'{package:<40}{self_us / 1000:>10.1f}')
+        
+        self.stdout.write('')
+        self.stdout.write(f"{'module':<40}{'self ms':>10}{'cumul. ms':>12}")
+        for module, self_us, cumulative_us in sorted(imports, key=lambda item: -item[1])[:top]:
+            self.stdout.write(f'{module:<40}{self_us / 1000:>10.1f}{cumulative_us / 1000:>12.1f}')
@@ -0,0 +1,26 @@
+"""
+Score the NEO catalog into the ThreatScore table
+
+Usage: python manage.py rank_threats --max-pages 0
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from api.catalog_store import catalog_store
+from api.threats import threat_ranker
+
+
+class Command(BaseCommand):
+    help = 'Sync the asteroid catalog from NASA and rebuild the threat ranking'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--max-pages', type=int, default=None,
+                            help='Browse pages to sync (0 = whole catalog, default: NEO_CATALOG_SYNC_PAGES)')
+    
+    def handle(self, *args, **options):
+        sync = catalog_store.sync(max_pages=options['max_pages'])
+        if 'error' in sync:
+            raise CommandError(sync['error'])
+        self.stdout.write(f"Synced {sync['asteroids']} asteroids from {sync['pages']} pages")
+        
+        result = threat_ranker.rank(catalog_store.index)
+        self.stdout.write(self.style.SUCCESS(f"Ranked {result['ranked']} asteroids"))
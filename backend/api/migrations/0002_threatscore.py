@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThreatScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asteroid_id', models.CharField(max_length=20, unique=True)),
+                ('name', models.CharField(max_length=255)),
+                ('is_potentially_hazardous', models.BooleanField(default=False)),
+                ('diameter_km', models.FloatField()),
+                ('velocity_kmps', models.FloatField()),
+                ('miss_distance_km', models.FloatField()),
+                ('close_approach_date', models.DateField(blank=True, null=True)),
+                ('mass_kg', models.FloatField()),
+                ('energy_megatons_tnt', models.FloatField()),
+                ('is_airburst', models.BooleanField(default=False)),
+                ('severity', models.CharField(max_length=100)),
+                ('severity_level', models.PositiveSmallIntegerField()),
+                ('encounter_probability', models.FloatField()),
+                ('palermo_scale', models.FloatField()),
+                ('torino_scale', models.PositiveSmallIntegerField()),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['-palermo_scale', 'asteroid_id'],
+                'indexes': [models.Index(fields=['-palermo_scale', 'asteroid_id'], name='threat_rank_idx'), models.Index(fields=['is_potentially_hazardous', '-palermo_scale', 'asteroid_id'], name='threat_rank_pha_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_threatscore'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(db_index=True)),
+                ('asteroid_id', models.CharField(max_length=20)),
+                ('change', models.CharField(choices=[('added', 'Added'), ('updated', 'Updated'), ('removed', 'Removed')], max_length=10)),
+                ('fields', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CatalogEntry',
+            fields=[
+                ('asteroid_id', models.CharField(max_length=20, primary_key=True, serialize=False)),
+                ('orbit_id', models.CharField(blank=True, max_length=20)),
+                ('close_approach_date', models.CharField(blank=True, max_length=10)),
+                ('is_potentially_hazardous', models.BooleanField(default=False)),
+                ('version', models.PositiveBigIntegerField()),
+            ],
+        ),
+    ]
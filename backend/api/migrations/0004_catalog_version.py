@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:30
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def create_counter(apps, schema_editor):
+    # Continue from the versions already recorded
+    CatalogChange = apps.get_model('api', 'CatalogChange')
+    CatalogVersion = apps.get_model('api', 'CatalogVersion')
+    latest = CatalogChange.objects.aggregate(version=Max('version'))['version'] or 0
+    CatalogVersion.objects.create(pk=1, version=latest)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_catalog_changes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_counter, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,173 @@
+import uuid
+
 from django.db import models
 
 # Create your models here.
+
+
+class SimulationJob(models.Model):
+    """Long-running simulation executed by the in-process job queue (api.jobs)"""
+    
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+        (CANCELLED, 'Cancelled'),
+    ]
+    FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=50)
+    params = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    progress = models.FloatField(default=0.0)
+    message = models.CharField(max_length=255, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f'{self.kind} {self.id} ({self.status})'
+    
+    def to_status_dict(self):
+        """Status fields returned to polling clients (without the result payload)"""
+        return {
+            'id': str(self.id),
+            'kind': self.kind,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'error': self.error or None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None,
+        }
+
+
+class ThreatScore(models.Model):
+    """Precomputed consequence ranking of one cataloged asteroid (api.threats)"""
+    
+    asteroid_id = models.CharField(max_length=20, unique=True)
+    name = models.CharField(max_length=255)
+    is_potentially_hazardous = models.BooleanField(default=False)
+    diameter_km = models.FloatField()
+    velocity_kmps = models.FloatField()
+    miss_distance_km = models.FloatField()
+    close_approach_date = models.DateField(null=True, blank=True)
+    mass_kg = models.FloatField()
+    energy_megatons_tnt = models.FloatField()
+    is_airburst = models.BooleanField(default=False)
+    severity = models.CharField(max_length=100)
+    severity_level = models.PositiveSmallIntegerField()
+    encounter_probability = models.FloatField()
+    palermo_scale = models.FloatField()
+    torino_scale = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField()
+    
+    class Meta:
+        ordering = ['-palermo_scale', 'asteroid_id']
+        indexes = [
+            # Keyset pagination of /api/asteroids/top-threats
+            models.Index(fields=['-palermo_scale', 'asteroid_id'], name='threat_rank_idx'),
+            models.Index(
+                fields=['is_potentially_hazardous', '-palermo_scale', 'asteroid_id'],
+                name='threat_rank_pha_idx'
+            ),
+        ]
+    
+    def __str__(self):
+        return f'{self.name} (Palermo {self.palermo_scale:.2f})'
+    
+    def to_dict(self):
+        return {
+            'asteroid_id': self.asteroid_id,
+            'name': self.name,
+            'is_potentially_hazardous': self.is_potentially_hazardous,
+            'diameter_km': self.diameter_km,
+            'velocity_kmps': self.velocity_kmps,
+            'miss_distance_km': self.miss_distance_km,
+            'close_approach_date': self.close_approach_date.isoformat() if self.close_approach_date else None,
+            'mass_kg': self.mass_kg,
+            'energy_megatons_tnt': self.energy_megatons_tnt,
+            'is_airburst': self.is_airburst,
+            'severity': self.severity,
+            'severity_level': self.severity_level,
+            'encounter_probability': self.encounter_probability,
+            'palermo_scale': self.palermo_scale,
+            'torino_scale': self.torino_scale,
+            'computed_at': self.computed_at.isoformat(),
+        }
+
+
+class CatalogEntry(models.Model):
+    """Tracked fields of one asteroid as of the last catalog sync (api.catalog_changes)"""
+    
+    asteroid_id = models.CharField(max_length=20, primary_key=True)
+    orbit_id = models.CharField(max_length=20, blank=True)
+    close_approach_date = models.CharField(max_length=10, blank=True)
+    is_potentially_hazardous = models.BooleanField(default=False)
+    version = models.PositiveBigIntegerField()
+    
+    def __str__(self):
+        return f'{self.asteroid_id} (v{self.version})'
+
+
+class CatalogVersion(models.Model):
+    """
+    Last catalog version recorded (single row); a sync locks it while it
+    diffs and writes, so concurrent syncs take distinct versions in turn
+    """
+    
+    version = models.PositiveBigIntegerField(default=0)
+    
+    def __str__(self):
+        return f'v{self.version}'
+
+
+class CatalogChange(models.Model):
+    """One asteroid added, updated or removed by the sync that produced a catalog version"""
+    
+    ADDED = 'added'
+    UPDATED = 'updated'
+    REMOVED = 'removed'
+    CHANGE_CHOICES = [
+        (ADDED, 'Added'),
+        (UPDATED, 'Updated'),
+        (REMOVED, 'Removed'),
+    ]
+    
+    version = models.PositiveBigIntegerField(db_index=True)
+    asteroid_id = models.CharField(max_length=20)
+    change = models.CharField(max_length=10, choices=CHANGE_CHOICES)
+    # {field: [old, new]} for the tracked fields that differ
+    fields = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['id']
+    
+    def __str__(self):
+        return f'v{self.version} {self.change} {self.asteroid_id}'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'version': self.version,
+            'asteroid_id': self.asteroid_id,
+            'change': self.change,
+            'fields': self.fields,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
@@ -0,0 +1,229 @@
+"""
+Asteroid Name Index
+In-memory autocomplete over catalog names and designations: a sorted token
+list for prefix matches plus a trigram index for typo-tolerant matches
+"""
+import bisect
+import re
+import threading
+from collections import Counter, defaultdict
+
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_DESIGNATION = re.compile(r'\(([^)]*)\)')
+
+
+def tokenize(name):
+    """
+    Lower-case alphanumeric tokens of a name
+    
+    Parenthesised designations also yield their tokens joined, so
+    "(2024 YR4)" can be found as "2024 yr4" or "2024yr4".
+    """
+    name = name.lower()
+    tokens = _TOKEN.findall(name)
+    for designation in _DESIGNATION.findall(name):
+        tokens.append(''.join(_TOKEN.findall(designation)))
+    return [token for token in dict.fromkeys(tokens) if token]
+
+
+def _trigrams(token, closed=True):
+    """Trigrams of a padded token (closed=False leaves out the end-of-word ones)"""
+    padded = f'  {token} ' if closed else f'  {token}'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a, b, limit, prefix=False):
+    """
+    Edit distance counting an adjacent transposition as one edit
+    (optimal string alignment), or limit + 1 once it must exceed limit
+    
+    With prefix=True, the distance from a to the closest prefix of b.
+    """
+    if prefix:
+        b = b[:len(a) + limit]
+    elif abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before, previous = None, list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous) if prefix else previous[-1]
+
+
+class NameIndex:
+    """Prefix and fuzzy name lookup, updated in place as the catalog changes"""
+    
+    # Candidates examined per prefix query before ranking (keeps short prefixes cheap)
+    PREFIX_SCAN_LIMIT = 200
+    # Trigram candidates checked with edit distance per fuzzy query
+    FUZZY_CANDIDATES = 200
+    # Shortest query word matched fuzzily
+    FUZZY_MIN_LENGTH = 5
+    
+    def __init__(self):
+        self._names = {}
+        self._tokens = {}
+        self._token_ids = defaultdict(set)
+        self._sorted_tokens = []
+        self._trigram_tokens = defaultdict(set)
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._names)
+    
+    def update(self, entries):
+        """
+        Bring the index in line with a new catalog, touching only changed names
+        
+        Args:
+            entries: Iterable of (asteroid_id, name) for the whole catalog
+        
+        Returns:
+            dict: Counts of added, removed and renamed asteroids
+        """
+        entries = {str(asteroid_id): name for asteroid_id, name in entries if name}
+        with self._lock:
+            removed = [i for i in self._names if i not in entries]
+            renamed = [i for i, name in entries.items() if i in self._names and self._names[i] != name]
+            added = [i for i in entries if i not in self._names]
+            
+            for asteroid_id in removed + renamed:
+                self._remove(asteroid_id)
+            for asteroid_id in renamed + added:
+                self._add(asteroid_id, entries[asteroid_id])
+        
+        return {'added': len(added), 'removed': len(removed), 'renamed': len(renamed)}
+    
+    def _add(self, asteroid_id, name):
+        tokens = tokenize(name)
+        self._names[asteroid_id] = name
+        self._tokens[asteroid_id] = tokens
+        for token in tokens:
+            ids = self._token_ids[token]
+            if not ids:
+                bisect.insort(self._sorted_tokens, token)
+                for trigram in _trigrams(token):
+                    self._trigram_tokens[trigram].add(token)
+            ids.add(asteroid_id)
+    
+    def _remove(self, asteroid_id):
+        del self._names[asteroid_id]
+        for token in self._tokens.pop(asteroid_id):
+            ids = self._token_ids[token]
+            ids.discard(asteroid_id)
+            if not ids:
+                del self._token_ids[token]
+                del self._sorted_tokens[bisect.bisect_left(self._sorted_tokens, token)]
+                for trigram in _trigrams(token):
+                    self._trigram_tokens[trigram].discard(token)
+    
+    def search(self, query, limit=10, fuzzy=True):
+        """
+        Autocomplete a name or designation
+        
+        Every query token must prefix-match a token of the name. Exact token
+        matches rank above prefix matches, then shorter names come first.
+        When fewer than limit names match and fuzzy is set, the most
+        selective query word is also matched within a small edit distance
+        (1 for 5-8 characters, 2 for longer). Words containing digits are
+        numbers or designations, where a near miss is a different asteroid,
+        so they are never fuzzed.
+        
+        Args:
+            query: Text typed so far
+            limit: Maximum results
+            fuzzy: Allow typo-tolerant matches
+        
+        Returns:
+            list: {'id', 'name', 'match' ('exact' | 'prefix' | 'fuzzy'), 'distance'}
+                  dicts, best first
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        
+        with self._lock:
+            # Drive the lookup from the word with the fewest prefix tokens
+            position = min(range(len(terms)), key=lambda i: self._prefix_count(terms[i]))
+            key = terms[position]
+            others = terms[:position] + terms[position + 1:]
+            
+            results = {}
+            for token in self._prefix_tokens(key):
+                for asteroid_id in self._token_ids[token]:
+                    if asteroid_id not in results and self._matches(asteroid_id, others):
+                        results[asteroid_id] = ('exact' if token == key else 'prefix', 0)
+                if len(results) >= self.PREFIX_SCAN_LIMIT:
+                    break
+            
+            if fuzzy and len(results) < limit:
+                for token, distance in self._fuzzy_tokens(key):
+                    for asteroid_id in self._token_ids[token]:
+                        if asteroid_id not in results and self._matches(asteroid_id, others):
+                            results[asteroid_id] = ('fuzzy', distance)
+            
+            ranked = sorted(
+                results.items(),
+                key=lambda item: (
+                    item[1][1], item[1][0] != 'exact', len(self._names[item[0]]), self._names[item[0]]
+                )
+            )
+            return [
+                {'id': asteroid_id, 'name': self._names[asteroid_id], 'match': match, 'distance': distance}
+                for asteroid_id, (match, distance) in ranked[:limit]
+            ]
+    
+    def _prefix_count(self, prefix):
+        tokens = self._sorted_tokens
+        return (
+            bisect.bisect_left(tokens, prefix + '\x7f') - bisect.bisect_left(tokens, prefix)
+        )
+    
+    def _prefix_tokens(self, prefix):
+        tokens = self._sorted_tokens
+        index = bisect.bisect_left(tokens, prefix)
+        while index < len(tokens) and tokens[index].startswith(prefix):
+            yield tokens[index]
+            index += 1
+    
+    def _matches(self, asteroid_id, terms):
+        tokens = self._tokens[asteroid_id]
+        return all(any(token.startswith(term) for token in tokens) for term in terms)
+    
+    def _fuzzy_tokens(self, term):
+        """(token, distance) pairs within the edit-distance allowance of term"""
+        if len(term) < self.FUZZY_MIN_LENGTH or not term.isalpha():
+            return []
+        allowed = 1 if len(term) <= 8 else 2
+        
+        # One edit (or transposition) changes at most 4 trigrams, so any match
+        # shares at least one of the term's 4 * allowed + 1 rarest trigrams
+        trigrams = sorted(
+            _trigrams(term, closed=False),
+            key=lambda trigram: len(self._trigram_tokens.get(trigram, ()))
+        )
+        counts = Counter()
+        for trigram in trigrams[:4 * allowed + 1]:
+            counts.update(self._trigram_tokens.get(trigram, ()))
+        matches = []
+        distances = {}  # Tokens often share the compared prefix
+        for token, _ in counts.most_common(self.FUZZY_CANDIDATES):
+            # Distance to a prefix of the token, so partly typed words still match
+            head = token[:len(term) + allowed]
+            if head not in distances:
+                distances[head] = _edit_distance(term, head, allowed, prefix=True)
+            if distances[head] <= allowed:
+                matches.append((token, distances[head]))
+        return matches
@@ -2,28 +2,295 @@
 NASA Near Earth Object (NEO) API Integration
 Person 1: Fetch live NEO data (size, velocity, trajectory)
 """
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from datetime import datetime, timedelta
 from django.conf import settings
 
+from .json_stream import JSONStream
+from .result_cache import ResultCache
+
+
+class NEORecord:
+    """
+    Compact parsed asteroid
+    
+    Keeps the NASA values it needs in slots and converts on access: velocity
+    and miss-distance strings become floats when read, and the orbital
+    elements are only parsed to floats the first time orbital_elements is
+    used. Supports read-only dict access (record['diameter_km'],
+    record.get(...), 'key' in record) for existing callers; to_dict() builds
+    the JSON shape at the API edge.
+    """
+    
+    __slots__ = (
+        'id', 'name', 'nasa_jpl_url', 'absolute_magnitude', 'is_potentially_hazardous',
+        'diameter_min_km', 'diameter_max_km',
+        '_velocity', '_miss_distance',
+        'close_approach_date', 'close_approach_date_full', 'orbiting_body',
+        '_orbital', '_orbital_elements',
+    )
+    
+    # Orbital element keys, in NASA's orbital_data naming
+    ORBITAL_FIELDS = (
+        'orbit_id', 'orbit_determination_date', 'orbit_uncertainty',
+        'semi_major_axis', 'eccentricity', 'inclination', 'ascending_node_longitude',
+        'orbital_period', 'perihelion_distance', 'aphelion_distance',
+        'perihelion_argument', 'mean_anomaly',
+    )
+    # Orbital elements that orbital_elements parses to floats
+    NUMERIC_ORBITAL_FIELDS = ORBITAL_FIELDS[3:]
+    
+    # Keys of to_dict(), in output order
+    FIELDS = (
+        'id', 'name', 'nasa_jpl_url', 'absolute_magnitude', 'is_potentially_hazardous',
+        'diameter_km', 'diameter_min_km', 'diameter_max_km', 'diameter_meters',
+        'velocity_kmps', 'velocity_kmph', 'velocity_mph',
+        'miss_distance_km', 'miss_distance_lunar', 'miss_distance_au',
+        'close_approach_date', 'close_approach_date_full', 'orbiting_body',
+        'orbital_data',
+    )
+    
+    _NO_ORBIT = (None,) * len(ORBITAL_FIELDS)
+    
+    @classmethod
+    def parse_fields(cls, spec):
+        """
+        Parse a ?fields= projection ("name,diameter_km,...")
+        
+        Args:
+            spec: Comma-separated field names, or None/'' for all fields
+        
+        Returns:
+            tuple: Requested fields in output order, or None for all fields
+        
+        Raises:
+            ValueError: Unknown field name
+        """
+        if not spec:
+            return None
+        requested = {name.strip() for name in spec.split(',') if name.strip()}
+        unknown = requested.difference(cls.FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(sorted(unknown))}. "
+                f"Available: {', '.join(cls.FIELDS)}"
+            )
+        return tuple(name for name in cls.FIELDS if name in requested) or None
+    
+    @classmethod
+    def from_nasa(cls, asteroid, fields=None):
+        """
+        Build a record from a raw NASA NEO object
+        
+        Args:
+            asteroid: Raw NEO object
+            fields: Optional projection (parse_fields); orbital elements are
+                    not extracted unless 'orbital_data' is in it
+        """
+        record = cls.__new__(cls)
+        
+        # Get close approach data
+        close_approach_data = asteroid.get('close_approach_data', [])
+        next_approach = close_approach_data[0] if close_approach_data else {}
+        
+        # Get size estimates
+        diameter_km = asteroid.get('estimated_diameter', {}).get('kilometers', {})
+        
+        record.id = asteroid.get('id')
+        record.name = asteroid.get('name')
+        record.nasa_jpl_url = asteroid.get('nasa_jpl_url')
+        record.absolute_magnitude = asteroid.get('absolute_magnitude_h')
+        record.is_potentially_hazardous = asteroid.get('is_potentially_hazardous_asteroid', False)
+        record.diameter_min_km = diameter_km.get('estimated_diameter_min', 0)
+        record.diameter_max_km = diameter_km.get('estimated_diameter_max', 0)
+        
+        # Velocity and miss distance stay as NASA's strings until read
+        relative_velocity = next_approach.get('relative_velocity', {})
+        record._velocity = (
+            relative_velocity.get('kilometers_per_second', 0),
+            relative_velocity.get('kilometers_per_hour', 0),
+            relative_velocity.get('miles_per_hour', 0),
+        )
+        miss_distance = next_approach.get('miss_distance', {})
+        record._miss_distance = (
+            miss_distance.get('kilometers', 0),
+            miss_distance.get('lunar', 0),
+            miss_distance.get('astronomical', 0),
+        )
+        
+        record.close_approach_date = next_approach.get('close_approach_date')
+        record.close_approach_date_full = next_approach.get('close_approach_date_full')
+        record.orbiting_body = next_approach.get('orbiting_body', 'Earth')
+        
+        orbital_data = asteroid.get('orbital_data')
+        if fields is not None and 'orbital_data' not in fields:
+            orbital_data = None
+        record._orbital = (
+            tuple(orbital_data.get(key) for key in cls.ORBITAL_FIELDS)
+            if orbital_data else cls._NO_ORBIT
+        )
+        record._orbital_elements = None
+        return record
+    
+    # Derived values ----------------------------------------------------------
+    
+    @property
+    def diameter_km(self):
+        # Average of the min/max estimates
+        return (self.diameter_min_km + self.diameter_max_km) / 2
+    
+    @property
+    def diameter_meters(self):
+        return self.diameter_km * 1000
+    
+    @property
+    def velocity_kmps(self):
+        return float(self._velocity[0])
+    
+    @property
+    def velocity_kmph(self):
+        return float(self._velocity[1])
+    
+    @property
+    def velocity_mph(self):
+        return float(self._velocity[2])
+    
+    @property
+    def miss_distance_km(self):
+        return float(self._miss_distance[0])
+    
+    @property
+    def miss_distance_lunar(self):
+        return float(self._miss_distance[1])
+    
+    @property
+    def miss_distance_au(self):
+        return float(self._miss_distance[2])
+    
+    @property
+    def orbital_data(self):
+        """Orbital elements as NASA sent them (strings)"""
+        return dict(zip(self.ORBITAL_FIELDS, self._orbital))
+    
+    @property
+    def orbital_elements(self):
+        """Numeric orbital elements as floats (None if missing), parsed on first access"""
+        if self._orbital_elements is None:
+            elements = {}
+            raw = dict(zip(self.ORBITAL_FIELDS, self._orbital))
+            for key in self.NUMERIC_ORBITAL_FIELDS:
+                value = raw[key]
+                try:
+                    elements[key] = float(value)
+                except (TypeError, ValueError):
+                    elements[key] = None
+            self._orbital_elements = elements
+        return self._orbital_elements
+    
+    # Dict-style access -------------------------------------------------------
+    
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in self.FIELDS
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.FIELDS else default
+    
+    def keys(self):
+        return self.FIELDS
+    
+    def to_dict(self, fields=None):
+        """
+        JSON-ready dict (the shape _extract_asteroid_info used to return)
+        
+        Args:
+            fields: Optional projection (parse_fields); only these values are computed
+        """
+        if fields is not None:
+            return {name: getattr(self, name) for name in fields}
+        return {
+            'id': self.id,
+            'name': self.name,
+            'nasa_jpl_url': self.nasa_jpl_url,
+            'absolute_magnitude': self.absolute_magnitude,
+            'is_potentially_hazardous': self.is_potentially_hazardous,
+            
+            # Size data
+            'diameter_km': self.diameter_km,
+            'diameter_min_km': self.diameter_min_km,
+            'diameter_max_km': self.diameter_max_km,
+            'diameter_meters': self.diameter_meters,
+            
+            # Velocity data
+            'velocity_kmps': self.velocity_kmps,
+            'velocity_kmph': self.velocity_kmph,
+            'velocity_mph': self.velocity_mph,
+            
+            # Distance data
+            'miss_distance_km': self.miss_distance_km,
+            'miss_distance_lunar': self.miss_distance_lunar,
+            'miss_distance_au': self.miss_distance_au,
+            
+            # Close approach data
+            'close_approach_date': self.close_approach_date,
+            'close_approach_date_full': self.close_approach_date_full,
+            'orbiting_body': self.orbiting_body,
+            
+            # Orbital elements (for trajectory visualization)
+            'orbital_data': self.orbital_data
+        }
+    
+    def __repr__(self):
+        return f'<NEORecord {self.id} {self.name}>'
+
 
 class NASANeoAPI:
     """Interface for NASA NEO API"""
     
+    BROWSE_PAGE_SIZE = 20  # NASA API limit
+    # Array members cut short while streaming (NEORecord.from_nasa reads the first approach only)
+    STREAM_LIMITS = {'close_approach_data': 1}
+    
     def __init__(self):
         self.api_key = settings.NASA_API_KEY
         self.base_url = settings.NASA_API_BASE_URL
+        
+        self.browse_concurrency = settings.NEO_BROWSE_CONCURRENCY
+        self.page_budget = settings.NEO_BROWSE_PAGE_BUDGET
+        self.quota_reserve = settings.NEO_BROWSE_QUOTA_RESERVE
+        # Parsed browse pages (full records; projections apply on output)
+        self.page_cache = ResultCache(
+            max_entries=settings.NEO_BROWSE_CACHE_PAGES,
+            ttl_seconds=settings.NEO_BROWSE_CACHE_TTL
+        )
+        # Last X-RateLimit-Remaining reported by NASA (None until seen)
+        self.rate_limit_remaining = None
+        
+        self.batch_concurrency = settings.NEO_BATCH_CONCURRENCY
+        # Parsed asteroid details by NEO ID
+        self.detail_cache = ResultCache(
+            max_entries=settings.NEO_DETAIL_CACHE_SIZE,
+            ttl_seconds=settings.NEO_DETAIL_CACHE_TTL
+        )
     
-    def get_neo_feed(self, start_date=None, end_date=None):
+    def get_neo_feed(self, start_date=None, end_date=None, fields=None):
         """
         Fetch Near Earth Objects for a date range (max 7 days)
         
         Args:
             start_date: Start date (YYYY-MM-DD). Defaults to today.
             end_date: End date (YYYY-MM-DD). Defaults to 7 days from start.
+            fields: Optional NEORecord.parse_fields projection
         
         Returns:
-            dict: NEO data from NASA API
+            dict: NEO data from NASA API ('asteroids' holds NEORecord objects)
         """
         if not start_date:
             start_date = datetime.now().strftime('%Y-%m-%d')
@@ -38,32 +305,89 @@ class NASANeoAPI:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return self._parse_neo_feed(response.json())
-        except requests.exceptions.RequestException as e:
+            values = {}
+            with requests.get(url, params=params, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                asteroids = list(self._iter_response(
+                    response, ('near_earth_objects', '*'), fields, values=values
+                ))
+            return {
+                'element_count': values.get(('element_count',), 0),
+                'asteroids': asteroids
+            }
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {'error': f'NASA API request failed: {str(e)}'}
     
     def get_asteroid_by_id(self, asteroid_id):
         """
-        Fetch detailed data for a specific asteroid
+        Fetch detailed data for a specific asteroid (cached per ID)
         
         Args:
             asteroid_id: NASA NEO ID
         
         Returns:
-            dict: Detailed asteroid data
+            NEORecord: Detailed asteroid data (dict with 'error' on failure)
         """
-        url = f"{self.base_url}/neo/{asteroid_id}"
-        params = {'api_key': self.api_key}
+        record = self.detail_cache.get(str(asteroid_id))
+        if record is not None:
+            return record
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return self._parse_asteroid_details(response.json())
+            return self._fetch_asteroid(asteroid_id)
         except requests.exceptions.RequestException as e:
             return {'error': f'Failed to fetch asteroid {asteroid_id}: {str(e)}'}
     
+    def get_asteroids_by_ids(self, asteroid_ids):
+        """
+        Fetch several asteroids, serving cached IDs directly and requesting the
+        rest from NASA concurrently (batch_concurrency at a time)
+        
+        Args:
+            asteroid_ids: NASA NEO IDs (duplicates are fetched once)
+        
+        Returns:
+            dict: asteroids (NEORecord objects, in request order, failures
+                  omitted), errors ({id: message}), cached (IDs served from cache)
+        """
+        asteroid_ids = list(dict.fromkeys(str(asteroid_id) for asteroid_id in asteroid_ids))
+        records, errors = {}, {}
+        
+        for asteroid_id in asteroid_ids:
+            if not asteroid_id.isalnum():
+                errors[asteroid_id] = 'Invalid asteroid ID'
+                continue
+            record = self.detail_cache.get(asteroid_id)
+            if record is not None:
+                records[asteroid_id] = record
+        cached = len(records)
+        
+        missing = [i for i in asteroid_ids if i not in records and i not in errors]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.batch_concurrency, len(missing))) as pool:
+                futures = [(i, pool.submit(self._fetch_asteroid, i)) for i in missing]
+                for asteroid_id, future in futures:
+                    try:
+                        records[asteroid_id] = future.result()
+                    except requests.exceptions.RequestException as e:
+                        errors[asteroid_id] = f'Failed to fetch asteroid {asteroid_id}: {str(e)}'
+        
+        return {
+            'asteroids': [records[i] for i in asteroid_ids if i in records],
+            'errors': {i: errors[i] for i in asteroid_ids if i in errors},
+            'cached': cached
+        }
+    
+    def _fetch_asteroid(self, asteroid_id):
+        """Request, parse and cache one asteroid; raises RequestException on failure"""
+        url = f"{self.base_url}/neo/{asteroid_id}"
+        params = {'api_key': self.api_key}
+        
+        response = requests.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        record = self._parse_asteroid_details(response.json())
+        self.detail_cache.set(str(asteroid_id), record)
+        return record
+    
     def search_asteroids(self, is_potentially_hazardous=None):
         """
         Browse all asteroids with optional filtering
@@ -72,131 +396,284 @@ class NASANeoAPI:
             is_potentially_hazardous: Filter by hazardous status (True/False)
         
         Returns:
-            dict: List of asteroids matching criteria
+            dict: List of asteroids matching criteria (NEORecord objects);
+                  see browse() for the pagination keys
         """
-        url = f"{self.base_url}/neo/browse"
-        params = {
-            'api_key': self.api_key,
-            'size': 20  # Request 20 asteroids per page (NASA API limit)
-        }
+        return self.browse(is_potentially_hazardous=is_potentially_hazardous)
+    
+    def browse(self, is_potentially_hazardous=None, cursor=None, limit=None):
+        """
+        Walk /neo/browse from a cursor, filtering across the whole catalog
         
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            asteroids = data.get('near_earth_objects', [])
+        Pages are requested browse_concurrency at a time and cached after
+        parsing, so later cursors and filters reuse them. At most page_budget
+        uncached pages are fetched per call, and fetching stops early once
+        NASA's X-RateLimit-Remaining falls to quota_reserve; the result then
+        carries a next_cursor to resume from.
+        
+        Args:
+            is_potentially_hazardous: Filter by hazardous status (True/False)
+            cursor: next_cursor from a previous call (None = first page)
+            limit: Maximum asteroids to return (None = until the end or the budget)
+        
+        Returns:
+            dict: count, asteroids (NEORecord objects), next_cursor (None once
+                  the catalog is exhausted), truncated (stopped by the page
+                  budget, quota or an upstream error), total_pages,
+                  pages_scanned, pages_fetched
+        
+        Raises:
+            ValueError: Malformed cursor
+        """
+        page, index = self._decode_cursor(cursor) if cursor else (0, 0)
+        asteroids = []
+        total_pages = None
+        pages_scanned = pages_fetched = 0
+        budget = self.page_budget
+        position = None  # Where the next call resumes
+        truncated = False
+        error = None
+        
+        while position is None:
+            if total_pages is not None and page >= total_pages:
+                break
+            # The first page tells us total_pages; after that fetch in batches
+            count = 1 if total_pages is None else min(self.browse_concurrency, total_pages - page)
+            entries, fetched, error = self._browse_pages(range(page, page + count), budget)
+            pages_fetched += fetched
+            budget -= fetched
             
-            # Filter by hazardous status if specified
-            if is_potentially_hazardous is not None:
-                asteroids = [
-                    a for a in asteroids 
-                    if a.get('is_potentially_hazardous_asteroid') == is_potentially_hazardous
-                ]
+            for entry in entries:
+                total_pages = entry['total_pages']
+                records = entry['asteroids']
+                for i in range(index, len(records)):
+                    record = records[i]
+                    if (is_potentially_hazardous is not None
+                            and record.is_potentially_hazardous != is_potentially_hazardous):
+                        continue
+                    asteroids.append(record)
+                    if limit is not None and len(asteroids) >= limit:
+                        position = (page, i + 1) if i + 1 < len(records) else (page + 1, 0)
+                        break
+                if position is not None:
+                    break
+                page, index = page + 1, 0
+                pages_scanned += 1
             
-            return self._parse_asteroid_list(asteroids)
-        except requests.exceptions.RequestException as e:
-            return {'error': f'Failed to search asteroids: {str(e)}'}
-    
-    def _parse_neo_feed(self, data):
-        """Parse NEO feed response"""
-        neo_data = data.get('near_earth_objects', {})
-        parsed_asteroids = []
+            if position is None and len(entries) < count:
+                # Out of budget or quota, or NASA failed: resume here next time
+                position = (page, index)
+                truncated = True
         
-        for date, asteroids in neo_data.items():
-            for asteroid in asteroids:
-                parsed_asteroids.append(self._extract_asteroid_info(asteroid))
+        if error and not asteroids and pages_scanned == 0:
+            return {'error': f'Failed to search asteroids: {error}'}
         
-        return {
-            'element_count': data.get('element_count', 0),
-            'asteroids': parsed_asteroids
-        }
-    
-    def _parse_asteroid_details(self, data):
-        """Parse detailed asteroid response"""
-        return self._extract_asteroid_info(data)
-    
-    def _parse_asteroid_list(self, asteroids):
-        """Parse list of asteroids"""
-        return {
+        if position is not None and total_pages is not None and position[0] >= total_pages:
+            position = None
+        
+        result = {
             'count': len(asteroids),
-            'asteroids': [self._extract_asteroid_info(a) for a in asteroids]
+            'asteroids': asteroids,
+            'next_cursor': self._encode_cursor(*position) if position else None,
+            'truncated': truncated,
+            'total_pages': total_pages,
+            'pages_scanned': pages_scanned,
+            'pages_fetched': pages_fetched
         }
+        if error:
+            result['upstream_error'] = error
+        return result
     
-    def _extract_asteroid_info(self, asteroid):
+    def _browse_pages(self, pages, budget):
         """
-        Extract relevant asteroid information for simulation
+        Parsed browse pages, fetching the uncached ones concurrently
+        
+        Args:
+            pages: Consecutive page numbers
+            budget: Uncached pages that may be requested from NASA
         
         Returns:
-            dict: Simplified asteroid data with physics parameters
+            tuple: (entries for the leading pages that are available,
+                    pages fetched from NASA, first error message or None)
         """
-        # Get close approach data
-        close_approach_data = asteroid.get('close_approach_data', [])
-        next_approach = close_approach_data[0] if close_approach_data else {}
+        entries = {page: self.page_cache.get(f'browse:{page}') for page in pages}
+        missing = [page for page in pages if entries[page] is None]
         
-        # Extract orbital data
-        orbital_data = asteroid.get('orbital_data', {})
+        allowed = budget
+        if self.rate_limit_remaining is not None:
+            allowed = min(allowed, max(0, self.rate_limit_remaining - self.quota_reserve))
+        missing = missing[:max(0, allowed)]
         
-        # Get size estimates
-        estimated_diameter = asteroid.get('estimated_diameter', {})
-        diameter_km = estimated_diameter.get('kilometers', {})
+        error = None
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.browse_concurrency, len(missing))) as pool:
+                futures = [(page, pool.submit(self._fetch_browse_page, page)) for page in missing]
+                for page, future in futures:
+                    try:
+                        entries[page] = future.result()
+                    except (requests.exceptions.RequestException, ValueError) as e:
+                        error = error or str(e)
+                        continue
+                    self.page_cache.set(f'browse:{page}', entries[page])
+        
+        available = []
+        for page in pages:
+            if entries[page] is None:
+                break
+            available.append(entries[page])
+        return available, len(missing), error
+    
+    def _fetch_browse_page(self, page):
+        """One parsed browse page: {'asteroids': [NEORecord, ...], 'total_pages': n}"""
+        params = {
+            'api_key': self.api_key,
+            'page': page,
+            'size': self.BROWSE_PAGE_SIZE
+        }
+        values = {}
+        with requests.get(f"{self.base_url}/neo/browse", params=params, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None and remaining.isdigit():
+                self.rate_limit_remaining = int(remaining)
+            
+            asteroids = list(self._iter_response(response, ('near_earth_objects',), values=values))
+        return {
+            'asteroids': asteroids,
+            'total_pages': values.get(('page',), {}).get('total_pages', page + 1)
+        }
+    
+    @staticmethod
+    def _encode_cursor(page, index):
+        return base64.urlsafe_b64encode(f'{page}.{index}'.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def _decode_cursor(cursor):
+        """(page, index) from an opaque cursor; ValueError if it is malformed"""
+        try:
+            decoded = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            page, index = (int(part) for part in decoded.split('.'))
+        except (ValueError, UnicodeDecodeError, TypeError):
+            raise ValueError('Invalid cursor')
+        if page < 0 or index < 0:
+            raise ValueError('Invalid cursor')
+        return page, index
+    
+    def iter_neo_feed(self, start_date=None, end_date=None, fields=None):
+        """
+        Yield parsed asteroids for a date range of any length
         
-        # Calculate average diameter
-        min_diameter = diameter_km.get('estimated_diameter_min', 0)
-        max_diameter = diameter_km.get('estimated_diameter_max', 0)
-        avg_diameter_km = (min_diameter + max_diameter) / 2
+        The range is fetched in 7-day windows (the NASA feed limit), one
+        window at a time, and each window is parsed as it streams in, so
+        memory stays bounded by a single asteroid. A failed request yields
+        {'error': ...} and stops.
         
-        # Get velocity data
-        relative_velocity = next_approach.get('relative_velocity', {})
-        velocity_kmps = float(relative_velocity.get('kilometers_per_second', 0))
+        Args:
+            start_date: Start date (YYYY-MM-DD). Defaults to today.
+            end_date: End date (YYYY-MM-DD). Defaults to 7 days from start.
+            fields: Optional NEORecord.parse_fields projection
         
-        # Get miss distance
-        miss_distance = next_approach.get('miss_distance', {})
+        Yields:
+            NEORecord: Parsed asteroid (same as get_neo_feed entries)
+        """
+        start = datetime.strptime(start_date, '%Y-%m-%d') if start_date else datetime.now()
+        end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else start + timedelta(days=7)
         
-        return {
-            'id': asteroid.get('id'),
-            'name': asteroid.get('name'),
-            'nasa_jpl_url': asteroid.get('nasa_jpl_url'),
-            'absolute_magnitude': asteroid.get('absolute_magnitude_h'),
-            'is_potentially_hazardous': asteroid.get('is_potentially_hazardous_asteroid', False),
-            
-            # Size data
-            'diameter_km': avg_diameter_km,
-            'diameter_min_km': min_diameter,
-            'diameter_max_km': max_diameter,
-            'diameter_meters': avg_diameter_km * 1000,
+        url = f"{self.base_url}/feed"
+        window_start = start
+        while window_start <= end:
+            window_end = min(window_start + timedelta(days=7), end)
+            params = {
+                'start_date': window_start.strftime('%Y-%m-%d'),
+                'end_date': window_end.strftime('%Y-%m-%d'),
+                'api_key': self.api_key
+            }
             
-            # Velocity data
-            'velocity_kmps': velocity_kmps,
-            'velocity_kmph': float(relative_velocity.get('kilometers_per_hour', 0)),
-            'velocity_mph': float(relative_velocity.get('miles_per_hour', 0)),
+            try:
+                with requests.get(url, params=params, timeout=10, stream=True) as response:
+                    response.raise_for_status()
+                    yield from self._iter_response(response, ('near_earth_objects', '*'), fields)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                yield {'error': f'NASA API request failed: {str(e)}'}
+                return
             
-            # Distance data
-            'miss_distance_km': float(miss_distance.get('kilometers', 0)),
-            'miss_distance_lunar': float(miss_distance.get('lunar', 0)),
-            'miss_distance_au': float(miss_distance.get('astronomical', 0)),
+            window_start = window_end + timedelta(days=1)
+    
+    def iter_browse(self, is_potentially_hazardous=None, pages=1, fields=None):
+        """
+        Yield parsed asteroids from the browse endpoint, one page at a time
+        
+        Args:
+            is_potentially_hazardous: Filter by hazardous status (True/False)
+            pages: Number of browse pages to walk
+            fields: Optional NEORecord.parse_fields projection
+        
+        Yields:
+            NEORecord: Parsed asteroid, or an {'error': ...} dict if a page fails
+        """
+        url = f"{self.base_url}/neo/browse"
+        for page in range(pages):
+            params = {
+                'api_key': self.api_key,
+                'page': page,
+                'size': self.BROWSE_PAGE_SIZE
+            }
             
-            # Close approach data
-            'close_approach_date': next_approach.get('close_approach_date'),
-            'close_approach_date_full': next_approach.get('close_approach_date_full'),
-            'orbiting_body': next_approach.get('orbiting_body', 'Earth'),
+            values = {}
+            try:
+                with requests.get(url, params=params, timeout=10, stream=True) as response:
+                    response.raise_for_status()
+                    yield from self._iter_response(
+                        response, ('near_earth_objects',), fields, values=values,
+                        keep=None if is_potentially_hazardous is None else (
+                            lambda a: a.get('is_potentially_hazardous_asteroid') == is_potentially_hazardous
+                        )
+                    )
+            except (requests.exceptions.RequestException, ValueError) as e:
+                yield {'error': f'Failed to search asteroids: {str(e)}'}
+                return
             
-            # Orbital elements (for trajectory visualization)
-            'orbital_data': {
-                'orbit_id': orbital_data.get('orbit_id'),
-                'orbit_determination_date': orbital_data.get('orbit_determination_date'),
-                'orbit_uncertainty': orbital_data.get('orbit_uncertainty'),
-                'semi_major_axis': orbital_data.get('semi_major_axis'),
-                'eccentricity': orbital_data.get('eccentricity'),
-                'inclination': orbital_data.get('inclination'),
-                'ascending_node_longitude': orbital_data.get('ascending_node_longitude'),
-                'orbital_period': orbital_data.get('orbital_period'),
-                'perihelion_distance': orbital_data.get('perihelion_distance'),
-                'aphelion_distance': orbital_data.get('aphelion_distance'),
-                'perihelion_argument': orbital_data.get('perihelion_argument'),
-                'mean_anomaly': orbital_data.get('mean_anomaly'),
-            }
-        }
+            if page + 1 >= values.get(('page',), {}).get('total_pages', pages):
+                return
+    
+    def _iter_response(self, response, path, fields=None, keep=None, values=None):
+        """
+        Yield parsed asteroids from a stream=True response as it arrives
+        
+        Each raw object is read with close_approach_data cut to its first
+        entry, parsed and dropped before the next is read, so memory stays
+        at one asteroid rather than the whole document. Raises ValueError on
+        malformed JSON and RequestException if the connection fails.
+        
+        Args:
+            response: Streaming requests response
+            path: Key path of the asteroid arrays (JSONStream.iter_items)
+            fields: Optional NEORecord.parse_fields projection
+            keep: Optional predicate on the raw object
+            values: Optional dict receiving the values around the arrays
+                    (JSONStream.values), filled once the document is read
+        """
+        stream = JSONStream(response.iter_content(JSONStream.CHUNK_SIZE))
+        for asteroid in stream.iter_items(path, self.STREAM_LIMITS):
+            if keep is None or keep(asteroid):
+                yield self._extract_asteroid_info(asteroid, fields)
+        if values is not None:
+            values.update(stream.values)
+    
+    def _parse_asteroid_details(self, data, fields=None):
+        """Parse detailed asteroid response"""
+        return self._extract_asteroid_info(data, fields)
+    
+    def _extract_asteroid_info(self, asteroid, fields=None):
+        """
+        Extract relevant asteroid information for simulation
+        
+        Returns:
+            NEORecord: Compact asteroid record with physics parameters
+                       (use to_dict() for the JSON shape)
+        """
+        return NEORecord.from_nasa(asteroid, fields)
 
 
 # Singleton instance
@@ -4,6 +4,12 @@ Person 2: Calculate impact energy, crater size, blast radius, seismic effects
 """
 import math
 
+import numpy as np
+
+from .atmosphere import atmospheric_entry
+from .lookup_tables import ImpactLookupTables
+from .simulation_graph import SimulationGraph
+
 
 class ImpactPhysics:
     """Physics calculations for asteroid impact simulation"""
@@ -14,19 +20,36 @@ class ImpactPhysics:
     ASTEROID_DENSITY = 3000  # kg/m^3 (typical rocky asteroid)
     TNT_ENERGY = 4.184e9  # Joules per kiloton of TNT
     
+    # Physics evaluation modes for calculate_full_impact_simulation
+    MODES = ('exact', 'table')
+    
+    # Exponent of each ground-effect output in its energy power law
+    ENERGY_EXPONENTS = {
+        'crater_diameter_km': 0.3,
+        'crater_depth_km': 0.3,
+        'fireball_radius_km': 0.4,
+        'total_destruction_radius_km': 0.33,
+        'severe_damage_radius_km': 0.33,
+        'moderate_damage_radius_km': 0.33,
+        'thermal_radiation_radius_km': 0.38
+    }
+    
+    # Inputs the sensitivity block differentiates against
+    SENSITIVITY_INPUTS = ('diameter_km', 'velocity_kmps', 'density_kg_m3', 'impact_angle_deg')
+    
     def __init__(self):
-        pass
+        self.lookup_tables = ImpactLookupTables(self)
     
     def calculate_mass(self, diameter_km, density=None):
         """
         Calculate asteroid mass from diameter
         
         Args:
-            diameter_km: Asteroid diameter in kilometers
+            diameter_km: Asteroid diameter in kilometers (scalar or array)
             density: Asteroid density in kg/m^3 (default: 3000)
         
         Returns:
-            float: Mass in kilograms
+            float: Mass in kilograms (array for array input)
         """
         if density is None:
             density = self.ASTEROID_DENSITY
@@ -48,8 +71,8 @@ class ImpactPhysics:
         Calculate impact energy: E = 0.5 * m * v^2
         
         Args:
-            mass_kg: Mass in kilograms
-            velocity_kmps: Velocity in kilometers per second
+            mass_kg: Mass in kilograms (scalar or array)
+            velocity_kmps: Velocity in kilometers per second (scalar or array)
         
         Returns:
             dict: Energy in various units
@@ -74,7 +97,7 @@ class ImpactPhysics:
             'hiroshima_equivalent': hiroshima_equivalent
         }
     
-    def calculate_crater_size(self, diameter_km, velocity_kmps, impact_angle=45):
+    def calculate_crater_size(self, diameter_km, velocity_kmps, impact_angle=45, density=None):
         """
         Estimate crater diameter and depth
         Uses simplified scaling laws
@@ -83,23 +106,36 @@ class ImpactPhysics:
             diameter_km: Asteroid diameter in kilometers
             velocity_kmps: Impact velocity in km/s
             impact_angle: Angle of impact in degrees (default: 45)
+            density: Asteroid density in kg/m^3 (default: 3000)
         
         Returns:
             dict: Crater dimensions
         """
         # Calculate mass
-        mass_kg = self.calculate_mass(diameter_km)
+        mass_kg = self.calculate_mass(diameter_km, density)
         
         # Calculate energy
         energy = self.calculate_impact_energy(mass_kg, velocity_kmps)
-        energy_megatons = energy['energy_megatons_tnt']
         
+        return self.crater_from_energy(energy['energy_megatons_tnt'], impact_angle)
+    
+    def crater_from_energy(self, energy_megatons, impact_angle=45):
+        """
+        Crater dimensions from an already computed impact energy
+        
+        Args:
+            energy_megatons: Impact energy in megatons of TNT (scalar or array)
+            impact_angle: Angle of impact in degrees (default: 45)
+        
+        Returns:
+            dict: Crater dimensions
+        """
         # Crater diameter scaling (simplified formula)
         # D_crater ≈ 1.8 * (E^0.3) where E is in megatons
         crater_diameter_km = 1.8 * (energy_megatons ** 0.3)
         
         # Adjust for impact angle (oblique impacts create smaller craters)
-        angle_factor = math.sin(math.radians(impact_angle))
+        angle_factor = np.sin(np.radians(impact_angle))
         crater_diameter_km *= angle_factor ** 0.5
         
         # Crater depth is typically 1/5 to 1/10 of diameter
@@ -113,22 +149,34 @@ class ImpactPhysics:
             'impact_angle': impact_angle
         }
     
-    def calculate_blast_radius(self, diameter_km, velocity_kmps):
+    def calculate_blast_radius(self, diameter_km, velocity_kmps, density=None):
         """
         Calculate blast and thermal radiation zones
         
         Args:
             diameter_km: Asteroid diameter in kilometers
             velocity_kmps: Impact velocity in km/s
+            density: Asteroid density in kg/m^3 (default: 3000)
         
         Returns:
             dict: Damage zones in kilometers
         """
         # Calculate energy
-        mass_kg = self.calculate_mass(diameter_km)
+        mass_kg = self.calculate_mass(diameter_km, density)
         energy = self.calculate_impact_energy(mass_kg, velocity_kmps)
-        energy_megatons = energy['energy_megatons_tnt']
         
+        return self.blast_from_energy(energy['energy_megatons_tnt'])
+    
+    def blast_from_energy(self, energy_megatons):
+        """
+        Blast and thermal radiation zones from an already computed impact energy
+        
+        Args:
+            energy_megatons: Impact energy in megatons of TNT (scalar or array)
+        
+        Returns:
+            dict: Damage zones in kilometers
+        """
         # Scaling laws for blast effects
         # Based on nuclear weapon effects scaled to impact energy
         
@@ -156,26 +204,35 @@ class ImpactPhysics:
             'energy_megatons': energy_megatons
         }
     
-    def calculate_seismic_effects(self, diameter_km, velocity_kmps):
+    def calculate_seismic_effects(self, diameter_km, velocity_kmps, density=None):
         """
         Estimate seismic effects (earthquake magnitude)
         
         Args:
             diameter_km: Asteroid diameter in kilometers
             velocity_kmps: Impact velocity in km/s
+            density: Asteroid density in kg/m^3 (default: 3000)
         
         Returns:
             dict: Seismic data
         """
         # Calculate energy
-        mass_kg = self.calculate_mass(diameter_km)
+        mass_kg = self.calculate_mass(diameter_km, density)
         energy = self.calculate_impact_energy(mass_kg, velocity_kmps)
-        energy_joules = energy['energy_joules']
         
-        # Convert energy to Richter scale magnitude
-        # M = (2/3) * log10(E) - 2.9 (where E is in ergs)
-        energy_ergs = energy_joules * 1e7  # Convert Joules to ergs
-        magnitude = (2/3) * math.log10(energy_ergs) - 2.9
+        return self.seismic_from_energy(energy['energy_joules'])
+    
+    def seismic_from_energy(self, energy_joules):
+        """
+        Seismic effects from an already computed impact energy
+        
+        Args:
+            energy_joules: Impact energy in Joules
+        
+        Returns:
+            dict: Seismic data
+        """
+        magnitude = self.richter_magnitude(energy_joules)
         
         return {
             'richter_magnitude': magnitude,
@@ -183,6 +240,13 @@ class ImpactPhysics:
             'description': self._get_seismic_description(magnitude)
         }
     
+    @staticmethod
+    def richter_magnitude(energy_joules):
+        """Richter scale magnitude of an impact energy in Joules (scalar or array)"""
+        # M = (2/3) * log10(E) - 2.9 (where E is in ergs)
+        energy_ergs = energy_joules * 1e7  # Convert Joules to ergs
+        return (2/3) * np.log10(energy_ergs) - 2.9
+    
     def _get_seismic_description(self, magnitude):
         """Get description of seismic intensity"""
         if magnitude < 4.0:
@@ -200,7 +264,8 @@ class ImpactPhysics:
     
     def calculate_full_impact_simulation(self, diameter_km, velocity_kmps, 
                                         impact_lat=0, impact_lon=0, 
-                                        impact_angle=45, density=None):
+                                        impact_angle=45, density=None,
+                                        mode='exact', sensitivity=False):
         """
         Complete impact simulation with all effects
         
@@ -211,44 +276,322 @@ class ImpactPhysics:
             impact_lon: Impact longitude
             impact_angle: Impact angle in degrees
             density: Asteroid density (optional)
+            mode: 'exact' (default) or 'table' for interpolated lookup tables
+            sensitivity: Include partial derivatives and elasticities (default: False)
         
         Returns:
             dict: Complete impact simulation data
         """
-        # Calculate mass
-        mass_kg = self.calculate_mass(diameter_km, density)
+        # Stages (mass -> energy -> crater/blast/seismic) are evaluated through
+        # the simulation graph so mass and energy are computed only once
+        graph = SimulationGraph(self)
+        values = graph.evaluate({
+            'diameter_km': diameter_km,
+            'velocity_kmps': velocity_kmps,
+            'impact_lat': impact_lat,
+            'impact_lon': impact_lon,
+            'impact_angle': impact_angle,
+            'density': density,
+            'mode': mode,
+            'sensitivity': sensitivity
+        })
+        
+        result = dict(values['result'])
+        if sensitivity:
+            result['sensitivity'] = values['sensitivity']
+        
+        return result
+    
+    def calculate_atmospheric_entry(self, diameter_km, velocity_kmps, impact_angle=45, density=None):
+        """
+        Atmospheric entry stage (pancake fragmentation model)
         
-        # Calculate all effects
-        energy = self.calculate_impact_energy(mass_kg, velocity_kmps)
-        crater = self.calculate_crater_size(diameter_km, velocity_kmps, impact_angle)
-        blast = self.calculate_blast_radius(diameter_km, velocity_kmps)
-        seismic = self.calculate_seismic_effects(diameter_km, velocity_kmps)
+        Args:
+            diameter_km: Asteroid diameter in kilometers
+            velocity_kmps: Entry velocity in km/s
+            impact_angle: Entry angle in degrees (default: 45)
+            density: Asteroid density in kg/m^3 (default: 3000)
         
-        # Check if impact is in ocean (simplified: assume 70% of Earth is ocean)
-        is_ocean_impact = False  # Would need real geographic data
+        Returns:
+            dict: Burst altitude, energy deposited and ground overpressure radii
+        """
+        if density is None:
+            density = self.ASTEROID_DENSITY
         
+        return atmospheric_entry.simulate(diameter_km, velocity_kmps, impact_angle, density)
+    
+    def _airburst_crater(self, crater):
+        """No crater forms when the body bursts in the atmosphere"""
         return {
-            'asteroid': {
-                'diameter_km': diameter_km,
-                'diameter_m': diameter_km * 1000,
-                'mass_kg': mass_kg,
-                'mass_tons': mass_kg / 1000,
-                'velocity_kmps': velocity_kmps,
-                'density_kg_m3': density or self.ASTEROID_DENSITY
-            },
-            'impact_location': {
-                'latitude': impact_lat,
-                'longitude': impact_lon,
-                'angle': impact_angle,
-                'is_ocean': is_ocean_impact
-            },
-            'energy': energy,
-            'crater': crater,
-            'blast_zones': blast,
-            'seismic_effects': seismic,
-            'severity': self._assess_severity(energy['energy_megatons_tnt'])
+            'crater_diameter_km': 0,
+            'crater_diameter_m': 0,
+            'crater_depth_km': 0,
+            'crater_depth_m': 0,
+            'impact_angle': crater['impact_angle'],
+            'formed': False
         }
     
+    def _airburst_blast(self, blast, entry):
+        """Replace ground-burst damage radii with the airburst overpressure radii"""
+        blast = dict(blast)
+        for key in ('total_destruction_radius_km', 'severe_damage_radius_km',
+                    'moderate_damage_radius_km', 'window_breakage_radius_km'):
+            blast[key] = entry[key]
+        blast['burst_altitude_km'] = entry['burst_altitude_m'] / 1000
+        return blast
+    
+    def calculate_sensitivities(self, result):
+        """
+        Partial derivatives and elasticities of every output w.r.t. every input
+        
+        Ground effects are power laws in energy (E ~ density * d^3 * v^2), so
+        their elasticities are exact constants: e.g. the crater diameter
+        (~E^0.3 * sin(angle)^0.5) has elasticity 0.9 in diameter and
+        0.5 * angle * cot(angle) in angle. Airburst outputs come from the
+        numerical entry model and are differentiated with central differences
+        evaluated in a single batched entry call.
+        
+        Args:
+            result: Output of calculate_full_impact_simulation
+        
+        Returns:
+            dict: Inputs, partial derivatives, elasticities and the method per output
+        """
+        asteroid = result['asteroid']
+        inputs = {
+            'diameter_km': asteroid['diameter_km'],
+            'velocity_kmps': asteroid['velocity_kmps'],
+            'density_kg_m3': asteroid['density_kg_m3'],
+            'impact_angle_deg': result['impact_location']['angle']
+        }
+        
+        values = {
+            'mass_kg': asteroid['mass_kg'],
+            'energy_joules': result['energy']['energy_joules'],
+            'energy_megatons_tnt': result['energy']['energy_megatons_tnt'],
+            'crater_diameter_km': result['crater']['crater_diameter_km'],
+            'crater_depth_km': result['crater']['crater_depth_km'],
+            'richter_magnitude': result['seismic_effects']['richter_magnitude'],
+            'seismic_radius_km': result['seismic_effects']['seismic_radius_km']
+        }
+        for key in ('fireball_radius_km', 'total_destruction_radius_km', 'severe_damage_radius_km',
+                    'moderate_damage_radius_km', 'thermal_radiation_radius_km'):
+            values[key] = result['blast_zones'][key]
+        
+        energy_elasticity = {'diameter_km': 3, 'velocity_kmps': 2, 'density_kg_m3': 1, 'impact_angle_deg': 0}
+        angle_rad = math.radians(inputs['impact_angle_deg'])
+        
+        elasticities = {
+            'mass_kg': {'diameter_km': 3, 'velocity_kmps': 0, 'density_kg_m3': 1, 'impact_angle_deg': 0},
+            'energy_joules': dict(energy_elasticity),
+            'energy_megatons_tnt': dict(energy_elasticity)
+        }
+        methods = {key: 'analytic' for key in values}
+        
+        for output, exponent in self.ENERGY_EXPONENTS.items():
+            elasticities[output] = {name: exponent * e for name, e in energy_elasticity.items()}
+        # angle * cot(angle) -> 1 as the angle goes to 0
+        angle_term = angle_rad / math.tan(angle_rad) if angle_rad else 1.0
+        for output in ('crater_diameter_km', 'crater_depth_km'):
+            elasticities[output]['impact_angle_deg'] = 0.5 * angle_term
+        
+        # M = (2/3) log10(E) + const  =>  dM/dx = (2/3) / ln(10) * eps_E / x
+        # (the elasticity is undefined where M = 0)
+        magnitude = values['richter_magnitude']
+        elasticities['richter_magnitude'] = {
+            name: (2/3) / math.log(10) * e / magnitude if magnitude else None
+            for name, e in energy_elasticity.items()
+        }
+        elasticities['seismic_radius_km'] = dict(elasticities['richter_magnitude'])
+        
+        entry = result['atmospheric_entry']
+        if entry['is_airburst']:
+            # No crater forms: both outputs are identically zero
+            for output in ('crater_diameter_km', 'crater_depth_km'):
+                elasticities[output] = {name: 0 for name in self.SENSITIVITY_INPUTS}
+                methods[output] = 'not_formed'
+            
+            airburst_keys = ['burst_altitude_m', 'total_destruction_radius_km',
+                             'severe_damage_radius_km', 'moderate_damage_radius_km']
+            values['burst_altitude_m'] = entry['burst_altitude_m']
+            partials = self._entry_partials(inputs, airburst_keys)
+            for output in airburst_keys:
+                elasticities[output] = {
+                    name: (partials[output][name] * inputs[name] / values[output]
+                           if values[output] and partials[output][name] is not None else None)
+                    for name in self.SENSITIVITY_INPUTS
+                }
+                methods[output] = 'batched_central_difference'
+        
+        partial_derivatives = {}
+        for output, by_input in elasticities.items():
+            if methods[output] == 'batched_central_difference':
+                partial_derivatives[output] = partials[output]
+                continue
+            partial_derivatives[output] = {
+                name: self._partial_from_elasticity(e, values[output], inputs[name])
+                for name, e in by_input.items()
+            }
+        
+        return {
+            'inputs': inputs,
+            'values': values,
+            'partial_derivatives': partial_derivatives,
+            'elasticities': elasticities,
+            'methods': methods
+        }
+    
+    @staticmethod
+    def _partial_from_elasticity(elasticity, value, input_value):
+        """d(output)/d(input) = elasticity * output / input; None where that is undefined"""
+        if elasticity == 0:
+            return 0.0
+        if elasticity is None or input_value == 0:
+            return None
+        return elasticity * value / input_value
+    
+    def _entry_partials(self, inputs, keys, relative_step=0.01):
+        """
+        Central differences of entry outputs, all perturbations in one batch
+        
+        Where base +/- h would leave the entry model's domain (it clips the
+        angle to [MIN_PATH_ANGLE_DEG, 90]) a second-order one-sided
+        difference is used instead, so that e.g. the angle derivative at 90
+        degrees is not averaged with the clipped value.
+        """
+        names = self.SENSITIVITY_INPUTS
+        base = np.array([inputs[name] for name in names], dtype=float)
+        steps = base * relative_step
+        domain = {'impact_angle_deg': (atmospheric_entry.MIN_PATH_ANGLE_DEG, 90.0)}
+        
+        # Row 0 is the base point; then two rows per input, weighted with
+        # (base, first, second) coefficients in units of 1 / (2h)
+        points = np.tile(base, (2 * len(names) + 1, 1))
+        weights = []
+        for i, name in enumerate(names):
+            lower, upper = domain.get(name, (-np.inf, np.inf))
+            if base[i] + steps[i] > upper:
+                offsets, coefficients = (-1, -2), (3, -4, 1)
+            elif base[i] - steps[i] < lower:
+                offsets, coefficients = (1, 2), (-3, 4, -1)
+            else:
+                offsets, coefficients = (1, -1), (0, 1, -1)
+            points[2 * i + 1, i] += offsets[0] * steps[i]
+            points[2 * i + 2, i] += offsets[1] * steps[i]
+            weights.append(coefficients)
+        
+        diameter, velocity, density, angle = points.T
+        batch = atmospheric_entry.simulate_batch(diameter, velocity, angle, density)
+        
+        partials = {}
+        for key in keys:
+            values = np.nan_to_num(batch[key])
+            partials[key] = {}
+            for i, name in enumerate(names):
+                # A zero input gives a zero step: no derivative from this stencil
+                if not steps[i]:
+                    partials[key][name] = None
+                    continue
+                c0, c1, c2 = weights[i]
+                difference = c0 * values[0] + c1 * values[2 * i + 1] + c2 * values[2 * i + 2]
+                partials[key][name] = float(difference / (2 * steps[i]))
+        return partials
+    
+    def calculate_batch_ground_effects(self, diameter_km, velocity_kmps, impact_angle=45,
+                                       density=None):
+        """
+        Vectorized ground-impact scaling laws (no atmospheric entry)
+        
+        Runs the scalar helpers (calculate_mass, calculate_impact_energy,
+        crater_from_energy, blast_from_energy, richter_magnitude) over arrays.
+        
+        Args:
+            diameter_km: Diameters in kilometers (scalar or array)
+            velocity_kmps: Impact velocities in km/s (scalar or array)
+            impact_angle: Impact angles in degrees (scalar or array)
+            density: Densities in kg/m^3 (scalar or array, default: 3000)
+        
+        Returns:
+            dict: numpy arrays, one element per body
+        """
+        if density is None:
+            density = self.ASTEROID_DENSITY
+        
+        diameter_km, velocity_kmps, impact_angle, density = np.broadcast_arrays(
+            np.asarray(diameter_km, dtype=float),
+            np.asarray(velocity_kmps, dtype=float),
+            np.asarray(impact_angle, dtype=float),
+            np.asarray(density, dtype=float)
+        )
+        
+        energy = self.calculate_impact_energy(self.calculate_mass(diameter_km, density), velocity_kmps)
+        return self._batch_ground_from_energy(energy, impact_angle)
+    
+    def _batch_ground_from_energy(self, energy, impact_angle):
+        """Ground-impact outputs from a calculate_impact_energy() result over arrays"""
+        crater = self.crater_from_energy(energy['energy_megatons_tnt'], impact_angle)
+        blast = self.blast_from_energy(energy['energy_megatons_tnt'])
+        
+        effects = {'crater_diameter_km': crater['crater_diameter_km']}
+        for key in ('fireball_radius_km', 'total_destruction_radius_km', 'severe_damage_radius_km',
+                    'moderate_damage_radius_km', 'thermal_radiation_radius_km'):
+            effects[key] = blast[key]
+        effects['richter_magnitude'] = self.richter_magnitude(energy['energy_joules'])
+        return effects
+    
+    def calculate_batch_impact_effects(self, diameter_km, velocity_kmps,
+                                       impact_angle=45, density=None):
+        """
+        Vectorized impact effects for many bodies at once
+        
+        Combines the ground-impact scaling laws with the batched atmospheric
+        entry stage: airbursts form no crater and use the airburst
+        overpressure radii, exactly as calculate_full_impact_simulation does.
+        
+        Args:
+            diameter_km: Diameters in kilometers (scalar or array)
+            velocity_kmps: Impact velocities in km/s (scalar or array)
+            impact_angle: Impact angles in degrees (scalar or array)
+            density: Densities in kg/m^3 (scalar or array, default: 3000)
+        
+        Returns:
+            dict: numpy arrays, one element per body
+        """
+        if density is None:
+            density = self.ASTEROID_DENSITY
+        
+        diameter_km, velocity_kmps, impact_angle, density = np.broadcast_arrays(
+            np.asarray(diameter_km, dtype=float),
+            np.asarray(velocity_kmps, dtype=float),
+            np.asarray(impact_angle, dtype=float),
+            np.asarray(density, dtype=float)
+        )
+        
+        mass_kg = self.calculate_mass(diameter_km, density)
+        energy = self.calculate_impact_energy(mass_kg, velocity_kmps)
+        
+        ground = self._batch_ground_from_energy(energy, impact_angle)
+        entry = atmospheric_entry.simulate_batch(diameter_km, velocity_kmps, impact_angle, density)
+        airburst = entry['is_airburst']
+        
+        effects = {
+            'mass_kg': mass_kg,
+            'energy_joules': energy['energy_joules'],
+            'energy_megatons_tnt': energy['energy_megatons_tnt'],
+            'is_airburst': airburst,
+            'burst_altitude_m': entry['burst_altitude_m'],
+            'energy_deposited_joules': entry['energy_deposited_joules']
+        }
+        effects.update(ground)
+        effects['crater_diameter_km'] = np.where(airburst, 0.0, ground['crater_diameter_km'])
+        effects['crater_depth_km'] = effects['crater_diameter_km'] / 7
+        for key in ('total_destruction_radius_km', 'severe_damage_radius_km',
+                    'moderate_damage_radius_km'):
+            effects[key] = np.where(airburst, entry[key], ground[key])
+        effects['seismic_radius_km'] = ground['richter_magnitude'] * 100
+        
+        return effects
+    
     def _assess_severity(self, energy_megatons):
         """Assess impact severity"""
         if energy_megatons < 1:
@@ -260,6 +603,44 @@ class ImpactPhysics:
         else:
             return "Catastrophic - Global extinction event"
     
+    def deflection_delta_v(self, deflection_method, deflection_params):
+        """
+        Velocity change delivered by a deflection method
+        
+        Parameter values may be scalars or numpy arrays of equal shape, so the
+        same formulas serve single runs and parameter sweeps.
+        
+        Args:
+            deflection_method: 'kinetic_impactor', 'gravity_tractor', 'nuclear'
+            deflection_params: Method-specific parameters (defaults as in simulate_deflection)
+        
+        Returns:
+            float or ndarray: Delta-v in km/s
+        """
+        if deflection_method == 'kinetic_impactor':
+            impactor_mass = deflection_params.get('impactor_mass_kg', 500)
+            impactor_velocity = deflection_params.get('impactor_velocity_kmps', 10)
+            asteroid_mass = deflection_params.get('asteroid_mass_kg', 1e12)
+            
+            # Delta-v from momentum conservation
+            delta_v_mps = (impactor_mass * impactor_velocity * 1000) / asteroid_mass
+            return delta_v_mps / 1000
+        
+        if deflection_method == 'gravity_tractor':
+            duration_days = deflection_params.get('duration_days', 365)
+            
+            # Very small but continuous acceleration
+            delta_v_mps = 0.0001 * duration_days  # Simplified
+            return delta_v_mps / 1000
+        
+        if deflection_method == 'nuclear':
+            yield_megatons = deflection_params.get('yield_megatons', 1)
+            
+            # Simplified delta-v estimate
+            return 0.001 * (yield_megatons ** 0.5)
+        
+        raise ValueError(f'Unknown deflection method: {deflection_method}')
+    
     def simulate_deflection(self, original_velocity_kmps, deflection_method, 
                            deflection_params):
         """
@@ -275,13 +656,7 @@ class ImpactPhysics:
         """
         if deflection_method == 'kinetic_impactor':
             # Kinetic impactor: Change velocity by momentum transfer
-            impactor_mass = deflection_params.get('impactor_mass_kg', 500)
-            impactor_velocity = deflection_params.get('impactor_velocity_kmps', 10)
-            asteroid_mass = deflection_params.get('asteroid_mass_kg', 1e12)
-            
-            # Delta-v from momentum conservation
-            delta_v_mps = (impactor_mass * impactor_velocity * 1000) / asteroid_mass
-            delta_v_kmps = delta_v_mps / 1000
+            delta_v_kmps = self.deflection_delta_v(deflection_method, deflection_params)
             
             new_velocity = original_velocity_kmps + delta_v_kmps
             
@@ -296,11 +671,7 @@ class ImpactPhysics:
         elif deflection_method == 'gravity_tractor':
             # Gravity tractor: Slow continuous pull
             duration_days = deflection_params.get('duration_days', 365)
-            spacecraft_mass_kg = deflection_params.get('spacecraft_mass_kg', 1000)
-            
-            # Very small but continuous acceleration
-            delta_v_mps = 0.0001 * duration_days  # Simplified
-            delta_v_kmps = delta_v_mps / 1000
+            delta_v_kmps = self.deflection_delta_v(deflection_method, deflection_params)
             
             new_velocity = original_velocity_kmps + delta_v_kmps
             
@@ -316,9 +687,7 @@ class ImpactPhysics:
         elif deflection_method == 'nuclear':
             # Nuclear deflection: Large instantaneous change
             yield_megatons = deflection_params.get('yield_megatons', 1)
-            
-            # Simplified delta-v estimate
-            delta_v_kmps = 0.001 * (yield_megatons ** 0.5)
+            delta_v_kmps = self.deflection_delta_v(deflection_method, deflection_params)
             new_velocity = original_velocity_kmps + delta_v_kmps
             
             return {
@@ -0,0 +1,44 @@
+"""
+Custom DRF renderers
+"""
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON (selected with ?format=ndjson)
+    
+    Views stream their listings themselves; this renderer only handles
+    ordinary Response objects, e.g. errors, as NDJSON lines.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, dict) and isinstance(data.get('asteroids'), list):
+            records = data['asteroids']
+        else:
+            records = [data]
+        return ''.join(json.dumps(record) + '\n' for record in records).encode(self.charset)
+
+
+class ColumnarRenderer(BaseRenderer):
+    """
+    Columnar binary catalog (selected with ?format=columnar, see api.catalog)
+    
+    Views encode listings themselves; ordinary Response objects (errors)
+    are rendered as JSON.
+    """
+    media_type = 'application/vnd.neo-columnar'
+    format = 'columnar'
+    charset = None
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return json.dumps(data).encode('utf-8')
@@ -0,0 +1,151 @@
+"""
+Simulation Result Cache
+In-process LRU cache for POST simulation endpoints, keyed by a canonical,
+quantised hash of the request parameters
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """LRU + TTL cache of simulation responses with hit-rate reporting"""
+    
+    # Request keys holding geographic coordinates (quantised, not just normalised)
+    COORDINATE_KEYS = ('impact_lat', 'impact_lon', 'lat', 'lon', 'latitude', 'longitude')
+    
+    def __init__(self, max_entries=1024, ttl_seconds=60 * 60,
+                 coord_precision=3, float_digits=9, enabled=True):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Age after which an entry is treated as a miss
+            coord_precision: Decimal places kept for coordinates (3 = ~110 m)
+            float_digits: Significant digits kept for every other float
+            enabled: When False every lookup misses and nothing is stored
+        """
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.coord_precision = coord_precision
+        self.float_digits = float_digits
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def canonicalize(self, value, key=None):
+        """
+        Normalise a request value so equivalent bodies compare equal
+        
+        Dict keys are sorted, ints and floats share one representation
+        (20 == 20.0), floats are rounded to float_digits significant digits
+        and coordinates to coord_precision decimal places.
+        """
+        if isinstance(value, dict):
+            return {
+                str(k): self.canonicalize(v, k)
+                for k, v in sorted(value.items(), key=lambda item: str(item[0]))
+            }
+        if isinstance(value, (list, tuple)):
+            return [self.canonicalize(v) for v in value]
+        if isinstance(value, bool) or value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (int, float)):
+            number = float(value)
+            if key in self.COORDINATE_KEYS:
+                number = round(number, self.coord_precision)
+            else:
+                number = float(f'{number:.{self.float_digits}g}')
+            return number + 0.0  # -0.0 -> 0.0
+        return str(value)
+    
+    def make_key(self, namespace, params):
+        """
+        Build the cache key for a request
+        
+        Args:
+            namespace: Endpoint name, so identical bodies on different endpoints never collide
+            params: Parsed request parameters
+        
+        Returns:
+            str: sha256 hex digest of the canonical JSON
+        """
+        canonical = json.dumps(
+            [namespace, self.canonicalize(params)],
+            sort_keys=True, separators=(',', ':'), allow_nan=True
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Return the cached value or None (counts a hit or a miss)"""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries past max_entries"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def get_or_compute(self, key, compute):
+        """
+        Return (value, hit), calling compute() on a miss
+        
+        compute runs outside the lock; two concurrent misses on the same key
+        both compute and the later one wins, which is harmless for
+        deterministic simulations.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value, True
+        value = compute()
+        self.set(key, value)
+        return value, False
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def stats(self):
+        """Size, limits and hit-rate counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'coord_precision': self.coord_precision,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+# Singleton instance
+simulation_cache = ResultCache()
@@ -0,0 +1,250 @@
+"""
+Incremental Impact Simulation Graph
+Memoized stages (mass -> energy -> crater/blast/seismic -> casualties) that
+recompute only when their own inputs or the value of an upstream stage changed
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+class SimulationGraph:
+    """Dependency graph of memoized impact simulation stages"""
+    
+    # stage -> (request parameters it reads, upstream stages), in topological order
+    STAGES = OrderedDict([
+        ('mass', (('diameter_km', 'density'), ())),
+        ('energy', (('velocity_kmps',), ('mass',))),
+        ('table', (('diameter_km', 'velocity_kmps', 'impact_angle', 'density', 'mode'), ())),
+        ('entry', (('diameter_km', 'velocity_kmps', 'impact_angle', 'density'), ('table',))),
+        ('crater', (('impact_angle',), ('energy', 'entry', 'table'))),
+        ('blast', ((), ('energy', 'entry', 'table'))),
+        ('seismic', ((), ('energy', 'table'))),
+        ('result', (('impact_lat', 'impact_lon', 'impact_angle', 'diameter_km', 'velocity_kmps', 'density'),
+                    ('mass', 'energy', 'table', 'entry', 'crater', 'blast', 'seismic'))),
+        ('sensitivity', (('sensitivity',), ('result',))),
+        ('location', (('impact_lat', 'impact_lon'), ())),
+        ('casualties', (('impact_lat', 'impact_lon'), ('location', 'blast', 'energy'))),
+    ])
+    
+    DEFAULTS = {
+        'impact_lat': 0,
+        'impact_lon': 0,
+        'impact_angle': 45,
+        'density': None,
+        'mode': 'exact',
+        'sensitivity': False,
+    }
+    
+    def __init__(self, engine, casualty_calculator=None):
+        """
+        Args:
+            engine: ImpactPhysics instance
+            casualty_calculator: CasualtyCalculator, needed for the location/casualties stages
+        """
+        self.engine = engine
+        self.casualty_calculator = casualty_calculator
+        self._keys = {}
+        self._values = {}
+        self._versions = {}
+        self.last_reused = []
+        self.last_recomputed = []
+        self.lock = threading.Lock()
+    
+    def evaluate(self, params, targets=('result', 'sensitivity')):
+        """
+        Bring the requested stages up to date for the given parameters
+        
+        Args:
+            params: Simulation parameters (diameter_km, velocity_kmps, ...)
+            targets: Stages whose values are needed
+        
+        Returns:
+            dict: Stage name -> value for every evaluated stage
+        """
+        params = dict(self.DEFAULTS, **params)
+        needed = self._with_dependencies(targets)
+        
+        reused, recomputed = [], []
+        for stage, (param_names, upstream) in self.STAGES.items():
+            if stage not in needed:
+                continue
+            key = (
+                tuple(params[name] for name in param_names),
+                tuple(self._versions[name] for name in upstream),
+            )
+            if stage in self._keys and self._keys[stage] == key:
+                reused.append(stage)
+                continue
+            
+            value = getattr(self, '_stage_' + stage)(params)
+            # Downstream stages only see a new version when the value changed
+            # (e.g. an angle-only change leaves the exact-mode 'table' at None)
+            if stage not in self._values or not _same_value(self._values[stage], value):
+                self._versions[stage] = self._versions.get(stage, 0) + 1
+            self._values[stage] = value
+            self._keys[stage] = key
+            recomputed.append(stage)
+        
+        self.last_reused, self.last_recomputed = reused, recomputed
+        return {stage: self._values[stage] for stage in needed}
+    
+    def _with_dependencies(self, targets):
+        needed = set()
+        pending = list(targets)
+        while pending:
+            stage = pending.pop()
+            if stage not in needed:
+                needed.add(stage)
+                pending.extend(self.STAGES[stage][1])
+        return needed
+    
+    # Stages -------------------------------------------------------------
+    
+    def _stage_mass(self, params):
+        return self.engine.calculate_mass(params['diameter_km'], params['density'])
+    
+    def _stage_energy(self, params):
+        return self.engine.calculate_impact_energy(self._values['mass'], params['velocity_kmps'])
+    
+    def _stage_table(self, params):
+        """Lookup-table results, or None when the exact path is used"""
+        engine = self.engine
+        if params['mode'] != 'table' or params['density'] not in (None, engine.ASTEROID_DENSITY):
+            return None
+        tables = engine.lookup_tables.get()
+        if not tables.covers(params['diameter_km'], params['velocity_kmps'], params['impact_angle']):
+            return None
+        return tables.lookup_effects(params['diameter_km'], params['velocity_kmps'], params['impact_angle'])
+    
+    def _stage_entry(self, params):
+        if self._values['table'] is not None:
+            return self._values['table'][3]
+        return self.engine.calculate_atmospheric_entry(
+            params['diameter_km'], params['velocity_kmps'], params['impact_angle'], params['density']
+        )
+    
+    def _stage_crater(self, params):
+        if self._values['table'] is not None:
+            return self._values['table'][0]
+        crater = self.engine.crater_from_energy(
+            self._values['energy']['energy_megatons_tnt'], params['impact_angle']
+        )
+        if self._values['entry']['is_airburst']:
+            return self.engine._airburst_crater(crater)
+        crater['formed'] = True
+        return crater
+    
+    def _stage_blast(self, params):
+        if self._values['table'] is not None:
+            return self._values['table'][1]
+        blast = self.engine.blast_from_energy(self._values['energy']['energy_megatons_tnt'])
+        if self._values['entry']['is_airburst']:
+            return self.engine._airburst_blast(blast, self._values['entry'])
+        return blast
+    
+    def _stage_seismic(self, params):
+        if self._values['table'] is not None:
+            return self._values['table'][2]
+        return self.engine.seismic_from_energy(self._values['energy']['energy_joules'])
+    
+    def _stage_result(self, params):
+        engine = self.engine
+        mass_kg = self._values['mass']
+        energy = self._values['energy']
+        
+        # Check if impact is in ocean (simplified: assume 70% of Earth is ocean)
+        is_ocean_impact = False  # Would need real geographic data
+        
+        return {
+            'asteroid': {
+                'diameter_km': params['diameter_km'],
+                'diameter_m': params['diameter_km'] * 1000,
+                'mass_kg': mass_kg,
+                'mass_tons': mass_kg / 1000,
+                'velocity_kmps': params['velocity_kmps'],
+                'density_kg_m3': params['density'] or engine.ASTEROID_DENSITY
+            },
+            'impact_location': {
+                'latitude': params['impact_lat'],
+                'longitude': params['impact_lon'],
+                'angle': params['impact_angle'],
+                'is_ocean': is_ocean_impact
+            },
+            'energy': energy,
+            'atmospheric_entry': self._values['entry'],
+            'crater': self._values['crater'],
+            'blast_zones': self._values['blast'],
+            'seismic_effects': self._values['seismic'],
+            'severity': engine._assess_severity(energy['energy_megatons_tnt']),
+            'physics_mode': 'exact' if self._values['table'] is None else 'table'
+        }
+    
+    def _stage_sensitivity(self, params):
+        if not params['sensitivity']:
+            return None
+        return self.engine.calculate_sensitivities(self._values['result'])
+    
+    def _stage_location(self, params):
+        return self.casualty_calculator.get_location_info_from_api(
+            params['impact_lat'], params['impact_lon']
+        )
+    
+    def _stage_casualties(self, params):
+        return self.casualty_calculator.calculate_casualties(
+            impact_lat=params['impact_lat'],
+            impact_lon=params['impact_lon'],
+            blast_radius_km=self._values['blast']['total_destruction_radius_km'],
+            energy_megatons=self._values['energy']['energy_megatons_tnt'],
+            location_info=self._values['location']
+        )
+
+
+def _same_value(old, new):
+    """Equality of stage values; values that cannot be compared count as changed"""
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        return False
+
+
+class SimulationSessionStore:
+    """In-process store of simulation graphs for follow-up "what-if" requests"""
+    
+    def __init__(self, max_sessions=500, ttl_seconds=30 * 60):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_create(self, session_id, factory):
+        """
+        Return (session_id, graph, created) for an existing or new session
+        
+        Unknown or expired ids start a fresh session under a new id, so a
+        request that lands on another worker process still succeeds (it just
+        recomputes every stage).
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.pop(session_id, None) if session_id else None
+            if entry is not None and now - entry[1] > self.ttl_seconds:
+                entry = None
+            
+            created = entry is None
+            if created:
+                session_id = uuid.uuid4().hex
+                graph = factory()
+            else:
+                graph = entry[0]
+            
+            self._sessions[session_id] = (graph, now)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        
+        return session_id, graph, created
+
+
+# Singleton instance
+simulation_sessions = SimulationSessionStore()
@@ -0,0 +1,245 @@
+"""
+Streaming Simulations
+Generators that yield partial aggregates (running Monte Carlo percentiles,
+completed grid tiles) as server-sent events, stopped when the client disconnects
+"""
+import json
+import math
+import threading
+import uuid
+
+import numpy as np
+from asgiref.sync import sync_to_async
+
+from .physics import physics_engine
+
+
+class SimulationStreams:
+    """Registry of open streams plus the Monte Carlo and grid-tile generators"""
+    
+    # Outputs summarised in Monte Carlo percentile events
+    MONTE_CARLO_OUTPUTS = (
+        'energy_megatons_tnt',
+        'crater_diameter_km',
+        'total_destruction_radius_km',
+        'severe_damage_radius_km',
+        'thermal_radiation_radius_km',
+        'richter_magnitude',
+    )
+    PERCENTILES = (5, 25, 50, 75, 95)
+    
+    # Grid-tile outputs
+    TILE_OUTPUTS = (
+        'energy_megatons_tnt',
+        'is_airburst',
+        'crater_diameter_km',
+        'total_destruction_radius_km',
+        'richter_magnitude',
+    )
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self._cancel_events = {}
+        self._lock = threading.Lock()
+    
+    def open(self):
+        """Register a stream; returns (stream_id, cancel_event)"""
+        stream_id = uuid.uuid4().hex
+        event = threading.Event()
+        with self._lock:
+            self._cancel_events[stream_id] = event
+        return stream_id, event
+    
+    def cancel(self, stream_id):
+        """
+        Stop a stream after its current batch; False if it is not open
+        
+        Streams are cancelled when their client disconnects. The registry is
+        per process, so it is not exposed as an endpoint: with several
+        workers a cancel request could land on a process without the stream.
+        """
+        with self._lock:
+            event = self._cancel_events.get(stream_id)
+        if event is None:
+            return False
+        event.set()
+        return True
+    
+    def close(self, stream_id):
+        with self._lock:
+            self._cancel_events.pop(stream_id, None)
+    
+    @staticmethod
+    def parse_monte_carlo(data, max_samples):
+        """
+        monte_carlo() params from query parameters or a job body
+        
+        Raises:
+            ValueError: Missing, malformed or out-of-range values
+        """
+        params = {
+            'diameter_km': float(data.get('diameter_km', 0.05)),
+            'diameter_sigma': float(data.get('diameter_sigma', 0.3)),
+            'velocity_kmps': float(data.get('velocity_kmps', 20)),
+            'velocity_sigma': float(data.get('velocity_sigma', 3)),
+            'density': float(data['density']) if data.get('density') else None,
+            'samples': int(data.get('samples', 10000)),
+            'batch_size': int(data.get('batch_size', 1000)),
+            'seed': int(data['seed']) if data.get('seed') not in (None, '') else None
+        }
+        if params['diameter_km'] <= 0 or params['velocity_kmps'] <= 0:
+            raise ValueError('Invalid parameters. Diameter and velocity must be positive.')
+        if not 0 < params['samples'] <= max_samples or params['batch_size'] <= 0:
+            raise ValueError(f'samples must be between 1 and {max_samples}')
+        return params
+    
+    def monte_carlo(self, params, cancelled):
+        """
+        Monte Carlo impact ensemble, yielding running percentiles per batch
+        
+        Diameters are log-normal around diameter_km, velocities normal
+        (truncated at Earth's 11.2 km/s escape speed) and entry angles follow
+        the isotropic-flux distribution P(angle) ~ sin(2 angle).
+        
+        Args:
+            params: diameter_km, diameter_sigma (log-space), velocity_kmps,
+                    velocity_sigma, density, samples, batch_size, seed
+            cancelled: threading.Event checked between batches
+        
+        Yields:
+            (event, data) tuples
+        """
+        rng = np.random.default_rng(params['seed'])
+        samples, batch_size = params['samples'], params['batch_size']
+        collected = {key: [] for key in self.MONTE_CARLO_OUTPUTS + ('is_airburst',)}
+        
+        done = 0
+        while done < samples:
+            if cancelled.is_set():
+                yield 'cancelled', {'completed': done, 'total': samples}
+                return
+            
+            size = min(batch_size, samples - done)
+            diameter = params['diameter_km'] * np.exp(rng.normal(0.0, params['diameter_sigma'], size))
+            velocity = rng.normal(params['velocity_kmps'], params['velocity_sigma'], size)
+            velocity = np.maximum(velocity, 11.2)
+            angle = np.degrees(np.arcsin(np.sqrt(rng.uniform(0.0, 1.0, size))))
+            angle = np.clip(angle, 1.0, 90.0)
+            
+            effects = self.engine.calculate_batch_impact_effects(
+                diameter, velocity, angle, params['density']
+            )
+            for key in collected:
+                collected[key].append(effects[key])
+            done += size
+            
+            summary = {
+                key: self._percentiles(np.concatenate(collected[key]))
+                for key in self.MONTE_CARLO_OUTPUTS
+            }
+            yield 'progress', {
+                'completed': done,
+                'total': samples,
+                'airburst_fraction': float(np.mean(np.concatenate(collected['is_airburst']))),
+                'percentiles': summary
+            }
+        
+        yield 'complete', {'completed': done, 'total': samples}
+    
+    def grid_tiles(self, params, cancelled):
+        """
+        Impact effects over a diameter x velocity grid, one tile of rows at a time
+        
+        Args:
+            params: diameter (min, max, num, log-spaced), velocity (min, max, num),
+                    impact_angle, density, tile_rows
+            cancelled: threading.Event checked between tiles
+        
+        Yields:
+            (event, data) tuples
+        """
+        diameters = np.geomspace(
+            params['diameter_min_km'], params['diameter_max_km'], params['diameter_num']
+        )
+        velocities = np.linspace(
+            params['velocity_min_kmps'], params['velocity_max_kmps'], params['velocity_num']
+        )
+        tile_rows = params['tile_rows']
+        tiles = math.ceil(diameters.size / tile_rows)
+        
+        yield 'grid', {
+            'diameter_km': diameters.tolist(),
+            'velocity_kmps': velocities.tolist(),
+            'impact_angle': params['impact_angle'],
+            'tiles': tiles
+        }
+        
+        for tile in range(tiles):
+            if cancelled.is_set():
+                yield 'cancelled', {'completed_tiles': tile, 'tiles': tiles}
+                return
+            
+            rows = slice(tile * tile_rows, min((tile + 1) * tile_rows, diameters.size))
+            d, v = np.meshgrid(diameters[rows], velocities, indexing='ij')
+            effects = self.engine.calculate_batch_impact_effects(
+                d, v, params['impact_angle'], params['density']
+            )
+            yield 'tile', {
+                'tile': tile,
+                'row_start': rows.start,
+                'row_stop': rows.stop,
+                'values': {key: effects[key].tolist() for key in self.TILE_OUTPUTS}
+            }
+        
+        yield 'complete', {'completed_tiles': tiles, 'tiles': tiles}
+    
+    def _percentiles(self, values):
+        points = np.percentile(values, self.PERCENTILES)
+        stats = {f'p{p}': float(x) for p, x in zip(self.PERCENTILES, points)}
+        stats['mean'] = float(np.mean(values))
+        return stats
+    
+    def event_stream(self, stream_id, events):
+        """
+        Format (event, data) tuples as SSE text and unregister the stream at the end
+        
+        The first event tells the client its stream id; closing the
+        connection stops the stream.
+        """
+        try:
+            yield format_sse('open', {'stream_id': stream_id})
+            for event, data in events:
+                yield format_sse(event, data)
+        finally:
+            self.close(stream_id)
+    
+    async def async_event_stream(self, stream_id, events):
+        """
+        ASGI variant of event_stream: each batch is computed in a worker thread
+        so the event loop keeps serving other requests
+        """
+        iterator = self.event_stream(stream_id, events)
+        step = sync_to_async(_next_or_none, thread_sensitive=False)
+        try:
+            while True:
+                chunk = await step(iterator)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            # Client went away (or the stream finished): stop computing
+            self.cancel(stream_id)
+            self.close(stream_id)
+
+
+def format_sse(event, data):
+    """One server-sent event"""
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
+
+
+def _next_or_none(iterator):
+    return next(iterator, None)
+
+
+# Singleton instance
+simulation_streams = SimulationStreams(physics_engine)
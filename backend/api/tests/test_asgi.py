@@ -0,0 +1,62 @@
+import asyncio
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from backend.asgi import application
+
+
+class SlowResponse:
+    status_code = 200
+    headers = {}
+    
+    def __init__(self, asteroid_id):
+        self.asteroid_id = asteroid_id
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return {'id': self.asteroid_id, 'name': f'({self.asteroid_id})', 'estimated_diameter': {},
+                'close_approach_data': []}
+
+
+def slow_nasa(url, params=None, timeout=None, **kwargs):
+    time.sleep(0.5)
+    return SlowResponse(url.rsplit('/', 1)[-1])
+
+
+async def asgi_get(path):
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+        'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+        'headers': [(b'host', b'localhost')], 'server': ('localhost', 80), 'client': ('127.0.0.1', 1)
+    }
+    messages = []
+    
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    await application(scope, receive, send)
+    return messages[0]['status']
+
+
+class ASGIConcurrencyTests(SimpleTestCase):
+    @mock.patch('requests.get', slow_nasa)
+    def test_slow_sync_views_do_not_block_each_other(self):
+        async def run():
+            return await asyncio.gather(
+                *(asgi_get(f'/api/asteroids/{3000000 + i}') for i in range(4)), asgi_get('/api/health')
+            )
+        
+        started = time.perf_counter()
+        statuses = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+        
+        self.assertEqual(statuses, [200] * 5)
+        # Four 0.5 s NASA calls in parallel threads, not one after another
+        self.assertLess(elapsed, 1.5)
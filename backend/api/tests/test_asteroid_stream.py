@@ -0,0 +1,121 @@
+import json
+from datetime import date, timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+
+def neo(asteroid_id, hazardous=False):
+    return {'id': asteroid_id, 'name': f'({asteroid_id})', 'is_potentially_hazardous_asteroid': hazardous,
+            'estimated_diameter': {}, 'close_approach_data': []}
+
+
+class FakeResponse:
+    """Streamed NASA response (used as a context manager by the client)"""
+    
+    headers = {}
+    status_code = 200
+    
+    def __init__(self, payload):
+        self.body = json.dumps(payload).encode()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    def iter_content(self, chunk_size=1):
+        for offset in range(0, len(self.body), chunk_size):
+            yield self.body[offset:offset + chunk_size]
+    
+    def json(self):
+        return json.loads(self.body)
+
+
+def fake_nasa(url, params=None, **kwargs):
+    if url.endswith('/feed'):
+        return FakeResponse({'element_count': 1, 'near_earth_objects': {
+            params['start_date']: [neo(f"feed-{params['start_date']}")]
+        }})
+    return FakeResponse({'page': {'number': params['page'], 'total_pages': 2}, 'near_earth_objects': [
+        neo(f"browse-{params['page']}-a", hazardous=True), neo(f"browse-{params['page']}-b")
+    ]})
+
+
+@override_settings(NEO_FEED_MAX_DAYS=30, NEO_BROWSE_MAX_PAGES=5)
+@mock.patch('requests.get', side_effect=fake_nasa)
+class NDJSONListingTests(SimpleTestCase):
+    def stream(self, **params):
+        response = self.client.get('/api/asteroids', dict(params, format='ndjson'))
+        if response.status_code != 200:
+            return response, None
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        return response, [json.loads(line) for line in lines]
+    
+    def test_feed_range_is_fetched_week_by_week(self, get):
+        response, records = self.stream(start_date='2024-01-01', end_date='2024-01-20')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual([record['id'] for record in records],
+                         ['feed-2024-01-01', 'feed-2024-01-09', 'feed-2024-01-17'])
+    
+    def test_range_over_limit_is_rejected(self, get):
+        response, _ = self.stream(start_date='2024-01-01', end_date='2024-03-01')
+        
+        self.assertEqual(response.status_code, 400)
+        get.assert_not_called()
+    
+    def test_end_date_alone_is_checked_from_today(self, get):
+        response, _ = self.stream(end_date='2200-01-01')
+        
+        self.assertEqual(response.status_code, 400)
+        get.assert_not_called()
+    
+    def test_start_date_alone_defaults_to_one_week(self, get):
+        response, records = self.stream(start_date='2024-01-01')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(get.call_args.kwargs['params']['end_date'], '2024-01-08')
+    
+    def test_end_before_start_is_rejected(self, get):
+        response, _ = self.stream(start_date='2024-01-10', end_date='2024-01-01')
+        
+        self.assertEqual(response.status_code, 400)
+    
+    def test_default_range_is_within_limit(self, get):
+        response, _ = self.stream()
+        
+        self.assertEqual(response.status_code, 200)
+        params = get.call_args.kwargs['params']
+        self.assertEqual(params['start_date'], date.today().isoformat())
+        self.assertEqual(params['end_date'], (date.today() + timedelta(days=7)).isoformat())
+    
+    def test_malformed_date_is_rejected(self, get):
+        response, _ = self.stream(start_date='01/01/2024')
+        
+        self.assertEqual(response.status_code, 400)
+    
+    def test_browse_streams_the_catalog(self, get):
+        response, records = self.stream(browse='true', pages=2)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(call.args[0].endswith('/neo/browse') for call in get.call_args_list))
+        self.assertEqual([record['id'] for record in records],
+                         ['browse-0-a', 'browse-0-b', 'browse-1-a', 'browse-1-b'])
+    
+    def test_hazardous_only_filters_browse_pages(self, get):
+        response, records = self.stream(hazardous_only='true', pages=2)
+        
+        self.assertEqual([record['id'] for record in records], ['browse-0-a', 'browse-1-a'])
+    
+    def test_browse_pages_over_limit_are_rejected(self, get):
+        response, _ = self.stream(browse='true', pages=6)
+        
+        self.assertEqual(response.status_code, 400)
+        get.assert_not_called()
@@ -0,0 +1,63 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.atmosphere import atmospheric_entry
+from api.physics import physics_engine
+
+
+class AtmosphericEntryTests(SimpleTestCase):
+    def test_small_stony_body_bursts_in_the_air(self):
+        # Chelyabinsk-like: ~20 m at 19 km/s, shallow entry
+        entry = atmospheric_entry.simulate(0.02, 19, 18, 3300)
+        
+        self.assertTrue(entry['is_airburst'])
+        self.assertGreater(entry['burst_altitude_m'], 15000)
+        self.assertGreater(entry['breakup_altitude_m'], entry['burst_altitude_m'])
+        self.assertAlmostEqual(entry['energy_deposited_fraction'], 1.0)
+        self.assertEqual(entry['impact_energy_joules'], 0.0)
+    
+    def test_large_body_reaches_the_ground(self):
+        entry = atmospheric_entry.simulate(1.0, 20, 45, 3000)
+        
+        self.assertFalse(entry['is_airburst'])
+        self.assertEqual(entry['burst_altitude_m'], 0.0)
+        self.assertIsNone(entry['total_destruction_radius_km'])
+        self.assertGreater(entry['impact_velocity_kmps'], 15)
+        self.assertLess(entry['energy_deposited_joules'], entry['initial_energy_joules'])
+    
+    def test_batch_matches_single_bodies(self):
+        diameters = np.array([0.01, 0.05, 0.3])
+        velocities = np.array([15.0, 20.0, 25.0])
+        angles = np.array([30.0, 45.0, 80.0])
+        batch = atmospheric_entry.simulate_batch(diameters, velocities, angles, 3000)
+        
+        for i in range(len(diameters)):
+            single = atmospheric_entry.simulate(diameters[i], velocities[i], angles[i], 3000)
+            self.assertEqual(bool(batch['is_airburst'][i]), single['is_airburst'])
+            self.assertAlmostEqual(batch['burst_altitude_m'][i], single['burst_altitude_m'], places=6)
+            self.assertAlmostEqual(
+                batch['energy_deposited_joules'][i] / single['energy_deposited_joules'], 1.0, places=9
+            )
+    
+    def test_airburst_replaces_crater_and_blast(self):
+        result = physics_engine.calculate_full_impact_simulation(0.02, 19, impact_angle=18)
+        
+        self.assertFalse(result['crater']['formed'])
+        self.assertEqual(result['crater']['crater_diameter_km'], 0)
+        self.assertIn('burst_altitude_km', result['blast_zones'])
+    
+    def test_batch_effects_match_the_full_simulation(self):
+        diameters = np.array([0.02, 0.3, 2.0])
+        velocities = np.array([19.0, 20.0, 30.0])
+        angles = np.array([18.0, 45.0, 90.0])
+        batch = physics_engine.calculate_batch_impact_effects(diameters, velocities, angles, 2500)
+        
+        for i in range(len(diameters)):
+            full = physics_engine.calculate_full_impact_simulation(
+                diameters[i], velocities[i], impact_angle=angles[i], density=2500
+            )
+            self.assertEqual(batch['energy_joules'][i], full['energy']['energy_joules'])
+            self.assertEqual(batch['crater_diameter_km'][i], full['crater']['crater_diameter_km'])
+            self.assertEqual(batch['richter_magnitude'][i], full['seismic_effects']['richter_magnitude'])
+            for key in ('fireball_radius_km', 'thermal_radiation_radius_km', 'total_destruction_radius_km'):
+                np.testing.assert_allclose(batch[key][i], full['blast_zones'][key], rtol=1e-9)
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.catalog import CatalogIndex, NEOCatalog
+from api.catalog_snapshot import load_snapshot, save_snapshot
+from api.catalog_store import catalog_store
+
+
+def make_records():
+    return [
+        {'id': '1', 'name': 'Alpha', 'is_potentially_hazardous': True, 'diameter_km': 0.5,
+         'velocity_kmps': 20.0, 'miss_distance_lunar': 5.0, 'close_approach_date': '2025-01-10',
+         'orbital_data': {'orbit_id': '7', 'eccentricity': '0.2'}},
+        {'id': '2', 'name': 'Beta', 'is_potentially_hazardous': False, 'diameter_km': 0.05,
+         'velocity_kmps': 12.5, 'miss_distance_lunar': 30.0, 'close_approach_date': '2025-03-01'},
+        {'id': '3', 'name': 'Gamma', 'is_potentially_hazardous': True, 'diameter_km': 1.2,
+         'velocity_kmps': 31.0, 'miss_distance_lunar': None, 'close_approach_date': '2025-02-14'},
+        {'id': '4', 'name': 'Delta', 'is_potentially_hazardous': False, 'diameter_km': None,
+         'velocity_kmps': 8.0, 'miss_distance_lunar': 2.0, 'close_approach_date': None},
+    ]
+
+
+class ColumnarEncodingTests(SimpleTestCase):
+    def test_round_trip(self):
+        catalog = NEOCatalog.from_records(make_records())
+        decoded = NEOCatalog.from_columnar(catalog.to_columnar_bytes())
+        
+        self.assertEqual(decoded.to_records(), catalog.to_records())
+        self.assertEqual(decoded.record(0)['orbital_data']['eccentricity'], '0.2')
+        self.assertIsNone(decoded.value('diameter_km', 3))
+    
+    def test_chunks_are_views_of_the_columns(self):
+        catalog = NEOCatalog.from_records(make_records())
+        chunks = list(catalog.to_columnar_chunks())
+        
+        views = [chunk for chunk in chunks if isinstance(chunk, memoryview)]
+        self.assertTrue(any(
+            np.shares_memory(np.frombuffer(view, dtype='|u1'), catalog.columns['velocity_kmps'])
+            for view in views
+        ))
+    
+    def test_float32(self):
+        catalog = NEOCatalog.from_records(make_records())
+        decoded = NEOCatalog.from_columnar(catalog.to_columnar_bytes('<f4'))
+        
+        self.assertEqual(decoded.columns['velocity_kmps'].dtype, np.dtype('<f4'))
+        self.assertAlmostEqual(decoded.value('velocity_kmps', 1), 12.5)
+    
+    def test_select_shares_strings_and_columns(self):
+        catalog = NEOCatalog.from_records(make_records())
+        everything = catalog.select(fields=('name', 'diameter_km'))
+        subset = catalog.select(np.array([2, 0]))
+        
+        self.assertEqual([name for name, _ in everything.fields], ['name', 'diameter_km'])
+        self.assertIs(everything.columns['diameter_km'], catalog.columns['diameter_km'])
+        self.assertEqual([record['name'] for record in subset.to_records()], ['Gamma', 'Alpha'])
+        self.assertEqual(NEOCatalog.from_columnar(subset.to_columnar_bytes()).to_records(),
+                         subset.to_records())
+    
+    def test_snapshot_round_trip(self):
+        catalog = NEOCatalog.from_records(make_records())
+        index = CatalogIndex(catalog, derived={'mass_kg': np.arange(4, dtype='<f8')})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'catalog.neos')
+            written = save_snapshot(path, index, {'version': 3})
+            
+            self.assertEqual(written, os.path.getsize(path))
+            loaded, header = load_snapshot(path)
+            self.assertEqual(loaded.catalog.to_records(), catalog.to_records())
+            self.assertEqual(header['metadata']['version'], 3)
+            total, rows = loaded.query({'mass_kg': (1, 2)})
+            self.assertEqual((total, rows.tolist()), (2, [1, 2]))
+            del loaded
+
+
+class ColumnarEndpointTests(SimpleTestCase):
+    def setUp(self):
+        index = CatalogIndex(NEOCatalog.from_records(make_records()))
+        for name, value in (('index', index), ('synced_at', time.time()), ('snapshot_path', None)):
+            patcher = mock.patch.object(catalog_store, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def fetch(self, **params):
+        with mock.patch('requests.get', side_effect=AssertionError('NASA called')):
+            response = self.client.get('/api/asteroids', dict(params, format='columnar'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/vnd.neo-columnar')
+        return NEOCatalog.from_columnar(b''.join(response.streaming_content))
+    
+    def test_serves_the_local_catalog(self):
+        self.assertEqual(self.fetch().to_records(), catalog_store.index.catalog.to_records())
+    
+    def test_filters_and_fields(self):
+        catalog = self.fetch(hazardous_only='true', fields='name,diameter_km')
+        
+        self.assertEqual(catalog.to_records(), [{'name': 'Alpha', 'diameter_km': 0.5},
+                                                {'name': 'Gamma', 'diameter_km': 1.2}])
+    
+    def test_date_window(self):
+        catalog = self.fetch(start_date='2025-02-01', end_date='2025-03-01', fields='name')
+        
+        self.assertEqual([record['name'] for record in catalog.to_records()], ['Beta', 'Gamma'])
+    
+    def test_float32(self):
+        catalog = self.fetch(precision='32')
+        
+        self.assertEqual(catalog.columns['diameter_km'].dtype, np.dtype('<f4'))
+    
+    def test_bad_date(self):
+        response = self.client.get('/api/asteroids', {'format': 'columnar', 'start_date': 'soon'})
+        
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from api.catalog import NEOCatalog
+from api.catalog_changes import ChangeLog
+from api.models import CatalogChange, CatalogEntry, CatalogVersion
+
+
+def catalog(*asteroids):
+    return NEOCatalog.from_records([
+        {'id': asteroid_id, 'name': asteroid_id, 'close_approach_date': date,
+         'is_potentially_hazardous': hazardous, 'orbital_data': {'orbit_id': '1'}}
+        for asteroid_id, date, hazardous in asteroids
+    ])
+
+
+class ChangeLogTests(TestCase):
+    def setUp(self):
+        self.log = ChangeLog()
+    
+    def test_versions_follow_recorded_syncs(self):
+        first = self.log.record(catalog(('a', '2025-01-01', False), ('b', '2025-02-01', True)))
+        second = self.log.record(catalog(('a', '2025-03-01', False), ('c', '2025-04-01', False)))
+        
+        self.assertEqual(first, {'version': 1, 'added': 2, 'updated': 0, 'removed': 0})
+        self.assertEqual(second, {'version': 2, 'added': 1, 'updated': 1, 'removed': 1})
+        self.assertEqual(self.log.current_version(), 2)
+        self.assertEqual(CatalogVersion.objects.get().version, 2)
+        self.assertEqual(sorted(CatalogEntry.objects.values_list('asteroid_id', flat=True)), ['a', 'c'])
+        
+        update = CatalogChange.objects.get(version=2, asteroid_id='a')
+        self.assertEqual(update.fields, {'close_approach_date': ['2025-01-01', '2025-03-01']})
+    
+    def test_unchanged_catalog_keeps_the_version(self):
+        self.log.record(catalog(('a', '2025-01-01', False)))
+        result = self.log.record(catalog(('a', '2025-01-01', False)))
+        
+        self.assertEqual(result['version'], 1)
+        self.assertEqual(CatalogVersion.objects.get().version, 1)
+    
+    def test_partial_sync_records_no_removals(self):
+        self.log.record(catalog(('a', '2025-01-01', False), ('b', '2025-01-02', False)))
+        result = self.log.record(catalog(('a', '2025-01-01', True)), complete=False)
+        
+        self.assertEqual((result['updated'], result['removed']), (1, 0))
+        self.assertTrue(CatalogEntry.objects.filter(asteroid_id='b').exists())
+    
+    def test_version_is_taken_from_the_counter_row(self):
+        CatalogVersion.objects.update(version=41)
+        
+        self.assertEqual(self.log.record(catalog(('a', '2025-01-01', False)))['version'], 42)
+        self.assertEqual(set(CatalogChange.objects.values_list('version', flat=True)), {42})
+    
+    def test_counter_row_is_recreated(self):
+        CatalogVersion.objects.all().delete()
+        
+        self.assertEqual(self.log.current_version(), 0)
+        self.assertEqual(self.log.record(catalog(('a', '2025-01-01', False)))['version'], 1)
+    
+    def test_changes_endpoint_pages_since_a_version(self):
+        self.log.record(catalog(('a', '2025-01-01', False), ('b', '2025-01-02', False)))
+        self.log.record(catalog(('a', '2025-01-01', True), ('b', '2025-01-02', False), ('c', '', False)))
+        
+        first = self.client.get('/api/asteroids/changes', {'since': 1, 'limit': 1}).json()
+        rest = self.client.get('/api/asteroids/changes', {
+            'since': 1, 'limit': 1, 'cursor': first['next_cursor']
+        }).json()
+        
+        self.assertEqual(first['version'], 2)
+        self.assertEqual([change['asteroid_id'] for change in first['changes'] + rest['changes']], ['a', 'c'])
+        self.assertIsNone(rest['next_cursor'])
@@ -0,0 +1,240 @@
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.catalog import CatalogIndex, NEOCatalog
+from api.catalog_store import CatalogStore, catalog_store
+
+
+def random_catalog(count=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 3650, count)
+    records = [{
+        'id': str(i),
+        'name': f'Asteroid {i}',
+        'is_potentially_hazardous': bool(rng.random() < 0.2),
+        'diameter_km': None if i % 50 == 0 else float(rng.lognormal(-1.5, 1.0)),
+        'velocity_kmps': float(rng.uniform(5, 40)),
+        'miss_distance_lunar': float(rng.uniform(0.1, 200)),
+        'close_approach_date': str(np.datetime64('2020-01-01') + int(days[i])),
+    } for i in range(count)]
+    return NEOCatalog.from_records(records)
+
+
+class CatalogIndexTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.catalog = random_catalog()
+        cls.index = CatalogIndex(cls.catalog, derived={'double_diameter': cls.catalog.columns['diameter_km'] * 2})
+    
+    def brute_force(self, ranges=(), equals=()):
+        rows = []
+        for row in range(len(self.catalog)):
+            keep = all(
+                not np.isnan(self.index.values(name)[row])
+                and (low is None or self.index.values(name)[row] >= low)
+                and (high is None or self.index.values(name)[row] <= high)
+                for name, (low, high) in dict(ranges).items()
+            ) and all(
+                self.catalog.value(name, row) == value for name, value in dict(equals).items()
+            )
+            if keep:
+                rows.append(row)
+        return rows
+    
+    def test_range_rows(self):
+        rows = self.index.range_rows('velocity_kmps', 10, 12)
+        values = self.catalog.columns['velocity_kmps'][rows]
+        
+        self.assertTrue(np.all(np.diff(values) >= 0))
+        self.assertEqual(sorted(rows.tolist()), self.brute_force({'velocity_kmps': (10, 12)}))
+    
+    def test_open_bounds_skip_missing_values(self):
+        rows = self.index.range_rows('diameter_km', low=None, high=None)
+        
+        self.assertEqual(len(rows), len(self.catalog) - 40)
+    
+    def test_multi_predicate_query_matches_brute_force(self):
+        ranges = {'diameter_km': (0.1, 1.0), 'velocity_kmps': (20, None), 'miss_distance_lunar': (None, 50)}
+        total, rows = self.index.query(ranges, {'is_potentially_hazardous': True}, limit=len(self.catalog))
+        
+        expected = self.brute_force(ranges, {'is_potentially_hazardous': True})
+        self.assertEqual(total, len(expected))
+        self.assertEqual(rows.tolist(), expected)
+    
+    def test_date_window(self):
+        window = (CatalogIndex.day_number('2022-03-01'), CatalogIndex.day_number('2022-03-31'))
+        total, rows = self.index.query({'close_approach_date': window}, limit=len(self.catalog))
+        
+        dates = [self.catalog.value('close_approach_date', int(row)) for row in rows]
+        self.assertTrue(all('2022-03-01' <= date <= '2022-03-31' for date in dates))
+        self.assertEqual(total, len(self.brute_force({'close_approach_date': window})))
+    
+    def test_derived_column(self):
+        _, rows = self.index.query({'double_diameter': (1, 2)}, limit=len(self.catalog))
+        
+        self.assertEqual(rows.tolist(), self.brute_force({'diameter_km': (0.5, 1)}))
+    
+    def test_sort_offset_and_limit(self):
+        total, rows = self.index.query(sort='diameter_km', descending=True, offset=5, limit=10)
+        _, everything = self.index.query(sort='diameter_km', descending=True, limit=len(self.catalog))
+        
+        self.assertEqual(total, len(self.catalog))
+        self.assertEqual(rows.tolist(), everything[5:15].tolist())
+        values = self.catalog.columns['diameter_km'][everything]
+        self.assertTrue(np.all(np.diff(values[~np.isnan(values)]) <= 0))
+        self.assertTrue(np.all(np.isnan(values[-40:])))
+    
+    def test_unknown_columns(self):
+        with self.assertRaises(ValueError):
+            self.index.query({'name': (0, 1)})
+        with self.assertRaises(ValueError):
+            self.index.query(equals={'velocity_kmps': True})
+    
+    def test_from_arrays_matches(self):
+        rebuilt = CatalogIndex.from_arrays(self.catalog, self.index.to_arrays())
+        ranges = {'velocity_kmps': (15, 25), 'close_approach_date': (18500, 19000)}
+        
+        self.assertEqual(rebuilt.query(ranges, limit=5000)[1].tolist(),
+                         self.index.query(ranges, limit=5000)[1].tolist())
+    
+    def test_query_endpoint(self):
+        with mock.patch.object(catalog_store, 'index', self.index), \
+                mock.patch.object(catalog_store, 'synced_at', time.time()), \
+                mock.patch.object(catalog_store, 'snapshot_path', None):
+            response = self.client.get('/api/asteroids/query', {
+                'velocity_kmps_min': 30, 'hazardous': 'true', 'sort': '-velocity_kmps',
+                'limit': 5, 'fields': 'name,velocity_kmps'
+            })
+            bad = self.client.get('/api/asteroids/query', {'sort': 'name'})
+        
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['count'], len(self.brute_force(
+            {'velocity_kmps': (30, None)}, {'is_potentially_hazardous': True}
+        )))
+        speeds = [asteroid['velocity_kmps'] for asteroid in body['asteroids']]
+        self.assertEqual(speeds, sorted(speeds, reverse=True))
+        self.assertEqual(bad.status_code, 400)
+
+
+class FakeBrowseClient:
+    """NASA client whose single browse page is released by the test"""
+    
+    def __init__(self, catalog):
+        self.records = catalog.to_records()
+        self.release = threading.Event()
+        self.calls = 0
+    
+    def browse(self, cursor=None):
+        self.calls += 1
+        self.release.wait(5)
+        return {'asteroids': self.records, 'pages_scanned': 1, 'next_cursor': None, 'total_pages': 1}
+
+
+class CatalogStoreTests(SimpleTestCase):
+    def make_store(self, **options):
+        client = FakeBrowseClient(random_catalog(50))
+        store = CatalogStore(client, **options)
+        store.changes = mock.Mock(**{'record.return_value': {'version': 1}})
+        self.addCleanup(store.join_background, 5)
+        self.addCleanup(client.release.set)
+        return store, client
+    
+    def test_cold_get_syncs_in_the_background_once(self):
+        store, client = self.make_store()
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        
+        self.assertEqual(results, [None] * 5)
+        self.assertTrue(store.loading)
+        client.release.set()
+        store.join_background(5)
+        
+        self.assertFalse(store.loading)
+        self.assertEqual(len(store.get().catalog), 50)
+        self.assertEqual(client.calls, 1)
+    
+    def test_block_syncs_in_the_calling_thread(self):
+        store, client = self.make_store()
+        client.release.set()
+        
+        self.assertEqual(len(store.get(block=True).catalog), 50)
+    
+    def test_failed_sync_is_retried_after_a_pause(self):
+        store, client = self.make_store(snapshot_check_seconds=60)
+        client.browse = mock.Mock(return_value={'error': 'NASA API request failed'})
+        
+        self.assertIsNone(store.get())
+        store.join_background(5)
+        self.assertIsNone(store.get())
+        store.join_background(5)
+        
+        self.assertEqual(client.browse.call_count, 1)
+        self.assertEqual(store.last_sync, {'error': 'NASA API request failed'})
+    
+    def test_stale_catalog_is_served_while_refreshing(self):
+        store, client = self.make_store(ttl_seconds=60)
+        client.release.set()
+        store.get(block=True)
+        store.synced_at -= 120
+        client.release.clear()
+        
+        index = store.get()
+        self.assertIs(store.get(), index)
+        client.release.set()
+        store.join_background(5)
+        
+        self.assertIsNot(store.get(), index)
+        self.assertEqual(client.calls, 2)
+    
+    def test_views_answer_503_while_loading(self):
+        store, client = self.make_store()
+        
+        with mock.patch('api.views.catalog_store', store):
+            responses = [
+                self.client.get('/api/asteroids/query'),
+                self.client.get('/api/asteroids/search', {'q': 'aster'}),
+                self.client.get('/api/asteroids/stats'),
+                self.client.get('/api/asteroids', {'format': 'columnar'}),
+            ]
+        
+        for response in responses:
+            self.assertEqual(response.status_code, 503)
+            self.assertIn('Retry-After', response)
+        self.assertEqual(responses[0].json()['error'], 'Asteroid catalog is loading')
+        self.assertEqual(client.calls, 1)
+    
+    def test_workers_share_snapshots(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'catalog.neos')
+        writer, client = self.make_store(snapshot_path=path)
+        reader, reader_client = self.make_store(snapshot_path=path, snapshot_check_seconds=0)
+        client.release.set()
+        
+        sync = writer.sync()
+        self.assertEqual(sync['snapshot_bytes'], os.path.getsize(path))
+        
+        index = reader.get()
+        reader.join_background(5)
+        self.assertEqual(index.catalog.to_records(), writer.index.catalog.to_records())
+        self.assertEqual(reader_client.calls, 0)  # mapped, not synced
+        self.assertEqual(reader.names.search('asteroid 7', fuzzy=False)[0]['id'], '7')
+        
+        client.records = client.records[:10]
+        time.sleep(0.01)  # a new mtime for the replaced file
+        writer.sync()
+        self.assertEqual(len(reader.get().catalog), 10)
+        self.assertIs(reader.get(), reader.get())
@@ -0,0 +1,113 @@
+import time
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.catalog import CatalogIndex, NEOCatalog
+from api.catalog_stats import CatalogStats, QuantileSketch
+from api.catalog_store import catalog_store
+from api.physics import physics_engine
+
+
+def random_records(count, seed):
+    rng = np.random.default_rng(seed)
+    return [{
+        'id': str(i),
+        'is_potentially_hazardous': bool(rng.random() < 0.3),
+        'diameter_km': float(rng.lognormal(-2, 1.5)),
+        'velocity_kmps': float(rng.uniform(5, 40)),
+        'miss_distance_lunar': float(rng.uniform(0.5, 150)),
+        'close_approach_date': f'2025-{rng.integers(1, 13):02d}-15',
+    } for i in range(count)]
+
+
+def comparable(snapshot):
+    """Snapshot without its timestamp, energy total rounded (sums of deltas drift in the last bits)"""
+    energy = dict(snapshot['energy'], total_megatons_tnt=float(f"{snapshot['energy']['total_megatons_tnt']:.12g}"))
+    return dict(snapshot, updated_at=None, energy=energy)
+
+
+class QuantileSketchTests(SimpleTestCase):
+    def test_relative_accuracy(self):
+        values = np.random.default_rng(1).lognormal(0, 2, 5000)
+        sketch = QuantileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        
+        for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+            exact = np.quantile(values, q, method='lower')
+            self.assertLessEqual(abs(sketch.quantile(q) - exact) / exact, 0.0101)
+    
+    def test_removal_and_zeros(self):
+        sketch = QuantileSketch()
+        for value in (0, 5, 7):
+            sketch.add(value)
+        sketch.add(7, -1)
+        
+        self.assertEqual(sketch.quantile(0), 0.0)
+        self.assertAlmostEqual(sketch.quantile(1), 5, delta=0.05)
+        sketch.add(0, -1)
+        sketch.add(5, -1)
+        self.assertIsNone(sketch.quantile(0.5))
+        self.assertFalse(sketch.buckets)
+
+
+class CatalogStatsTests(SimpleTestCase):
+    def test_incremental_updates_match_a_fresh_build(self):
+        first = random_records(400, seed=2)
+        second = random_records(450, seed=3)[50:] + first[:30]  # changed, kept and removed rows
+        
+        incremental = CatalogStats(physics_engine)
+        incremental.update(NEOCatalog.from_records(first))
+        changes = incremental.update(NEOCatalog.from_records(second))
+        fresh = CatalogStats(physics_engine)
+        fresh.update(NEOCatalog.from_records(second))
+        
+        # ids 30-49 dropped, 50-399 redrawn, 400-449 new, 0-29 kept as they were
+        self.assertEqual(changes, {'added': 50, 'removed': 20, 'changed': 350})
+        self.assertEqual(comparable(incremental.snapshot()), comparable(fresh.snapshot()))
+    
+    def test_counts(self):
+        records = random_records(300, seed=4)
+        stats = CatalogStats(physics_engine)
+        stats.update(NEOCatalog.from_records(records))
+        snapshot = stats.snapshot()
+        
+        self.assertEqual(snapshot['count'], 300)
+        self.assertEqual(snapshot['hazardous'], sum(r['is_potentially_hazardous'] for r in records))
+        self.assertEqual(sum(c['count'] for c in snapshot['by_size_class'].values()), 300)
+        self.assertEqual(sum(snapshot['by_approach_month'].values()), 300)
+        self.assertEqual(sum(snapshot['energy']['histogram_log10_megatons'].values()), 300)
+        median = np.quantile([r['velocity_kmps'] for r in records], 0.5, method='lower')
+        self.assertAlmostEqual(snapshot['quantiles']['velocity_kmps']['p50'], median, delta=0.011 * median)
+    
+    def test_unchanged_sync_touches_nothing(self):
+        catalog = NEOCatalog.from_records(random_records(50, seed=5))
+        stats = CatalogStats(physics_engine)
+        stats.update(catalog)
+        
+        self.assertEqual(stats.update(catalog), {'added': 0, 'removed': 0, 'changed': 0})
+    
+    def test_restored_snapshot_is_served_until_the_first_update(self):
+        source = CatalogStats(physics_engine)
+        source.update(NEOCatalog.from_records(random_records(20, seed=6)))
+        stats = CatalogStats(physics_engine)
+        stats.restore(source.snapshot())
+        
+        self.assertEqual(stats.snapshot(), source.snapshot())
+        stats.update(NEOCatalog.from_records(random_records(5, seed=7)))
+        self.assertEqual(stats.snapshot()['count'], 5)
+    
+    def test_endpoint(self):
+        catalog = NEOCatalog.from_records(random_records(30, seed=8))
+        stats = CatalogStats(physics_engine)
+        stats.update(catalog)
+        with mock.patch.object(catalog_store, 'index', CatalogIndex(catalog)), \
+                mock.patch.object(catalog_store, 'synced_at', time.time()), \
+                mock.patch.object(catalog_store, 'snapshot_path', None), \
+                mock.patch.object(catalog_store, 'stats', stats):
+            response = self.client.get('/api/asteroids/stats')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 30)
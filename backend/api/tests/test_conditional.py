@@ -0,0 +1,103 @@
+from unittest import mock
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from api.conditional import ConditionalGet
+from api.nasa_api import NEORecord
+
+
+def asteroid(asteroid_id, name=None):
+    return NEORecord.from_nasa({'id': asteroid_id, 'name': name or f'({asteroid_id})',
+                                'estimated_diameter': {}, 'close_approach_data': []})
+
+
+class AsteroidDetailETagTests(SimpleTestCase):
+    def get(self, asteroid_id, etag=None, **params):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(f'/api/asteroids/{asteroid_id}', params, **headers)
+    
+    @mock.patch('api.views.nasa_api.get_asteroid_by_id', side_effect=lambda i: asteroid(i))
+    def test_etag_and_not_modified(self, fetch):
+        first = self.get('etag-1')
+        etag = first['ETag']
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertRegex(etag, r'^"[0-9a-f]{32}"$')
+        self.assertIn('max-age=600', first['Cache-Control'])
+        self.assertIn('Accept', first['Vary'])
+        
+        second = self.get('etag-1', etag=etag)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], etag)
+        self.assertEqual(second.content, b'')
+        # Answered from the remembered validator, without running the view
+        self.assertEqual(fetch.call_count, 1)
+    
+    @mock.patch('api.views.nasa_api.get_asteroid_by_id', side_effect=lambda i: asteroid(i))
+    def test_other_etag_or_query_gets_the_body(self, fetch):
+        etag = self.get('etag-2')['ETag']
+        
+        self.assertEqual(self.get('etag-2', etag='"stale"').status_code, 200)
+        projected = self.get('etag-2', etag=etag, fields='name')
+        self.assertEqual(projected.status_code, 200)
+        self.assertNotEqual(projected['ETag'], etag)
+        self.assertEqual(self.get('etag-2', etag=f'"other", {etag}').status_code, 304)
+    
+    def test_expired_validator_revalidates_against_the_body(self):
+        with mock.patch('api.views.nasa_api.get_asteroid_by_id', side_effect=lambda i: asteroid(i)) as fetch, \
+                mock.patch('api.result_cache.time.monotonic', return_value=1000.0) as clock:
+            etag = self.get('etag-3')['ETag']
+            clock.return_value += 601
+            unchanged = self.get('etag-3', etag=etag)
+            
+            self.assertEqual(unchanged.status_code, 304)
+            self.assertEqual(fetch.call_count, 2)
+            
+            clock.return_value += 601
+            fetch.side_effect = lambda i: asteroid(i, name='Renamed')
+            changed = self.get('etag-3', etag=etag)
+        
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], etag)
+    
+    @mock.patch('api.views.nasa_api.get_asteroid_by_id', return_value={'error': 'not found'})
+    def test_errors_are_not_tagged(self, fetch):
+        response = self.get('etag-4')
+        
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
+
+
+class ConditionalGetTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.calls = 0
+    
+    def view(self, request):
+        self.calls += 1
+        return HttpResponse(b'body')
+    
+    def test_wildcard_matches(self):
+        view = ConditionalGet(max_age=60, max_entries=10)(self.view)
+        
+        response = view(self.factory.get('/x', HTTP_IF_NONE_MATCH='*'))
+        
+        self.assertEqual(response.status_code, 304)
+    
+    def test_accept_header_is_part_of_the_key(self):
+        view = ConditionalGet(max_age=60, max_entries=10)(self.view)
+        etag = view(self.factory.get('/x'))['ETag']
+        
+        view(self.factory.get('/x', HTTP_ACCEPT='application/x-ndjson', HTTP_IF_NONE_MATCH=etag))
+        
+        self.assertEqual(self.calls, 2)
+    
+    def test_post_and_streaming_pass_through(self):
+        streaming = ConditionalGet(max_age=60, max_entries=10)(
+            lambda request: StreamingHttpResponse(iter([b'a', b'b']))
+        )
+        plain = ConditionalGet(max_age=60, max_entries=10)(self.view)
+        
+        self.assertNotIn('ETag', streaming(self.factory.get('/x')))
+        self.assertNotIn('ETag', plain(self.factory.post('/x')))
@@ -0,0 +1,143 @@
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIClient
+
+from api.deflection import DeflectionOptimizer, deflection_optimizer
+from api.result_cache import simulation_cache
+
+
+def brute_force_frontier(mass, effectiveness, lead_time):
+    """Points no other point beats on every objective (as value triples)"""
+    frontier = set()
+    for i in range(mass.size):
+        no_worse = (mass <= mass[i]) & (lead_time <= lead_time[i]) & (effectiveness >= effectiveness[i])
+        better = (mass < mass[i]) | (lead_time < lead_time[i]) | (effectiveness > effectiveness[i])
+        if not (no_worse & better).any():
+            frontier.add((mass[i], effectiveness[i], lead_time[i]))
+    return frontier
+
+
+class ParetoFrontierTests(SimpleTestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            n = int(rng.integers(1, 60))
+            # Small integer ranges force ties on every objective
+            mass, effectiveness, lead_time = (rng.integers(0, 6, n).astype(float) for _ in range(3))
+            frontier = DeflectionOptimizer.pareto_frontier(mass, effectiveness, lead_time)
+            found = {(mass[i], effectiveness[i], lead_time[i]) for i in frontier}
+            
+            self.assertEqual(found, brute_force_frontier(mass, effectiveness, lead_time))
+            self.assertEqual(len(found), frontier.size)  # one representative per duplicate
+    
+    def test_empty_input(self):
+        empty = np.empty(0)
+        
+        self.assertEqual(DeflectionOptimizer.pareto_frontier(empty, empty, empty).size, 0)
+
+
+class SweepLimitTests(SimpleTestCase):
+    def test_axis_size_is_limited(self):
+        with self.assertRaises(ValueError):
+            deflection_optimizer.parse_grid({'min': 1, 'max': 10, 'num': 1000000})
+        with self.assertRaises(ValueError):
+            deflection_optimizer.parse_grid(list(range(1, DeflectionOptimizer.MAX_AXIS_POINTS + 2)))
+    
+    def test_total_points_are_limited(self):
+        with self.assertRaises(ValueError):
+            deflection_optimizer.sweep(20, methods=['gravity_tractor'], max_points=100, grids={
+                'spacecraft_mass_kg': {'min': 500, 'max': 1000, 'num': 20},
+                'duration_days': {'min': 30, 'max': 300, 'num': 20},
+            })
+    
+    @override_settings(DEFLECTION_SWEEP_MAX_POINTS=1000)
+    def test_endpoint_rejects_grids_over_the_synchronous_limit(self):
+        simulation_cache.clear()
+        response = APIClient().post('/api/deflection-sweep', {
+            'original_velocity_kmps': 20,
+            'methods': ['gravity_tractor'],
+            'grids': {'duration_days': {'min': 30, 'max': 3650, 'num': 2000}},
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('limit is 1000', response.json()['error'])
+    
+    def test_sweep_frontier_is_non_dominated(self):
+        result = deflection_optimizer.sweep(20, grids={'asteroid_mass_kg': [1e10]})
+        frontier = result['scenarios'][0]['pareto_frontier']
+        
+        self.assertTrue(frontier)
+        for point in frontier:
+            for other in frontier:
+                self.assertFalse(
+                    other is not point
+                    and other['mass_kg'] <= point['mass_kg']
+                    and other['lead_time_days'] <= point['lead_time_days']
+                    and other['effectiveness'] >= point['effectiveness']
+                    and (other['mass_kg'], other['lead_time_days'], other['effectiveness'])
+                    != (point['mass_kg'], point['lead_time_days'], point['effectiveness'])
+                )
+    
+    def test_repeated_asteroid_masses_are_one_scenario(self):
+        params = deflection_optimizer.parse_sweep_request({
+            'original_velocity_kmps': 20,
+            'methods': ['nuclear'],
+            'grids': {'asteroid_mass_kg': [1e12, 1e10, 1e12], 'yield_megatons': [1, 2]},
+        })
+        result = deflection_optimizer.sweep(**params)
+        
+        self.assertEqual(params['grids']['asteroid_mass_kg'], [1e10, 1e12])
+        self.assertEqual([s['asteroid_mass_kg'] for s in result['scenarios']], [1e10, 1e12])
+        self.assertEqual(result['grid_sizes'], {'nuclear': 4})
+
+
+class MissDistanceTests(SimpleTestCase):
+    def curves(self, **options):
+        return deflection_optimizer.miss_distance_curves(
+            1.1, 0.2, 15.0, lead_time_years=[1, 2, 10], delta_v_kmps=[1e-6, 1e-5], **options
+        )
+    
+    def test_shift_grows_linearly_with_lead_time_and_delta_v(self):
+        shift = np.array(self.curves()['miss_shift_km'])
+        
+        self.assertTrue(np.all(shift > 0))
+        np.testing.assert_allclose(shift[1], 2 * shift[0])
+        np.testing.assert_allclose(shift[:, 1], 10 * shift[:, 0])
+    
+    def test_requirements_agree_with_the_hit_flags(self):
+        result = self.curves()
+        lead = np.array(result['lead_time_years'])
+        shift = np.array(result['miss_shift_km'])
+        capture = result['capture_radius_km']
+        
+        self.assertGreater(capture, 6371)  # gravitational focusing
+        np.testing.assert_array_equal(np.array(result['misses_earth']), shift >= capture)
+        for i, required in enumerate(result['required_delta_v_kmps']):
+            shift_at_required = shift[i, 0] / result['delta_v_kmps'][0] * required
+            self.assertAlmostEqual(shift_at_required / capture, 1.0)
+        self.assertAlmostEqual(
+            result['minimum_lead_time_years'][0] * shift[0, 0] / lead[0], capture, delta=1e-6 * capture
+        )
+    
+    def test_impact_parameter_reduces_what_is_needed(self):
+        centred = self.curves()
+        offset = self.curves(impact_parameter_km=centred['capture_radius_km'] / 2)
+        
+        for a, b in zip(centred['required_delta_v_kmps'], offset['required_delta_v_kmps']):
+            self.assertAlmostEqual(b / a, 0.5)
+    
+    def test_invalid_orbit(self):
+        with self.assertRaises(ValueError):
+            deflection_optimizer.miss_distance_curves(1.0, 1.2, 15.0)
+    
+    def test_endpoint(self):
+        client = APIClient()
+        response = client.post('/api/deflection-miss-distance', {
+            'semi_major_axis_au': 1.1, 'eccentricity': 0.2, 'velocity_kmps': 15,
+            'lead_time_years': [1, 5], 'delta_v_kmps': [1e-5]
+        }, format='json')
+        missing = client.post('/api/deflection-miss-distance', {'eccentricity': 0.2}, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['miss_shift_km']), 2)
+        self.assertEqual(missing.status_code, 400)
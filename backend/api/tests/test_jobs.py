@@ -0,0 +1,156 @@
+from unittest import mock
+
+from django.test import TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+
+from api.jobs import job_queue
+from api.models import SimulationJob
+from api.nasa_api import NEORecord, nasa_api
+
+
+class InlineExecutor:
+    """Runs submitted jobs immediately in the calling thread"""
+    
+    def __init__(self, run=True):
+        self.run = run
+    
+    def submit(self, function, *args):
+        if self.run:
+            function(*args)
+
+
+class JobLifecycleTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.use_executor(InlineExecutor())
+    
+    def use_executor(self, executor):
+        for name, value in (('_start', lambda: None), ('_executor', executor)):
+            patcher = mock.patch.object(job_queue, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def submit(self, kind, params):
+        response = self.client.post('/api/jobs', {'kind': kind, 'params': params}, format='json')
+        self.assertEqual(response.status_code, 202)
+        return response.json()['id']
+    
+    def test_successful_job(self):
+        job_id = self.submit('deflection_miss_distance', {
+            'semi_major_axis_au': 1.5, 'eccentricity': 0.3, 'velocity_kmps': 15,
+            'lead_time_years': [1, 5], 'delta_v_kmps': [1e-6, 1e-5]
+        })
+        
+        status = self.client.get(f'/api/jobs/{job_id}').json()
+        self.assertEqual((status['status'], status['progress']), (SimulationJob.SUCCEEDED, 1.0))
+        result = self.client.get(f'/api/jobs/{job_id}/result')
+        self.assertEqual(result.status_code, 200)
+        self.assertIn('lead_time_years', result.json())
+    
+    def test_unknown_kind_is_rejected(self):
+        response = self.client.post('/api/jobs', {'kind': 'nope'}, format='json')
+        
+        self.assertEqual(response.status_code, 400)
+    
+    def test_invalid_params_are_rejected_at_submit(self):
+        for kind, params in (
+            ('deflection_miss_distance', {'velocity_kmps': 15}),
+            ('deflection_miss_distance', {'semi_major_axis_au': 1, 'velocity_kmps': 15,
+                                          'lead_time_years': {'min': 5, 'max': 1}}),
+            ('deflection_sweep', {'original_velocity_kmps': 20, 'grids': {'yield_megatons': {'max': 1}}}),
+            ('deflection_sweep', {'original_velocity_kmps': 20, 'methods': ['laser']}),
+            ('impact_grid', {'velocity_kmps': 'fast'}),
+            ('monte_carlo', {'samples': 0}),
+            ('catalog_sync', {'max_pages': 'all'}),
+        ):
+            with self.subTest(kind=kind, params=params):
+                response = self.client.post('/api/jobs', {'kind': kind, 'params': params}, format='json')
+                self.assertEqual(response.status_code, 400)
+        
+        self.assertFalse(SimulationJob.objects.exists())
+    
+    def test_miss_distance_job_resolves_asteroid_id(self):
+        record = NEORecord.from_nasa({
+            'id': '3542519', 'name': 'x',
+            'close_approach_data': [{'relative_velocity': {'kilometers_per_second': '15'}}],
+            'orbital_data': {'semi_major_axis': '1.5', 'eccentricity': '0.3'},
+        })
+        with mock.patch.object(nasa_api, 'get_asteroid_by_id', return_value=record):
+            job_id = self.submit('deflection_miss_distance', {'asteroid_id': '3542519', 'delta_v_kmps': [1e-5]})
+        with mock.patch.object(nasa_api, 'get_asteroid_by_id', return_value={'error': 'Not found'}):
+            missing = self.client.post('/api/jobs', {
+                'kind': 'deflection_miss_distance', 'params': {'asteroid_id': '404'}
+            }, format='json')
+        
+        result = self.client.get(f'/api/jobs/{job_id}/result').json()
+        self.assertEqual(result['asteroid_info']['id'], '3542519')
+        self.assertEqual(result['orbit']['semi_major_axis_au'], 1.5)
+        self.assertEqual(missing.status_code, 404)
+    
+    def test_monte_carlo_job(self):
+        job_id = self.submit('monte_carlo', {'samples': 3000, 'batch_size': 1000, 'seed': 1})
+        
+        result = self.client.get(f'/api/jobs/{job_id}/result').json()
+        self.assertEqual((result['completed'], result['total']), (3000, 3000))
+        self.assertIn('p50', result['percentiles']['crater_diameter_km'])
+    
+    def test_handler_error_fails_the_job(self):
+        def handler(params, progress):
+            return {}['missing']
+        
+        with mock.patch.dict(job_queue.handlers, {'broken': handler}):
+            job_id = self.submit('broken', {})
+        
+        job = SimulationJob.objects.get(id=job_id)
+        self.assertEqual(job.status, SimulationJob.FAILED)
+        self.assertIn('KeyError', job.error)
+        self.assertEqual(self.client.get(f'/api/jobs/{job_id}/result').status_code, 500)
+    
+    def test_unsaveable_result_fails_the_job(self):
+        with mock.patch.dict(job_queue.handlers, {'nan_result': lambda params, progress: {'x': float('nan')}}):
+            job_id = self.submit('nan_result', {})
+        
+        job = SimulationJob.objects.get(id=job_id)
+        self.assertEqual(job.status, SimulationJob.FAILED)
+        self.assertIsNone(job.result)
+        self.assertIn('ValueError', job.error)
+    
+    def test_failed_save_does_not_leave_the_job_running(self):
+        original_finish = job_queue._finish
+        
+        def finish(job_id, **fields):
+            if fields['status'] == SimulationJob.SUCCEEDED:
+                raise RuntimeError('database rejected the result')
+            original_finish(job_id, **fields)
+        
+        with mock.patch.object(job_queue, '_finish', finish):
+            job_id = self.submit('impact_grid', {'diameter_km': [0.1]})
+        
+        job = SimulationJob.objects.get(id=job_id)
+        self.assertEqual(job.status, SimulationJob.FAILED)
+        self.assertIn('database rejected the result', job.error)
+    
+    @override_settings(JOB_MAX_GRID_POINTS=10)
+    def test_impact_grid_size_is_capped(self):
+        response = self.client.post('/api/jobs', {
+            'kind': 'impact_grid', 'params': {'diameter_km': {'min': 0.01, 'max': 1, 'num': 11}}
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('limit is 10', response.json()['error'])
+    
+    def test_impact_grid_result(self):
+        job_id = self.submit('impact_grid', {'diameter_km': [0.05, 0.5], 'impact_angle': [30, 60]})
+        
+        result = self.client.get(f'/api/jobs/{job_id}/result').json()
+        self.assertEqual(result['count'], 4)
+        self.assertEqual(len(result['effects']['crater_diameter_km']), 4)
+    
+    def test_cancelled_job_never_runs(self):
+        self.use_executor(InlineExecutor(run=False))
+        job_id = self.submit('impact_grid', {})
+        
+        self.assertEqual(self.client.delete(f'/api/jobs/{job_id}').json()['status'], SimulationJob.CANCELLED)
+        job_queue._run(job_id)
+        self.assertEqual(SimulationJob.objects.get(id=job_id).status, SimulationJob.CANCELLED)
+        self.assertEqual(self.client.get(f'/api/jobs/{job_id}/result').status_code, 410)
@@ -0,0 +1,102 @@
+import json
+
+from django.test import SimpleTestCase
+
+from api.json_stream import JSONStream
+
+
+FEED = {
+    'links': {'next': 'https://api.nasa.gov/neo/rest/v1/feed?page=2'},
+    'element_count': 3,
+    'near_earth_objects': {
+        '2025-01-01': [
+            {'id': '2000433', 'name': '433 Éros', 'absolute_magnitude_h': 10.31,
+             'is_potentially_hazardous_asteroid': False,
+             'estimated_diameter': {'kilometers': {'estimated_diameter_min': 22.1, 'estimated_diameter_max': 49.4}},
+             'close_approach_data': [
+                 {'close_approach_date': '2025-01-01', 'relative_velocity': {'kilometers_per_second': '5.57'}},
+                 {'close_approach_date': '2056-01-24', 'relative_velocity': {'kilometers_per_second': '3.1'}},
+             ]},
+            {'id': '3542519', 'name': '(2010 PK9) "quoted" \\ 🚀', 'absolute_magnitude_h': -1.25e-3,
+             'is_potentially_hazardous_asteroid': True, 'orbital_data': None, 'close_approach_data': []},
+        ],
+        '2025-01-02': [],
+        '2025-01-03': [
+            {'id': '54016', 'name': 'Ünicode', 'absolute_magnitude_h': 123456789012345.5,
+             'is_potentially_hazardous_asteroid': True, 'close_approach_data': [{'n': 1}, {'n': 2}, {'n': 3}]},
+        ],
+    },
+    'page': {'size': 20, 'number': 0},
+}
+
+
+def chunked(document, size):
+    data = json.dumps(document, ensure_ascii=False, indent=1).encode('utf-8')
+    return [data[offset:offset + size] for offset in range(0, len(data), size)]
+
+
+def expected_items(document, limits=None):
+    items = [item for day in document['near_earth_objects'].values() for item in day]
+    if limits:
+        items = [
+            {key: value[:limits[key]] if key in limits else value for key, value in item.items()}
+            for item in items
+        ]
+    return items
+
+
+class JSONStreamTests(SimpleTestCase):
+    def test_every_chunk_boundary(self):
+        # Chunk sizes that split keys, numbers, escapes and multi-byte characters at every offset
+        for size in list(range(1, 24)) + [97, 1024, 64 * 1024]:
+            with self.subTest(size=size):
+                stream = JSONStream(chunked(FEED, size))
+                items = list(stream.iter_items(('near_earth_objects', '*')))
+                
+                self.assertEqual(items, expected_items(FEED))
+                self.assertEqual(stream.values[('element_count',)], 3)
+                self.assertEqual(stream.values[('links',)], FEED['links'])
+                self.assertEqual(stream.values[('page',)], FEED['page'])
+    
+    def test_limits_at_every_chunk_boundary(self):
+        limits = {'close_approach_data': 1}
+        for size in range(1, 24):
+            with self.subTest(size=size):
+                stream = JSONStream(chunked(FEED, size))
+                items = list(stream.iter_items(('near_earth_objects', '*'), limits))
+                
+                self.assertEqual(items, expected_items(FEED, limits))
+    
+    def test_numbers_split_across_chunks(self):
+        for text in ('[12.5, -3e-7, 1E+10, 0, 42]', '[1234567890123456789]', '[true, false, null, 1.0]'):
+            for cut in range(1, len(text)):
+                with self.subTest(text=text, cut=cut):
+                    chunks = [text[:cut].encode(), text[cut:].encode()]
+                    
+                    self.assertEqual(list(JSONStream(chunks).iter_items(())), json.loads(text))
+    
+    def test_literal_path(self):
+        document = {'page': {'total_pages': 2}, 'near_earth_objects': [{'id': '1'}, {'id': '2'}]}
+        stream = JSONStream(chunked(document, 5))
+        
+        self.assertEqual(list(stream.iter_items(('near_earth_objects',))), [{'id': '1'}, {'id': '2'}])
+        self.assertEqual(stream.values[('page',)], {'total_pages': 2})
+    
+    def test_items_are_yielded_before_the_input_ends(self):
+        read = []
+        
+        def chunks():
+            for chunk in chunked({'near_earth_objects': [{'id': str(i)} for i in range(100)]}, 8):
+                read.append(chunk)
+                yield chunk
+        
+        stream = JSONStream(chunks()).iter_items(('near_earth_objects',))
+        next(stream)
+        
+        self.assertLess(len(read), 10)
+    
+    def test_malformed_and_truncated_input(self):
+        for text in ('{"near_earth_objects": [1, 2', '{"near_earth_objects": {"a": [}}', '[1, 2] ', '{"x": nul}'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    list(JSONStream([text.encode()]).iter_items(('near_earth_objects',)))
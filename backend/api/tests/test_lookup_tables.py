@@ -0,0 +1,89 @@
+import os
+import runpy
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from api.lookup_tables import ImpactLookupTables
+from api.physics import physics_engine
+
+
+class LookupTableTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tables = ImpactLookupTables(physics_engine)
+        cls.tables.build(shape=(24, 10, 6))
+    
+    def assert_same_shape(self, diameter_km, velocity_kmps, impact_angle):
+        exact = physics_engine.calculate_full_impact_simulation(
+            diameter_km, velocity_kmps, impact_angle=impact_angle
+        )
+        crater, blast, seismic, entry = self.tables.lookup_effects(diameter_km, velocity_kmps, impact_angle)
+        
+        self.assertEqual(list(entry), list(exact['atmospheric_entry']))
+        self.assertEqual(set(crater), set(exact['crater']))
+        self.assertEqual(set(blast), set(exact['blast_zones']))
+        self.assertEqual(set(seismic), set(exact['seismic_effects']))
+        return exact, entry
+    
+    def test_airburst_entry_has_exact_mode_keys(self):
+        exact, entry = self.assert_same_shape(0.02, 19, 30)
+        
+        self.assertTrue(entry['is_airburst'])
+        self.assertIsNone(entry['breakup_altitude_m'])
+        self.assertEqual(entry['impact_energy_joules'], 0)
+        self.assertAlmostEqual(
+            entry['initial_energy_joules'] / exact['atmospheric_entry']['initial_energy_joules'], 1.0
+        )
+    
+    def test_ground_impact_entry_has_exact_mode_keys(self):
+        _, entry = self.assert_same_shape(1.0, 20, 45)
+        
+        self.assertFalse(entry['is_airburst'])
+        self.assertIsNone(entry['impact_velocity_kmps'])
+        self.assertGreater(entry['impact_energy_joules'], 0)
+    
+    def test_interpolation_is_close_to_exact(self):
+        exact = physics_engine.calculate_full_impact_simulation(1.0, 20, impact_angle=45)
+        _, blast, seismic, _ = self.tables.lookup_effects(1.0, 20, 45)
+        
+        self.assertAlmostEqual(
+            blast['fireball_radius_km'] / exact['blast_zones']['fireball_radius_km'], 1.0, places=6
+        )
+        self.assertAlmostEqual(
+            seismic['richter_magnitude'], exact['seismic_effects']['richter_magnitude'], places=6
+        )
+    
+    def test_tables_are_published_last(self):
+        class Recording(ImpactLookupTables):
+            def __setattr__(self, name, value):
+                self.__dict__.setdefault('assigned', []).append(name)
+                super().__setattr__(name, value)
+        
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'tables.npz')
+        self.tables.save(path)
+        
+        built = Recording(physics_engine)
+        built.assigned.clear()
+        built.build(shape=(8, 4, 3))
+        loaded = Recording(physics_engine)
+        loaded.assigned.clear()
+        
+        self.assertTrue(loaded.load(path))
+        for tables in (built, loaded):
+            self.assertEqual(tables.assigned[-1], 'tables')
+        self.assertIn('DIAMETER_RANGE_KM', loaded.assigned)
+        self.assertEqual(loaded.error_bounds, self.tables.error_bounds)
+    
+    def test_gunicorn_builds_tables_before_forking(self):
+        config = runpy.run_path(os.path.join(settings.BASE_DIR, 'gunicorn.conf.py'))
+        
+        with mock.patch('api.lazy.warm_up'), \
+                mock.patch.object(physics_engine.lookup_tables, 'get') as get:
+            config['when_ready'](None)
+        get.assert_called_once_with()
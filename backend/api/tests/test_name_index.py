@@ -0,0 +1,90 @@
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api.catalog import CatalogIndex, NEOCatalog
+from api.catalog_store import catalog_store
+from api.name_index import NameIndex, _edit_distance, tokenize
+
+
+NAMES = [
+    ('99942', '99942 Apophis (2004 MN4)'),
+    ('433', '433 Eros (A898 PA)'),
+    ('1036', '1036 Ganymed (A924 UB)'),
+    ('2024yr4', '(2024 YR4)'),
+    ('2024yr5', '(2024 YR5)'),
+    ('101955', '101955 Bennu (1999 RQ36)'),
+    ('4179', '4179 Toutatis (1989 AC)'),
+    ('4660', '4660 Nereus (1982 DB)'),
+]
+
+
+class NameIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = NameIndex()
+        self.index.update(NAMES)
+    
+    def ids(self, query, **options):
+        return [result['id'] for result in self.index.search(query, **options)]
+    
+    def test_tokenize_joins_designations(self):
+        self.assertEqual(tokenize('433 Eros (A898 PA)'), ['433', 'eros', 'a898', 'pa', 'a898pa'])
+        self.assertEqual(tokenize('--'), [])
+    
+    def test_prefix_and_designation_matches(self):
+        self.assertEqual(self.ids('apoph'), ['99942'])
+        self.assertEqual(self.ids('2004 mn'), ['99942'])
+        self.assertEqual(self.ids('2024 yr4'), ['2024yr4'])
+        self.assertEqual(self.ids('2024yr4'), ['2024yr4'])
+        self.assertEqual(sorted(self.ids('2024 yr')), ['2024yr4', '2024yr5'])
+    
+    def test_exact_matches_rank_first(self):
+        index = NameIndex()
+        index.update([('1', 'Erosion (2000 AA)'), ('2', 'Eros')])
+        
+        results = index.search('eros')
+        self.assertEqual([(r['id'], r['match']) for r in results], [('2', 'exact'), ('1', 'prefix')])
+    
+    def test_fuzzy_matches(self):
+        results = self.index.search('apohpis')
+        
+        self.assertEqual([(r['id'], r['match'], r['distance']) for r in results], [('99942', 'fuzzy', 1)])
+        self.assertEqual(self.ids('apohpis', fuzzy=False), [])
+        self.assertEqual(self.ids('toutatsi'), ['4179'])
+        # Words with digits are never fuzzed: a near miss is a different asteroid
+        self.assertEqual(self.ids('2024 yr6'), [])
+    
+    def test_limit(self):
+        self.assertEqual(len(self.index.search('1', limit=2)), 2)
+    
+    def test_update_applies_differences(self):
+        changes = self.index.update([
+            ('99942', '99942 Apophis (2004 MN4)'),
+            ('433', '433 Eros'),
+            ('new', '2025 AB'),
+        ] + NAMES[2:5])
+        
+        self.assertEqual(changes, {'added': 1, 'removed': 3, 'renamed': 1})
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.ids('a898'), [])
+        self.assertEqual(self.ids('bennu', fuzzy=False), [])
+        self.assertEqual(self.ids('2025'), ['new'])
+    
+    def test_edit_distance(self):
+        self.assertEqual(_edit_distance('apophis', 'apohpis', 2), 1)
+        self.assertEqual(_edit_distance('eros', 'erosion', 1), 2)
+        self.assertEqual(_edit_distance('eros', 'erosion', 1, prefix=True), 0)
+    
+    def test_search_endpoint(self):
+        index = CatalogIndex(NEOCatalog.from_records([{'id': i, 'name': n} for i, n in NAMES]))
+        with mock.patch.object(catalog_store, 'index', index), \
+                mock.patch.object(catalog_store, 'synced_at', time.time()), \
+                mock.patch.object(catalog_store, 'snapshot_path', None), \
+                mock.patch.object(catalog_store, 'names', self.index):
+            response = self.client.get('/api/asteroids/search', {'q': 'bennu'})
+            empty = self.client.get('/api/asteroids/search', {'q': ' '})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['id'], '101955')
+        self.assertEqual(empty.status_code, 400)
@@ -0,0 +1,229 @@
+import json
+import threading
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from api.nasa_api import NASANeoAPI, NEORecord
+
+
+RAW = {
+    'id': '2000433', 'name': '433 Eros (A898 PA)', 'nasa_jpl_url': 'https://ssd.jpl.nasa.gov/?sstr=2000433',
+    'absolute_magnitude_h': 10.31, 'is_potentially_hazardous_asteroid': False,
+    'estimated_diameter': {'kilometers': {'estimated_diameter_min': 22.0, 'estimated_diameter_max': 50.0}},
+    'close_approach_data': [{
+        'close_approach_date': '2025-01-31', 'close_approach_date_full': '2025-Jan-31 12:00',
+        'relative_velocity': {'kilometers_per_second': '5.5', 'kilometers_per_hour': '19800',
+                              'miles_per_hour': '12303'},
+        'miss_distance': {'kilometers': '59000000', 'lunar': '153.5', 'astronomical': '0.394'},
+        'orbiting_body': 'Earth',
+    }],
+    'orbital_data': {'orbit_id': '659', 'semi_major_axis': '1.458', 'eccentricity': '.2227',
+                     'inclination': 'n/a'},
+}
+
+
+class NEORecordTests(SimpleTestCase):
+    def test_values_are_converted_on_access(self):
+        record = NEORecord.from_nasa(RAW)
+        
+        self.assertEqual(record.diameter_km, 36.0)
+        self.assertEqual(record.diameter_meters, 36000.0)
+        self.assertEqual(record.velocity_kmps, 5.5)
+        self.assertEqual(record.miss_distance_lunar, 153.5)
+        self.assertEqual(record['close_approach_date'], '2025-01-31')
+        self.assertFalse(hasattr(record, '__dict__'))
+    
+    def test_orbital_elements_are_parsed_once(self):
+        record = NEORecord.from_nasa(RAW)
+        
+        self.assertEqual(record.orbital_data['eccentricity'], '.2227')
+        elements = record.orbital_elements
+        self.assertEqual(elements['semi_major_axis'], 1.458)
+        self.assertIsNone(elements['inclination'])
+        self.assertIsNone(elements['mean_anomaly'])
+        self.assertIs(record.orbital_elements, elements)
+    
+    def test_projection_skips_orbital_data(self):
+        record = NEORecord.from_nasa(RAW, fields=('name', 'diameter_km'))
+        
+        self.assertIsNone(record.orbital_elements['semi_major_axis'])
+        self.assertEqual(record.to_dict(('name', 'diameter_km')), {'name': RAW['name'], 'diameter_km': 36.0})
+    
+    def test_dict_access(self):
+        record = NEORecord.from_nasa(RAW)
+        
+        self.assertEqual(list(record.to_dict()), list(NEORecord.FIELDS))
+        self.assertIn('velocity_kmps', record)
+        self.assertNotIn('_velocity', record)
+        self.assertIsNone(record.get('missing'))
+        with self.assertRaises(KeyError):
+            record['_orbital']
+    
+    def test_missing_approach_data(self):
+        record = NEORecord.from_nasa({'id': '1', 'name': 'x'})
+        
+        self.assertEqual((record.diameter_km, record.velocity_kmps, record.orbiting_body), (0, 0.0, 'Earth'))
+    
+    def test_parse_fields(self):
+        self.assertIsNone(NEORecord.parse_fields(''))
+        self.assertEqual(NEORecord.parse_fields('orbital_data, name,id'), ('id', 'name', 'orbital_data'))
+        with self.assertRaises(ValueError):
+            NEORecord.parse_fields('name,colour')
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self.body = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f'{self.status_code} Error')
+    
+    def iter_content(self, chunk_size=1):
+        for offset in range(0, len(self.body), chunk_size):
+            yield self.body[offset:offset + chunk_size]
+    
+    def json(self):
+        return json.loads(self.body)
+
+
+class FakeNASA:
+    """/neo/browse with total_pages pages of 20 and /neo/<id>, counting requests"""
+    
+    def __init__(self, total_pages=5, rate_limit=None, failing=()):
+        self.total_pages = total_pages
+        self.rate_limit = rate_limit
+        self.failing = set(failing)
+        self.requests = []
+        self.lock = threading.Lock()
+    
+    def __call__(self, url, params=None, **kwargs):
+        with self.lock:
+            self.requests.append(url.rsplit('/', 1)[-1] if 'browse' not in url else params['page'])
+        if url.endswith('/neo/browse'):
+            page = params['page']
+            if page in self.failing:
+                return FakeResponse({}, status_code=500)
+            headers = {}
+            if self.rate_limit is not None:
+                with self.lock:
+                    self.rate_limit -= 1
+                    headers['X-RateLimit-Remaining'] = str(self.rate_limit)
+            return FakeResponse({
+                'page': {'number': page, 'total_pages': self.total_pages},
+                'near_earth_objects': [
+                    dict(RAW, id=f'{page}-{i}', is_potentially_hazardous_asteroid=i % 4 == 0) for i in range(20)
+                ]
+            }, headers=headers)
+        asteroid_id = url.rsplit('/', 1)[-1]
+        if asteroid_id in self.failing:
+            return FakeResponse({}, status_code=404)
+        return FakeResponse(dict(RAW, id=asteroid_id))
+
+
+@override_settings(NEO_BROWSE_CONCURRENCY=2, NEO_BROWSE_PAGE_BUDGET=25, NEO_BROWSE_QUOTA_RESERVE=2)
+class BrowseTests(SimpleTestCase):
+    def walk(self, api, **options):
+        records, cursor = [], None
+        while True:
+            result = api.browse(cursor=cursor, **options)
+            records.extend(record.id for record in result['asteroids'])
+            cursor = result['next_cursor']
+            if cursor is None:
+                return records
+    
+    def test_cursors_visit_every_asteroid_once(self):
+        nasa = FakeNASA(total_pages=5)
+        with mock.patch('requests.get', nasa):
+            ids = self.walk(NASANeoAPI(), limit=7)
+        
+        self.assertEqual(ids, [f'{page}-{i}' for page in range(5) for i in range(20)])
+        self.assertEqual(sorted(nasa.requests), list(range(5)))  # every page fetched once
+    
+    def test_hazardous_filter_spans_pages(self):
+        with mock.patch('requests.get', FakeNASA(total_pages=3)):
+            result = NASANeoAPI().browse(is_potentially_hazardous=True)
+        
+        self.assertEqual(result['count'], 15)
+        self.assertTrue(all(record.is_potentially_hazardous for record in result['asteroids']))
+        self.assertIsNone(result['next_cursor'])
+    
+    def test_cached_pages_are_reused(self):
+        nasa = FakeNASA(total_pages=3)
+        api = NASANeoAPI()
+        with mock.patch('requests.get', nasa):
+            api.browse()
+            again = api.browse(is_potentially_hazardous=False)
+        
+        self.assertEqual(again['pages_fetched'], 0)
+        self.assertEqual(len(nasa.requests), 3)
+    
+    @override_settings(NEO_BROWSE_PAGE_BUDGET=2)
+    def test_page_budget_truncates_with_a_cursor(self):
+        api = NASANeoAPI()
+        with mock.patch('requests.get', FakeNASA(total_pages=5)):
+            first = api.browse()
+            rest = api.browse(cursor=first['next_cursor'])
+        
+        self.assertTrue(first['truncated'])
+        self.assertEqual(first['count'], 40)
+        self.assertEqual(rest['asteroids'][0].id, '2-0')
+    
+    def test_quota_reserve_stops_fetching(self):
+        with mock.patch('requests.get', FakeNASA(total_pages=10, rate_limit=5)):
+            result = NASANeoAPI().browse()
+        
+        self.assertTrue(result['truncated'])
+        self.assertLess(result['pages_fetched'], 10)
+        self.assertIsNotNone(result['next_cursor'])
+    
+    def test_upstream_failure(self):
+        with mock.patch('requests.get', FakeNASA(total_pages=4, failing={0})):
+            self.assertIn('error', NASANeoAPI().browse())
+        with mock.patch('requests.get', FakeNASA(total_pages=4, failing={2})):
+            partial = NASANeoAPI().browse()
+        
+        self.assertEqual(partial['count'], 40)
+        self.assertTrue(partial['truncated'])
+        self.assertIn('upstream_error', partial)
+    
+    def test_invalid_cursor(self):
+        for cursor in ('%%%', 'bm90LWEtY3Vyc29y', NASANeoAPI._encode_cursor(-1, 0)):
+            with self.assertRaises(ValueError):
+                NASANeoAPI().browse(cursor=cursor)
+
+
+class BatchTests(SimpleTestCase):
+    def test_duplicates_cache_and_failures(self):
+        nasa = FakeNASA(failing={'404404'})
+        api = NASANeoAPI()
+        with mock.patch('requests.get', nasa):
+            api.get_asteroid_by_id('111')
+            result = api.get_asteroids_by_ids(['222', '111', '222', '404404', 'bad id'])
+        
+        self.assertEqual([record.id for record in result['asteroids']], ['222', '111'])
+        self.assertEqual(set(result['errors']), {'404404', 'bad id'})
+        self.assertEqual(result['cached'], 1)
+        self.assertEqual(sorted(nasa.requests), ['111', '222', '404404'])
+    
+    @override_settings(NEO_BATCH_MAX_IDS=3)
+    def test_endpoint(self):
+        with mock.patch('requests.get', FakeNASA()):
+            response = self.client.get('/api/asteroids/batch', {'ids': 'b1,b2', 'fields': 'id,diameter_km'})
+            too_many = self.client.get('/api/asteroids/batch', {'ids': '1,2,3,4'})
+            missing = self.client.get('/api/asteroids/batch')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['asteroids'], [{'id': 'b1', 'diameter_km': 36.0},
+                                                        {'id': 'b2', 'diameter_km': 36.0}])
+        self.assertEqual((too_many.status_code, missing.status_code), (400, 400))
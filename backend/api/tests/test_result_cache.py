@@ -0,0 +1,77 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework.test import APIClient
+
+from api.result_cache import ResultCache, simulation_cache
+
+
+class ResultCacheTests(SimpleTestCase):
+    def test_miss_then_hit(self):
+        cache = ResultCache()
+        compute = mock.Mock(return_value={'crater': 1})
+        
+        self.assertEqual(cache.get_or_compute('k', compute), ({'crater': 1}, False))
+        self.assertEqual(cache.get_or_compute('k', compute), ({'crater': 1}, True))
+        compute.assert_called_once()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.stats()['hit_rate'], 0.5)
+    
+    def test_entries_expire_after_ttl(self):
+        cache = ResultCache(ttl_seconds=10)
+        with mock.patch('api.result_cache.time.monotonic', return_value=100.0):
+            cache.set('k', 'value')
+        with mock.patch('api.result_cache.time.monotonic', return_value=109.0):
+            self.assertEqual(cache.get('k'), 'value')
+        with mock.patch('api.result_cache.time.monotonic', return_value=111.0):
+            self.assertIsNone(cache.get('k'))
+        self.assertEqual(cache.stats()['entries'], 0)
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResultCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.evictions, 1)
+    
+    def test_disabled_cache_always_misses(self):
+        cache = ResultCache(enabled=False)
+        cache.set('k', 'value')
+        
+        self.assertIsNone(cache.get('k'))
+        self.assertEqual(cache.stats()['entries'], 0)
+    
+    def test_equivalent_requests_share_a_key(self):
+        cache = ResultCache(coord_precision=3)
+        key = cache.make_key('simulate_impact', {'diameter_km': 1, 'impact_lat': 40.71281, 'impact_lon': -0.0})
+        
+        self.assertEqual(key, cache.make_key(
+            'simulate_impact', {'impact_lon': 0.0, 'impact_lat': 40.7128, 'diameter_km': 1.0}
+        ))
+        self.assertNotEqual(key, cache.make_key(
+            'simulate_deflection', {'diameter_km': 1, 'impact_lat': 40.71281, 'impact_lon': 0}
+        ))
+        self.assertNotEqual(key, cache.make_key(
+            'simulate_impact', {'diameter_km': 1.001, 'impact_lat': 40.7128, 'impact_lon': 0}
+        ))
+
+
+class SimulationCacheEndpointTests(SimpleTestCase):
+    def setUp(self):
+        simulation_cache.clear()
+        self.addCleanup(simulation_cache.clear)
+    
+    def test_repeated_deflection_request_is_a_hit(self):
+        body = {'original_velocity_kmps': 20, 'method': 'kinetic_impactor',
+                'params': {'impactor_mass_kg': 500, 'asteroid_mass_kg': 1e10}}
+        client = APIClient()
+        first = client.post('/api/simulate-deflection', body, format='json')
+        second = client.post('/api/simulate-deflection', body, format='json')
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual((first['X-Cache'], second['X-Cache']), ('MISS', 'HIT'))
+        self.assertEqual(first.json(), second.json())
@@ -0,0 +1,88 @@
+import json
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase
+from rest_framework.test import APIClient
+
+from api.physics import physics_engine
+
+
+INPUT_ARGUMENTS = {
+    'diameter_km': 'diameter_km',
+    'velocity_kmps': 'velocity_kmps',
+    'density_kg_m3': 'density',
+    'impact_angle_deg': 'impact_angle',
+}
+
+
+def simulate(diameter_km=1.0, velocity_kmps=20.0, density=3000.0, impact_angle=45.0, **kwargs):
+    return physics_engine.calculate_full_impact_simulation(
+        diameter_km, velocity_kmps, impact_angle=impact_angle, density=density, **kwargs
+    )
+
+
+def output_values(result):
+    return physics_engine.calculate_sensitivities(result)['values']
+
+
+class SensitivityTests(SimpleTestCase):
+    def test_analytic_partials_match_finite_differences(self):
+        base = {'diameter_km': 1.0, 'velocity_kmps': 20.0, 'density': 3000.0, 'impact_angle': 45.0}
+        sensitivity = simulate(**base, sensitivity=True)['sensitivity']
+        self.assertFalse(simulate(**base)['atmospheric_entry']['is_airburst'])
+        
+        for name, argument in INPUT_ARGUMENTS.items():
+            step = base[argument] * 1e-4
+            upper = output_values(simulate(**dict(base, **{argument: base[argument] + step})))
+            lower = output_values(simulate(**dict(base, **{argument: base[argument] - step})))
+            for output in ('mass_kg', 'energy_joules', 'crater_diameter_km', 'fireball_radius_km',
+                           'total_destruction_radius_km', 'richter_magnitude'):
+                numeric = (upper[output] - lower[output]) / (2 * step)
+                analytic = sensitivity['partial_derivatives'][output][name]
+                with self.subTest(output=output, input=name):
+                    if numeric == 0:
+                        self.assertEqual(analytic, 0)
+                    else:
+                        self.assertAlmostEqual(analytic / numeric, 1.0, places=4)
+    
+    def test_zero_angle_has_no_division_errors(self):
+        sensitivity = simulate(impact_angle=0, sensitivity=True)['sensitivity']
+        
+        json.dumps(sensitivity, allow_nan=False)
+        self.assertEqual(sensitivity['partial_derivatives']['mass_kg']['impact_angle_deg'], 0.0)
+    
+    def test_vertical_angle(self):
+        sensitivity = simulate(impact_angle=90, sensitivity=True)['sensitivity']
+        
+        json.dumps(sensitivity, allow_nan=False)
+        self.assertAlmostEqual(sensitivity['elasticities']['crater_diameter_km']['impact_angle_deg'], 0.0)
+    
+    def test_entry_partials_at_the_angle_limit_follow_the_trend(self):
+        def angle_partial(angle):
+            sensitivity = simulate(0.02, 19.0, impact_angle=angle, sensitivity=True)['sensitivity']
+            return sensitivity['partial_derivatives']['burst_altitude_m']['impact_angle_deg']
+        
+        near = [angle_partial(angle) for angle in (87, 88, 89)]
+        slope = (near[2] - near[0]) / 2
+        
+        # The stencil at 89.5 and 90 would cross the model's 90 degree clip
+        self.assertAlmostEqual(angle_partial(89.5), near[2] + slope / 2, delta=0.1)
+        self.assertAlmostEqual(angle_partial(90), near[2] + slope, delta=0.1)
+    
+    def test_zero_magnitude_elasticity_is_none(self):
+        result = simulate(sensitivity=False)
+        result['seismic_effects'] = dict(result['seismic_effects'], richter_magnitude=0)
+        sensitivity = physics_engine.calculate_sensitivities(result)
+        
+        self.assertIsNone(sensitivity['elasticities']['richter_magnitude']['diameter_km'])
+        self.assertIsNone(sensitivity['partial_derivatives']['richter_magnitude']['diameter_km'])
+    
+    @mock.patch('requests.get', side_effect=requests.exceptions.ConnectionError)
+    def test_simulate_impact_endpoint_accepts_zero_angle(self, _):
+        response = APIClient().post('/api/simulate-impact', {
+            'diameter_km': 0.1, 'velocity_kmps': 20, 'impact_angle': 0, 'sensitivity': True
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('sensitivity', response.json())
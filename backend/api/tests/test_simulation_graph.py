@@ -0,0 +1,51 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api.physics import physics_engine
+from api.simulation_graph import SimulationGraph
+
+
+BASE = {'diameter_km': 1.0, 'velocity_kmps': 20.0, 'impact_angle': 45.0}
+
+
+class SimulationGraphTests(SimpleTestCase):
+    def setUp(self):
+        self.graph = SimulationGraph(physics_engine)
+        self.graph.evaluate(BASE)
+    
+    def test_identical_request_reuses_every_stage(self):
+        self.graph.evaluate(BASE)
+        
+        self.assertEqual(self.graph.last_recomputed, [])
+    
+    def test_angle_change_reuses_angle_independent_stages(self):
+        with mock.patch.object(physics_engine, 'seismic_from_energy',
+                               wraps=physics_engine.seismic_from_energy) as seismic:
+            values = self.graph.evaluate(dict(BASE, impact_angle=30.0))
+        
+        seismic.assert_not_called()
+        for stage in ('mass', 'energy', 'seismic'):
+            self.assertIn(stage, self.graph.last_reused)
+        # 'table' reads the angle but stays None in exact mode
+        self.assertIn('table', self.graph.last_recomputed)
+        for stage in ('entry', 'crater', 'result'):
+            self.assertIn(stage, self.graph.last_recomputed)
+        self.assertEqual(values['result']['impact_location']['angle'], 30.0)
+    
+    def test_velocity_change_recomputes_energy_dependents(self):
+        self.graph.evaluate(dict(BASE, velocity_kmps=25.0))
+        
+        self.assertEqual(self.graph.last_reused, ['mass'])
+    
+    def test_location_change_skips_the_physics(self):
+        self.graph.evaluate(dict(BASE, impact_lat=10.0))
+        
+        self.assertEqual(self.graph.last_recomputed, ['result', 'sensitivity'])
+    
+    def test_results_match_a_fresh_graph(self):
+        changed = dict(BASE, impact_angle=60.0, velocity_kmps=17.0)
+        incremental = self.graph.evaluate(changed)['result']
+        fresh = SimulationGraph(physics_engine).evaluate(changed)['result']
+        
+        self.assertEqual(incremental, fresh)
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from api.lazy import lazy_import
+
+
+# Set up Django and resolve the URLconf in a fresh interpreter
+_PROBE = '''
+import json, sys, django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+before = "numpy" in sys.modules
+from api.lazy import warm_up
+deferred = warm_up()
+print(json.dumps({"numpy_before": before, "numpy_after": "numpy" in sys.modules, "deferred": deferred}))
+'''
+
+
+class LazyImportTests(SimpleTestCase):
+    def test_urlconf_does_not_import_numpy_until_warm_up(self):
+        result = subprocess.run(
+            [sys.executable, '-c', _PROBE], cwd=settings.BASE_DIR, capture_output=True, text=True,
+            env=dict(os.environ, DJANGO_SETTINGS_MODULE='backend.settings', PHYSICS_TABLES_PRELOAD='False')
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        
+        self.assertFalse(probe['numpy_before'])
+        self.assertTrue(probe['numpy_after'])
+        self.assertGreater(probe['deferred'], 0)
+    
+    def test_proxy_forwards_to_the_module_and_its_patches(self):
+        engine = lazy_import('api.physics', 'physics_engine')
+        
+        self.assertEqual(engine.calculate_mass(1.0), engine._wrapped.calculate_mass(1.0))
+        with mock.patch('api.physics.physics_engine.calculate_mass', return_value=42):
+            self.assertEqual(engine.calculate_mass(1.0), 42)
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from backend.asgi import application
+from api.physics import physics_engine
+from api.streaming import format_sse, simulation_streams
+
+
+def parse_sse(text):
+    """[(event, data)] from a text/event-stream body"""
+    events = []
+    for block in text.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.splitlines())
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+class SimulationStreamTests(SimpleTestCase):
+    def stream(self, path, **params):
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join(chunk if isinstance(chunk, bytes) else chunk.encode()
+                        for chunk in response.streaming_content)
+        return parse_sse(body.decode())
+    
+    def test_monte_carlo_events(self):
+        events = self.stream('/api/stream/monte-carlo', samples=2500, batch_size=1000, seed=4)
+        
+        self.assertEqual([event for event, _ in events], ['open', 'progress', 'progress', 'progress', 'complete'])
+        self.assertEqual([data['completed'] for _, data in events[1:4]], [1000, 2000, 2500])
+        percentiles = events[3][1]['percentiles']['energy_megatons_tnt']
+        self.assertLessEqual(percentiles['p5'], percentiles['p50'])
+        self.assertLessEqual(percentiles['p50'], percentiles['p95'])
+        self.assertEqual(list(events[0][1]), ['stream_id'])
+    
+    def test_monte_carlo_seed_is_reproducible(self):
+        first = self.stream('/api/stream/monte-carlo', samples=500, batch_size=500, seed=11)
+        second = self.stream('/api/stream/monte-carlo', samples=500, batch_size=500, seed=11)
+        
+        self.assertEqual(first[1:], second[1:])
+    
+    def test_grid_tiles_cover_the_grid(self):
+        events = self.stream('/api/stream/impact-grid', diameter_num=10, velocity_num=3, tile_rows=4,
+                             impact_angle=30)
+        grid = events[1][1]
+        tiles = [data for event, data in events if event == 'tile']
+        
+        self.assertEqual(grid['tiles'], 3)
+        self.assertEqual([(tile['row_start'], tile['row_stop']) for tile in tiles], [(0, 4), (4, 8), (8, 10)])
+        d, v = np.meshgrid(grid['diameter_km'], grid['velocity_kmps'], indexing='ij')
+        expected = physics_engine.calculate_batch_impact_effects(d, v, 30.0)['energy_megatons_tnt']
+        energy = np.concatenate([tile['values']['energy_megatons_tnt'] for tile in tiles])
+        np.testing.assert_allclose(energy, expected)
+        self.assertEqual(events[-1], ('complete', {'completed_tiles': 3, 'tiles': 3}))
+    
+    def test_invalid_parameters(self):
+        for path, params in (
+            ('/api/stream/monte-carlo', {'diameter_km': -1}),
+            ('/api/stream/monte-carlo', {'samples': 10 ** 9}),
+            ('/api/stream/monte-carlo', {'seed': 'x'}),
+            ('/api/stream/impact-grid', {'diameter_num': 0}),
+            ('/api/stream/impact-grid', {'diameter_num': 1000, 'velocity_num': 1000}),
+            ('/api/stream/impact-grid', {'diameter_min_km': 5, 'diameter_max_km': 1}),
+        ):
+            with self.subTest(path=path, params=params):
+                self.assertEqual(self.client.get(path, params).status_code, 400)
+    
+    def test_cancel(self):
+        stream_id, cancelled = simulation_streams.open()
+        events = simulation_streams.event_stream(stream_id, simulation_streams.monte_carlo({
+            'diameter_km': 0.05, 'diameter_sigma': 0.3, 'velocity_kmps': 20, 'velocity_sigma': 3,
+            'density': None, 'samples': 5000, 'batch_size': 1000, 'seed': 1
+        }, cancelled))
+        next(events), next(events)
+        
+        self.assertTrue(simulation_streams.cancel(stream_id))
+        rest = parse_sse(''.join(events))
+        
+        self.assertEqual(rest, [('cancelled', {'completed': 1000, 'total': 5000})])
+        self.assertFalse(simulation_streams.cancel(stream_id))
+    
+    def test_format_sse(self):
+        self.assertEqual(format_sse('tile', {'a': 1}), 'event: tile\ndata: {"a": 1}\n\n')
+
+
+class ASGIStreamTests(SimpleTestCase):
+    def test_events_arrive_over_asgi_and_disconnect_stops_the_stream(self):
+        query = b'samples=200000&batch_size=1000&seed=2'
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': '/api/stream/monte-carlo', 'raw_path': b'/api/stream/monte-carlo',
+            'query_string': query, 'headers': [(b'host', b'localhost')],
+            'server': ('localhost', 80), 'client': ('127.0.0.1', 1)
+        }
+        disconnected = asyncio.Event()
+        received = []
+        
+        async def receive():
+            if not received:
+                received.append(True)
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+        
+        body = []
+        
+        async def send(message):
+            if message['type'] == 'http.response.body' and message.get('body'):
+                body.append(message['body'].decode())
+                if len(body) == 3:
+                    disconnected.set()
+        
+        asyncio.run(asyncio.wait_for(application(scope, receive, send), 30))
+        events = parse_sse(''.join(body))
+        
+        self.assertEqual([event for event, _ in events[:3]], ['open', 'progress', 'progress'])
+        # The stream was stopped, not computed to the end
+        self.assertLess(events[-1][1]['completed'], 200000)
+        self.assertEqual(simulation_streams._cancel_events, {})
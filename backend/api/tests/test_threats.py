@@ -0,0 +1,98 @@
+import datetime
+
+import numpy as np
+from django.test import TestCase
+
+from api.catalog import CatalogIndex, NEOCatalog
+from api.models import ThreatScore
+from api.physics import physics_engine
+from api.threats import ThreatRanker, decode_rank_cursor, encode_rank_cursor, threat_ranker
+
+
+def ranked_catalog(count=60, seed=9):
+    rng = np.random.default_rng(seed)
+    records = [{
+        'id': f'{i:04d}',
+        'name': f'({i})',
+        'is_potentially_hazardous': bool(i % 3 == 0),
+        'diameter_km': float(rng.lognormal(-1.5, 1.2)),
+        'velocity_kmps': float(rng.uniform(5, 35)),
+        'miss_distance_km': float(rng.uniform(5e3, 7e7)),
+        'close_approach_date': '2027-06-01',
+    } for i in range(count)]
+    # Rows that cannot be scored
+    records.append({'id': 'nodiam', 'velocity_kmps': 10.0, 'miss_distance_km': 1e6})
+    records.append({'id': 'zero', 'diameter_km': 0.0, 'velocity_kmps': 10.0, 'miss_distance_km': 1e6})
+    return CatalogIndex(NEOCatalog.from_records(records))
+
+
+class ThreatRankerTests(TestCase):
+    def test_scores_match_the_single_impact_physics(self):
+        index = ranked_catalog()
+        scores = threat_ranker.score(index, today=datetime.date(2025, 6, 1))
+        
+        self.assertEqual(len(scores['rows']), 60)
+        for i in (0, 17, 59):
+            row = scores['rows'][i]
+            diameter = index.catalog.columns['diameter_km'][row]
+            velocity = index.catalog.columns['velocity_kmps'][row]
+            mass = physics_engine.calculate_mass(diameter)
+            energy = physics_engine.calculate_impact_energy(mass, velocity)['energy_megatons_tnt']
+            self.assertAlmostEqual(scores['energy_megatons_tnt'][i] / energy, 1.0, places=9)
+    
+    def test_palermo_follows_probability_energy_and_lead_time(self):
+        catalog = NEOCatalog.from_records([
+            {'id': 'near', 'diameter_km': 0.3, 'velocity_kmps': 20.0, 'miss_distance_km': 1e5,
+             'close_approach_date': '2026-06-01'},
+            {'id': 'far', 'diameter_km': 0.3, 'velocity_kmps': 20.0, 'miss_distance_km': 1e7,
+             'close_approach_date': '2026-06-01'},
+            {'id': 'later', 'diameter_km': 0.3, 'velocity_kmps': 20.0, 'miss_distance_km': 1e5,
+             'close_approach_date': '2035-06-01'},
+        ])
+        scores = threat_ranker.score(CatalogIndex(catalog), today=datetime.date(2025, 6, 1))
+        near, far, later = scores['palermo_scale']
+        
+        self.assertAlmostEqual(near - far, 4.0)  # probability ~ 1 / miss distance squared
+        self.assertAlmostEqual(near - later, np.log10(10.0), places=2)
+    
+    def test_torino_bands(self):
+        self.assertEqual(
+            ThreatRanker.torino_scale(
+                [1e-9, 1e-6, 1e-3, 0.05, 0.5, 1.0, 1.0], [50, 50, 1e3, 50, 1e3, 50, 1e6]
+            ).tolist(),
+            [0, 1, 2, 3, 4, 8, 10]
+        )
+        self.assertEqual(int(ThreatRanker.torino_scale(0.5, 0.5)), 0)
+    
+    def test_rank_and_top_threats_pages(self):
+        result = threat_ranker.rank(ranked_catalog())
+        self.assertEqual(result['ranked'], 60)
+        self.assertEqual(ThreatScore.objects.count(), 60)
+        
+        seen, cursor = [], None
+        while True:
+            params = {'limit': 7, 'cursor': cursor} if cursor else {'limit': 7}
+            body = self.client.get('/api/asteroids/top-threats', params).json()
+            seen.extend(threat['asteroid_id'] for threat in body['threats'])
+            cursor = body['next_cursor']
+            if cursor is None:
+                break
+        
+        expected = list(ThreatScore.objects.order_by('-palermo_scale', 'asteroid_id')
+                        .values_list('asteroid_id', flat=True))
+        self.assertEqual(seen, expected)
+        
+        hazardous = self.client.get('/api/asteroids/top-threats', {'hazardous_only': 'true', 'limit': 200}).json()
+        self.assertEqual(hazardous['count'], 20)
+        self.assertEqual(self.client.get('/api/asteroids/top-threats', {'cursor': '***'}).status_code, 400)
+    
+    def test_rerank_replaces_the_table(self):
+        threat_ranker.rank(ranked_catalog(count=10))
+        threat_ranker.rank(ranked_catalog(count=4))
+        
+        self.assertEqual(ThreatScore.objects.count(), 4)
+    
+    def test_cursor_round_trip(self):
+        self.assertEqual(decode_rank_cursor(encode_rank_cursor(-2.5, '2000433')), (-2.5, '2000433'))
+        with self.assertRaises(ValueError):
+            decode_rank_cursor('bm8tc2VwYXJhdG9y')
@@ -0,0 +1,185 @@
+"""
+Threat Ranking
+Vectorized consequence scores for every cataloged asteroid, stored in the
+ThreatScore table that backs /api/asteroids/top-threats
+"""
+import base64
+import datetime
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from .physics import physics_engine
+
+
+class ThreatRanker:
+    """
+    Scores the local catalog in one vectorized pass
+    
+    The scores are Palermo/Torino-*style*, not the official values: NASA's
+    feed carries no impact probabilities, so the close approach is turned
+    into an encounter probability (Earth's gravitationally focused
+    cross-section over the miss distance squared). palermo_scale compares
+    that with the background impact frequency for the same energy,
+    f_B = 0.03 E^-0.8 per year (E in megatons), over the years until the
+    approach (at least one).
+    """
+    
+    EARTH_RADIUS_KM = 6371
+    ESCAPE_VELOCITY_KMPS = 11.186
+    
+    # Energy bands (megatons) of physics_engine._assess_severity
+    SEVERITY_BOUNDS = (1, 100, 10000)
+    
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def score(self, index, today=None):
+        """
+        Threat scores for every asteroid with a diameter, velocity and miss distance
+        
+        Args:
+            index: CatalogIndex of the local catalog
+            today: datetime.date the lead time is measured from (default: today)
+        
+        Returns:
+            dict: rows (catalog row numbers) plus one numpy array per score
+        """
+        catalog = index.catalog
+        columns = catalog.columns
+        diameter = columns['diameter_km']
+        velocity = columns['velocity_kmps']
+        miss_km = columns['miss_distance_km']
+        rows = np.flatnonzero(
+            np.isfinite(diameter) & np.isfinite(velocity) & np.isfinite(miss_km)
+            & (diameter > 0) & (velocity > 0)
+        )
+        diameter, velocity, miss_km = diameter[rows], velocity[rows], miss_km[rows]
+        
+        effects = self.engine.calculate_batch_impact_effects(diameter, velocity)
+        energy = effects['energy_megatons_tnt']
+        
+        focused_radius = self.EARTH_RADIUS_KM * np.sqrt(1 + (self.ESCAPE_VELOCITY_KMPS / velocity) ** 2)
+        probability = np.minimum(1.0, (focused_radius / np.maximum(miss_km, focused_radius)) ** 2)
+        
+        today = today or datetime.date.today()
+        approach_day = index.values('close_approach_date')[rows]
+        years = (approach_day - (today - datetime.date(1970, 1, 1)).days) / 365.25
+        years = np.maximum(np.nan_to_num(years, nan=1.0), 1.0)
+        
+        background = 0.03 * np.maximum(energy, 1e-12) ** -0.8
+        palermo = np.log10(np.maximum(probability, 1e-300) / (background * years))
+        
+        return {
+            'rows': rows,
+            'diameter_km': diameter,
+            'velocity_kmps': velocity,
+            'miss_distance_km': miss_km,
+            'approach_day': approach_day,
+            'mass_kg': effects['mass_kg'],
+            'energy_megatons_tnt': energy,
+            'is_airburst': effects['is_airburst'],
+            'severity_level': np.digitize(energy, self.SEVERITY_BOUNDS),
+            'encounter_probability': probability,
+            'palermo_scale': palermo,
+            'torino_scale': self.torino_scale(probability, energy)
+        }
+    
+    @staticmethod
+    def torino_scale(probability, energy_megatons):
+        """
+        Simplified Torino chart: collision certainty bands x energy bands
+        
+        0 no hazard, 1 normal, 2-4 meriting attention / concerning,
+        6 threatening, 8-10 certain collision (local / regional / global)
+        """
+        probability = np.asarray(probability)
+        energy = np.asarray(energy_megatons)
+        band = np.digitize(energy, (100, 100000))  # local, regional, global
+        return np.select(
+            [
+                (probability < 1e-8) | (energy < 1),
+                probability >= 0.99,
+                probability >= 1e-2,
+                probability >= 1e-4,
+            ],
+            [
+                0,
+                8 + band,
+                np.choose(band, (3, 4, 6)),
+                np.where(band > 0, 2, 1),
+            ],
+            default=1
+        ).astype(int)
+    
+    def rank(self, index, progress=None):
+        """
+        Replace the ThreatScore table with fresh scores for the catalog
+        
+        Args:
+            index: CatalogIndex of the local catalog
+            progress: Optional progress(fraction, message) callback
+        
+        Returns:
+            dict: Count of ranked asteroids and the time they were computed at
+        """
+        from .models import ThreatScore
+        
+        scores = self.score(index)
+        catalog = index.catalog
+        computed_at = timezone.now()
+        epoch = datetime.date(1970, 1, 1)
+        
+        objects = []
+        for i, row in enumerate(scores['rows']):
+            row = int(row)
+            day = scores['approach_day'][i]
+            energy = float(scores['energy_megatons_tnt'][i])
+            objects.append(ThreatScore(
+                asteroid_id=catalog.value('id', row),
+                name=catalog.value('name', row) or '',
+                is_potentially_hazardous=catalog.value('is_potentially_hazardous', row),
+                diameter_km=float(scores['diameter_km'][i]),
+                velocity_kmps=float(scores['velocity_kmps'][i]),
+                miss_distance_km=float(scores['miss_distance_km'][i]),
+                close_approach_date=epoch + datetime.timedelta(days=int(day)) if np.isfinite(day) else None,
+                mass_kg=float(scores['mass_kg'][i]),
+                energy_megatons_tnt=energy,
+                is_airburst=bool(scores['is_airburst'][i]),
+                severity=self.engine._assess_severity(energy),
+                severity_level=int(scores['severity_level'][i]),
+                encounter_probability=float(scores['encounter_probability'][i]),
+                palermo_scale=float(scores['palermo_scale'][i]),
+                torino_scale=int(scores['torino_scale'][i]),
+                computed_at=computed_at
+            ))
+        
+        if progress is not None:
+            progress(0.5, f'Writing {len(objects)} scores')
+        
+        # Readers keep seeing the previous ranking until the swap commits
+        with transaction.atomic():
+            ThreatScore.objects.all().delete()
+            ThreatScore.objects.bulk_create(objects, batch_size=1000)
+        
+        return {'ranked': len(objects), 'computed_at': computed_at.isoformat()}
+
+
+def encode_rank_cursor(palermo_scale, asteroid_id):
+    """Opaque keyset cursor for the position after (palermo_scale, asteroid_id)"""
+    return base64.urlsafe_b64encode(f'{palermo_scale!r}|{asteroid_id}'.encode()).decode().rstrip('=')
+
+
+def decode_rank_cursor(cursor):
+    """(palermo_scale, asteroid_id) from a cursor; ValueError if it is malformed"""
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        score, asteroid_id = decoded.split('|', 1)
+        return float(score), asteroid_id
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError('Invalid cursor')
+
+
+# Singleton instance
+threat_ranker = ThreatRanker(physics_engine)
@@ -10,6 +10,12 @@ urlpatterns = [
     
     # NASA API endpoints
     path('asteroids', views.get_asteroids, name='get_asteroids'),
+    path('asteroids/batch', views.get_asteroid_batch, name='get_asteroid_batch'),
+    path('asteroids/query', views.query_asteroids, name='query_asteroids'),
+    path('asteroids/search', views.search_asteroid_names, name='search_asteroid_names'),
+    path('asteroids/top-threats', views.top_threats, name='top_threats'),
+    path('asteroids/stats', views.catalog_statistics, name='catalog_statistics'),
+    path('asteroids/changes', views.catalog_changes, name='catalog_changes'),
     path('asteroids/<str:asteroid_id>', views.get_asteroid_detail, name='get_asteroid_detail'),
     path('earth-imagery', views.get_earth_imagery, name='get_earth_imagery'),
     path('planetary-imagery', views.get_planetary_imagery, name='get_planetary_imagery'),
@@ -22,4 +28,18 @@ urlpatterns = [
     
     # Deflection simulation
     path('simulate-deflection', views.simulate_deflection, name='simulate_deflection'),
+    path('deflection-sweep', views.deflection_sweep, name='deflection_sweep'),
+    path('deflection-miss-distance', views.deflection_miss_distance, name='deflection_miss_distance'),
+    
+    # Background simulation jobs
+    path('jobs', views.submit_job, name='submit_job'),
+    path('jobs/<uuid:job_id>', views.job_status, name='job_status'),
+    path('jobs/<uuid:job_id>/result', views.job_result, name='job_result'),
+    
+    # Streaming simulations (server-sent events)
+    path('stream/monte-carlo', views.stream_monte_carlo, name='stream_monte_carlo'),
+    path('stream/impact-grid', views.stream_impact_grid, name='stream_impact_grid'),
+    
+    # Simulation result cache
+    path('simulation-cache', views.simulation_cache_stats, name='simulation_cache_stats'),
 ]
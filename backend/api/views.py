@@ -2,19 +2,44 @@
 API Views for Asteroid Impact Simulator
 Integrates NASA API, Physics Engine, and Casualty Calculator
 """
-from rest_framework.decorators import api_view
+import json
+
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework import status
 # from django_ratelimit.decorators import ratelimit  # Disabled for local dev
 from django.views.decorators.cache import cache_page
-from .nasa_api import nasa_api
-from .physics import physics_engine
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from .nasa_api import NEORecord, nasa_api
 from .casualty_calculator import casualty_calculator
+from .simulation_graph import SimulationGraph, simulation_sessions
+from .result_cache import simulation_cache
+from .models import SimulationJob, ThreatScore
+from .renderers import ColumnarRenderer, NDJSONRenderer
+from .conditional import conditional_get
+from .lazy import lazy_import
+
+# numpy-backed engines are imported by the first view that uses them
+physics_engine = lazy_import('api.physics', 'physics_engine')
+deflection_optimizer = lazy_import('api.deflection', 'deflection_optimizer')
+job_queue = lazy_import('api.jobs', 'job_queue')
+simulation_streams = lazy_import('api.streaming', 'simulation_streams')
+catalog_store = lazy_import('api.catalog_store', 'catalog_store')
+
+# Seconds NASA-backed listings are cached (cache_page) and may be reused by clients
+FEED_CACHE_SECONDS = 60 * 5
+DETAIL_CACHE_SECONDS = 60 * 10
+# Retry-After sent while the local catalog is loading
+CATALOG_RETRY_SECONDS = 10
 
 
+@conditional_get(max_age=FEED_CACHE_SECONDS)
 @api_view(['GET'])
+@renderer_classes([JSONRenderer, NDJSONRenderer, ColumnarRenderer])
 # @ratelimit(key='ip', rate='100/h', method='GET')  # Disabled
-@cache_page(60 * 5)  # Cache for 5 minutes
+@cache_page(FEED_CACHE_SECONDS)  # Cache for 5 minutes
 def get_asteroids(request):
     """
     GET /api/asteroids
@@ -23,38 +48,447 @@ def get_asteroids(request):
     Query params:
         - start_date: Start date (YYYY-MM-DD)
         - end_date: End date (YYYY-MM-DD)
-        - hazardous_only: Filter potentially hazardous asteroids (true/false)
+        - hazardous_only: Filter potentially hazardous asteroids (true/false),
+          applied across the whole /neo/browse catalog
+        - browse: true to page through the whole catalog without the filter
+        - cursor: next_cursor from a previous hazardous_only/browse response
+        - limit: Asteroids per hazardous_only/browse response (default: as
+          many as the NEO_BROWSE_PAGE_BUDGET pages allow)
+        - format: ndjson to stream one asteroid per line (date ranges longer
+          than 7 days are fetched week by week)
+        - pages: Browse pages to stream with hazardous_only/browse in ndjson mode (default 1)
+        - format: columnar for the binary column layout of api.catalog, served
+          from the local catalog (api.catalog_store): hazardous_only and
+          start_date/end_date (close approach date) filter it, cursor and
+          limit do not apply; precision=32 sends float columns as float32
+        - fields: Comma-separated fields to return, e.g.
+          name,diameter_km,velocity_kmps,is_potentially_hazardous
+          (default all; orbital_data is only parsed when listed)
     """
     start_date = request.GET.get('start_date')
     end_date = request.GET.get('end_date')
     hazardous_only = request.GET.get('hazardous_only', '').lower() == 'true'
+    browse = hazardous_only or request.GET.get('browse', '').lower() == 'true'
+    
+    try:
+        fields = NEORecord.parse_fields(request.GET.get('fields'))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    if request.accepted_renderer.format == 'ndjson':
+        return _stream_asteroids(request, start_date, end_date, hazardous_only, browse, fields)
+    if request.accepted_renderer.format == 'columnar':
+        return _columnar_asteroids(request, start_date, end_date, hazardous_only, fields)
     
     # Fetch from NASA API
-    if hazardous_only:
-        result = nasa_api.search_asteroids(is_potentially_hazardous=True)
+    if browse:
+        try:
+            limit = request.GET.get('limit')
+            limit = int(limit) if limit else None
+            if limit is not None and limit < 1:
+                raise ValueError('limit must be a positive integer')
+            result = nasa_api.browse(
+                is_potentially_hazardous=True if hazardous_only else None,
+                cursor=request.GET.get('cursor'),
+                limit=limit
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     else:
-        result = nasa_api.get_neo_feed(start_date, end_date)
+        result = nasa_api.get_neo_feed(start_date, end_date, fields=fields)
     
     if 'error' in result:
         return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    return Response(result, status=status.HTTP_200_OK)
+    return Response(_serialize_asteroids(result, fields), status=status.HTTP_200_OK)
+
+
+def _serialize_asteroids(result, fields=None):
+    """Listing with its NEORecord objects converted to JSON-ready dicts"""
+    return dict(result, asteroids=[asteroid.to_dict(fields) for asteroid in result['asteroids']])
+
+
+def _columnar_asteroids(request, start_date, end_date, hazardous_only, fields=None):
+    """
+    Columnar listing of the local catalog
+    
+    The catalog's column arrays are streamed chunk by chunk as they are held
+    in memory (copied only for a filtered subset or a float32 cast), with no
+    NASA requests and no per-asteroid objects.
+    """
+    index = catalog_store.get()
+    if index is None:
+        return _catalog_unavailable()
+    
+    ranges = {}
+    equals = {'is_potentially_hazardous': True} if hazardous_only else {}
+    try:
+        if start_date or end_date:
+            ranges['close_approach_date'] = tuple(
+                index.day_number(day) if day else None
+                for day in (start_date, end_date)
+            )
+    except ValueError:
+        return Response({'error': 'Dates must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    rows = None
+    if ranges or equals:
+        _, rows = index.query(ranges, equals, limit=len(index.catalog))
+    catalog = index.catalog.select(rows, fields)
+    
+    float_dtype = '<f4' if request.GET.get('precision') == '32' else '<f8'
+    response = StreamingHttpResponse(
+        catalog.to_columnar_chunks(float_dtype), content_type=ColumnarRenderer.media_type
+    )
+    response['X-Catalog-Synced-At'] = str(catalog_store.synced_at)
+    return response
+
+
+def _stream_asteroids(request, start_date, end_date, hazardous_only, browse=False, fields=None):
+    """
+    NDJSON listing built from the NASA client's generators
+    
+    Asteroids are serialised and sent one at a time, so memory stays at one
+    NASA page/week regardless of the size of the listing. An upstream failure
+    mid-stream ends the body with an {"error": ...} line. Date ranges are
+    checked against NEO_FEED_MAX_DAYS after the defaults are filled in
+    (start: today, end: start + 7 days), as each 7 days costs a NASA request.
+    """
+    from datetime import datetime, timedelta
+    from django.conf import settings
+    
+    if browse:
+        try:
+            pages = int(request.GET.get('pages', 1))
+        except ValueError:
+            pages = 0
+        if not 1 <= pages <= settings.NEO_BROWSE_MAX_PAGES:
+            return Response(
+                {'error': f'pages must be between 1 and {settings.NEO_BROWSE_MAX_PAGES}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        records = nasa_api.iter_browse(
+            is_potentially_hazardous=True if hazardous_only else None, pages=pages, fields=fields
+        )
+    else:
+        try:
+            start = datetime.strptime(start_date, '%Y-%m-%d') if start_date else datetime.now()
+            end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else start + timedelta(days=7)
+        except ValueError:
+            return Response(
+                {'error': 'Dates must be YYYY-MM-DD'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not 0 <= (end.date() - start.date()).days <= settings.NEO_FEED_MAX_DAYS:
+            return Response(
+                {'error': f'Date range must be 0-{settings.NEO_FEED_MAX_DAYS} days'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        records = nasa_api.iter_neo_feed(
+            start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'), fields=fields
+        )
+    
+    lines = (
+        json.dumps(record.to_dict(fields) if isinstance(record, NEORecord) else record) + '\n'
+        for record in records
+    )
+    response = StreamingHttpResponse(lines, content_type=NDJSONRenderer.media_type)
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api_view(['GET'])
+def get_asteroid_batch(request):
+    """
+    GET /api/asteroids/batch?ids=3542519,2000433
+    Details for several asteroids in one request
+    
+    Cached IDs are answered immediately and the rest fetched from NASA
+    concurrently. IDs that fail are reported under 'errors' instead of
+    failing the batch.
+    
+    Query params:
+        - ids: Comma-separated NASA NEO IDs (at most NEO_BATCH_MAX_IDS)
+        - fields: Comma-separated fields to return (default all)
+    """
+    from django.conf import settings
+    
+    ids = [i.strip() for i in request.GET.get('ids', '').split(',') if i.strip()]
+    if not ids:
+        return Response({'error': 'ids is required'}, status=status.HTTP_400_BAD_REQUEST)
+    if len(ids) > settings.NEO_BATCH_MAX_IDS:
+        return Response(
+            {'error': f'At most {settings.NEO_BATCH_MAX_IDS} ids per batch'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        fields = NEORecord.parse_fields(request.GET.get('fields'))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    result = nasa_api.get_asteroids_by_ids(ids)
+    asteroids = [asteroid.to_dict(fields) for asteroid in result['asteroids']]
+    
+    return Response({
+        'count': len(asteroids),
+        'asteroids': asteroids,
+        'errors': result['errors'],
+        'cached': result['cached']
+    }, status=status.HTTP_200_OK)
+
+
+def _catalog_unavailable():
+    """503 for views over the local catalog while it loads (or its last sync failed)"""
+    response = Response({
+        'error': 'Asteroid catalog is loading' if catalog_store.loading else 'Asteroid catalog unavailable',
+        'sync': catalog_store.last_sync
+    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    response['Retry-After'] = str(CATALOG_RETRY_SECONDS)
+    return response
+
+
+@api_view(['GET'])
+def query_asteroids(request):
+    """
+    GET /api/asteroids/query
+    Range queries over the locally held catalog (see api.catalog_store)
+    
+    Query params:
+        - <column>_min / <column>_max: Inclusive bounds on any numeric column,
+          e.g. diameter_km_min=0.1&diameter_km_max=1, velocity_kmps_min=20,
+          miss_distance_lunar_max=10, or the derived mass_kg and
+          energy_megatons_tnt
+        - approach_from / approach_to: close_approach_date window (YYYY-MM-DD)
+        - hazardous: true/false
+        - sort: Column to order by, '-' prefix for descending (e.g. -diameter_km)
+        - limit: Results per page (default 100, max NEO_QUERY_MAX_LIMIT)
+        - offset: Results to skip
+        - fields: Comma-separated fields to return (default all)
+    """
+    import time
+    from django.conf import settings
+    
+    index = catalog_store.get()
+    if index is None:
+        return _catalog_unavailable()
+    
+    started = time.perf_counter()
+    try:
+        fields = NEORecord.parse_fields(request.GET.get('fields'))
+        columns = index.columns
+        
+        ranges = {}
+        for name in columns:
+            low = request.GET.get(f'{name}_min')
+            high = request.GET.get(f'{name}_max')
+            if low is not None or high is not None:
+                ranges[name] = (
+                    float(low) if low is not None else None,
+                    float(high) if high is not None else None
+                )
+        
+        approach = [request.GET.get('approach_from'), request.GET.get('approach_to')]
+        if any(approach):
+            ranges['close_approach_date'] = tuple(
+                index.day_number(day) if day else None
+                for day in approach
+            )
+        
+        equals = {}
+        if request.GET.get('hazardous'):
+            equals['is_potentially_hazardous'] = request.GET['hazardous'].lower() == 'true'
+        
+        sort = request.GET.get('sort') or None
+        descending = bool(sort) and sort.startswith('-')
+        if sort:
+            sort = sort.lstrip('-')
+            if sort not in columns:
+                raise ValueError(f"Cannot sort on {sort}. Available: {', '.join(columns)}")
+        
+        limit = int(request.GET.get('limit', 100))
+        offset = int(request.GET.get('offset', 0))
+        if not 1 <= limit <= settings.NEO_QUERY_MAX_LIMIT or offset < 0:
+            raise ValueError(f'limit must be 1-{settings.NEO_QUERY_MAX_LIMIT} and offset >= 0')
+        
+        total, rows = index.query(ranges, equals, sort, descending, offset, limit)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    asteroids = [index.catalog.record(int(row), fields) for row in rows]
+    
+    return Response({
+        'count': total,
+        'offset': offset,
+        'asteroids': asteroids,
+        'catalog_size': len(index.catalog),
+        'catalog_synced_at': catalog_store.synced_at,
+        'query_ms': round((time.perf_counter() - started) * 1000, 3)
+    }, status=status.HTTP_200_OK)
 
 
+@api_view(['GET'])
+def search_asteroid_names(request):
+    """
+    GET /api/asteroids/search?q=apophis
+    Autocomplete asteroid names and designations from the local catalog
+    
+    Query params:
+        - q: Text typed so far (prefix match per word, e.g. "2024 yr", "apoph")
+        - limit: Maximum results (default 10, max 50)
+        - fuzzy: false to disable typo-tolerant matches
+    """
+    import time
+    
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        limit = int(request.GET.get('limit', 10))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= 50:
+        return Response({'error': 'limit must be 1-50'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    if catalog_store.get() is None:
+        return _catalog_unavailable()
+    
+    started = time.perf_counter()
+    results = catalog_store.names.search(
+        query, limit=limit, fuzzy=request.GET.get('fuzzy', '').lower() != 'false'
+    )
+    
+    return Response({
+        'query': query,
+        'results': results,
+        'search_ms': round((time.perf_counter() - started) * 1000, 3)
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def top_threats(request):
+    """
+    GET /api/asteroids/top-threats
+    Cataloged asteroids ranked by precomputed Palermo-style score
+    (refresh with POST /api/jobs {"kind": "threat_ranking"})
+    
+    Query params:
+        - limit: Results per page (default 20, max 200)
+        - cursor: next_cursor from the previous page
+        - hazardous_only: true to rank potentially hazardous asteroids only
+        - min_torino: Minimum Torino-style category
+    """
+    from django.db.models import Q
+    from .threats import decode_rank_cursor, encode_rank_cursor
+    
+    try:
+        limit = int(request.GET.get('limit', 20))
+        if not 1 <= limit <= 200:
+            raise ValueError('limit must be 1-200')
+        
+        scores = ThreatScore.objects.order_by('-palermo_scale', 'asteroid_id')
+        if request.GET.get('hazardous_only', '').lower() == 'true':
+            scores = scores.filter(is_potentially_hazardous=True)
+        if request.GET.get('min_torino'):
+            scores = scores.filter(torino_scale__gte=int(request.GET['min_torino']))
+        
+        # Keyset pagination: seek past the last row instead of counting an offset
+        cursor = request.GET.get('cursor')
+        if cursor:
+            palermo, asteroid_id = decode_rank_cursor(cursor)
+            scores = scores.filter(
+                Q(palermo_scale__lt=palermo) | Q(palermo_scale=palermo, asteroid_id__gt=asteroid_id)
+            )
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    page = list(scores[:limit + 1])
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_rank_cursor(page[-1].palermo_scale, page[-1].asteroid_id)
+    
+    return Response({
+        'count': len(page),
+        'threats': [score.to_dict() for score in page],
+        'next_cursor': next_cursor
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def catalog_statistics(request):
+    """
+    GET /api/asteroids/stats
+    Aggregates over the local catalog: counts by size class, hazard flag and
+    approach month, energy histogram and quantiles (kept up to date on sync)
+    """
+    if catalog_store.get() is None:
+        return _catalog_unavailable()
+    
+    return Response(catalog_store.stats.snapshot(), status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def catalog_changes(request):
+    """
+    GET /api/asteroids/changes
+    Asteroids added, updated (new orbit_id, new close approach, hazard flag
+    flip) or removed by the catalog syncs after a version
+    
+    Query params:
+        - since: Catalog version the client already has (default 0 = all changes)
+        - limit: Changes per page (default 1000, max NEO_CHANGES_MAX_LIMIT)
+        - cursor: next_cursor from the previous page of the same since
+    """
+    from django.conf import settings
+    
+    try:
+        since = int(request.GET.get('since', 0))
+        if since < 0:
+            raise ValueError('since must be a non-negative version')
+        limit = int(request.GET.get('limit', 1000))
+        if not 1 <= limit <= settings.NEO_CHANGES_MAX_LIMIT:
+            raise ValueError(f'limit must be 1-{settings.NEO_CHANGES_MAX_LIMIT}')
+        cursor = int(request.GET['cursor']) if request.GET.get('cursor') else None
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    changes, more = catalog_store.changes.changes_since(since, after_id=cursor, limit=limit)
+    # Read after the page so version never trails the changes returned
+    version = catalog_store.changes.current_version()
+    
+    return Response({
+        'version': version,
+        'since': since,
+        'count': len(changes),
+        'changes': [change.to_dict() for change in changes],
+        'next_cursor': str(changes[-1].id) if more else None
+    }, status=status.HTTP_200_OK)
+
+
+@conditional_get(max_age=DETAIL_CACHE_SECONDS)
 @api_view(['GET'])
 # @ratelimit(key='ip', rate='200/h', method='GET')  # Disabled
-@cache_page(60 * 10)  # Cache for 10 minutes
+@cache_page(DETAIL_CACHE_SECONDS)  # Cache for 10 minutes
 def get_asteroid_detail(request, asteroid_id):
     """
     GET /api/asteroids/<id>
     Get detailed information about a specific asteroid
+    
+    Query params:
+        - fields: Comma-separated fields to return (default all)
     """
+    try:
+        fields = NEORecord.parse_fields(request.GET.get('fields'))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
     result = nasa_api.get_asteroid_by_id(asteroid_id)
     
     if 'error' in result:
         return Response(result, status=status.HTTP_404_NOT_FOUND)
     
-    return Response(result, status=status.HTTP_200_OK)
+    return Response(result.to_dict(fields), status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -71,7 +505,10 @@ def simulate_impact(request):
             "impact_lat": 40.7128,
             "impact_lon": -74.0060,
             "impact_angle": 45,
-            "density": 3000 (optional)
+            "density": 3000 (optional),
+            "mode": "exact" | "table" (optional, default: exact),
+            "sensitivity": true (optional, adds derivatives and elasticities),
+            "session": true | "session_id": "<id>" (optional, incremental what-if runs)
         }
     """
     try:
@@ -83,6 +520,7 @@ def simulate_impact(request):
         impact_lon = float(data.get('impact_lon', 0))
         impact_angle = float(data.get('impact_angle', 45))
         density = data.get('density')
+        mode = data.get('mode', 'exact')
         
         if diameter_km <= 0 or velocity_kmps <= 0:
             return Response(
@@ -90,31 +528,32 @@ def simulate_impact(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Run full impact simulation
-        result = physics_engine.calculate_full_impact_simulation(
-            diameter_km=diameter_km,
-            velocity_kmps=velocity_kmps,
-            impact_lat=impact_lat,
-            impact_lon=impact_lon,
-            impact_angle=impact_angle,
-            density=float(density) if density else None
-        )
-        
-        # Calculate casualties using accurate geocoding
-        blast_radius = result['blast_zones']['total_destruction_radius_km']
-        energy_megatons = result['energy']['energy_megatons_tnt']
+        if mode not in physics_engine.MODES:
+            return Response(
+                {'error': 'Invalid mode. Choose: exact or table'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        casualties = casualty_calculator.calculate_casualties(
-            impact_lat=impact_lat,
-            impact_lon=impact_lon,
-            blast_radius_km=blast_radius,
-            energy_megatons=energy_megatons
-        )
+        params = {
+            'diameter_km': diameter_km,
+            'velocity_kmps': velocity_kmps,
+            'impact_lat': impact_lat,
+            'impact_lon': impact_lon,
+            'impact_angle': impact_angle,
+            'density': float(density) if density else None,
+            'mode': mode,
+            'sensitivity': bool(data.get('sensitivity', False))
+        }
         
-        # Add casualties to result
-        result['casualties'] = casualties
+        # Run full impact simulation (physics stages, geocoding and casualties)
+        if _uses_session(data):
+            return Response(_run_impact_simulation(data, params), status=status.HTTP_200_OK)
         
-        return Response(result, status=status.HTTP_200_OK)
+        result, hit = simulation_cache.get_or_compute(
+            simulation_cache.make_key('simulate_impact', params),
+            lambda: _run_impact_simulation(data, params)
+        )
+        return _cached_response(_with_impact_location(result, impact_lat, impact_lon), hit)
         
     except (ValueError, TypeError) as e:
         return Response(
@@ -123,6 +562,70 @@ def simulate_impact(request):
         )
 
 
+def _run_impact_simulation(data, params):
+    """
+    Evaluate the simulation graph, reusing a session's stages when requested
+    
+    With "session": true (or a known "session_id") the stages are memoized
+    per session, so a follow-up request that changes one input recomputes
+    only the stages downstream of it (e.g. a new angle skips geocoding).
+    """
+    session_id = data.get('session_id')
+    use_session = _uses_session(data)
+    
+    if use_session:
+        session_id, graph, created = simulation_sessions.get_or_create(
+            session_id, lambda: SimulationGraph(physics_engine, casualty_calculator)
+        )
+    else:
+        graph = SimulationGraph(physics_engine, casualty_calculator)
+    
+    with graph.lock:
+        values = graph.evaluate(params, targets=('result', 'sensitivity', 'casualties'))
+        reused, recomputed = graph.last_reused, graph.last_recomputed
+    
+    result = dict(values['result'])
+    if params.get('sensitivity'):
+        result['sensitivity'] = values['sensitivity']
+    result['casualties'] = values['casualties']
+    
+    if use_session:
+        result['session'] = {
+            'id': session_id,
+            'created': created,
+            'reused_stages': reused,
+            'recomputed_stages': recomputed
+        }
+    
+    return result
+
+
+def _uses_session(data):
+    """Session requests are stateful, so they bypass the result cache"""
+    return bool(data.get('session_id') or data.get('session'))
+
+
+def _with_impact_location(result, impact_lat, impact_lon):
+    """
+    Echo the requested coordinates on a cached result
+    
+    Cache keys quantise coordinates, so a hit may have been computed for a
+    point a few metres away; the physics is identical but the response should
+    still report the location the client asked for.
+    """
+    result = dict(result)
+    result['impact_location'] = dict(
+        result['impact_location'], latitude=impact_lat, longitude=impact_lon
+    )
+    return result
+
+
+def _cached_response(result, hit):
+    response = Response(result, status=status.HTTP_200_OK)
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
+
+
 @api_view(['POST'])
 def simulate_deflection(request):
     """
@@ -160,13 +663,21 @@ def simulate_deflection(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        result = physics_engine.simulate_deflection(
-            original_velocity_kmps=original_velocity,
-            deflection_method=method,
-            deflection_params=params
+        cache_key = simulation_cache.make_key('simulate_deflection', {
+            'original_velocity_kmps': original_velocity,
+            'method': method,
+            'params': params
+        })
+        result, hit = simulation_cache.get_or_compute(
+            cache_key,
+            lambda: physics_engine.simulate_deflection(
+                original_velocity_kmps=original_velocity,
+                deflection_method=method,
+                deflection_params=params
+            )
         )
         
-        return Response(result, status=status.HTTP_200_OK)
+        return _cached_response(result, hit)
         
     except (ValueError, TypeError) as e:
         return Response(
@@ -175,6 +686,91 @@ def simulate_deflection(request):
         )
 
 
+@api_view(['POST'])
+def deflection_sweep(request):
+    """
+    POST /api/deflection-sweep
+    Sweep deflection parameters across methods and return the Pareto frontier
+    (deployed mass vs effectiveness vs lead time)
+    
+    Body:
+        {
+            "original_velocity_kmps": 20,
+            "methods": ["kinetic_impactor", "gravity_tractor", "nuclear"] (optional),
+            "grids": {
+                // Optional overrides; a list of values or a range spec
+                "impactor_mass_kg": {"min": 100, "max": 20000, "num": 24, "scale": "log"},
+                "impactor_velocity_kmps": [5, 10, 15],
+                "asteroid_mass_kg": [1e12],
+                "spacecraft_mass_kg": ..., "duration_days": ..., "yield_megatons": ...
+            },
+            "target_delta_v_kmps": 0.00001 (optional, lightest config per method reaching it),
+            "parallel": true (optional, spread large grids over a process pool),
+            "max_frontier_points": 200 (optional)
+        }
+    
+    Grids are limited to 2000 values per axis and DEFLECTION_SWEEP_MAX_POINTS
+    points in total; larger sweeps run as a "deflection_sweep" job.
+    """
+    try:
+        from django.conf import settings
+        
+        data = request.data
+        
+        sweep_params = deflection_optimizer.parse_sweep_request(data)
+        workers = settings.DEFLECTION_SWEEP_WORKERS if data.get('parallel') else 1
+        
+        result, hit = simulation_cache.get_or_compute(
+            simulation_cache.make_key('deflection_sweep', sweep_params),
+            lambda: deflection_optimizer.sweep(
+                workers=workers, max_points=settings.DEFLECTION_SWEEP_MAX_POINTS, **sweep_params
+            )
+        )
+        
+        return _cached_response(result, hit)
+        
+    except (ValueError, TypeError, KeyError) as e:
+        return Response(
+            {'error': f'Invalid sweep parameters: {str(e)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+@api_view(['POST'])
+def deflection_miss_distance(request):
+    """
+    POST /api/deflection-miss-distance
+    Miss-distance shift vs lead time and delta-v ("deflect N years early" curves)
+    
+    Body:
+        {
+            "asteroid_id": "3542519",
+            // or explicit orbit instead of asteroid_id:
+            "semi_major_axis_au": 1.1, "eccentricity": 0.2, "velocity_kmps": 15,
+            "lead_time_years": {"min": 0.1, "max": 20, "num": 60} (optional, or a list),
+            "delta_v_kmps": {"min": 1e-7, "max": 1e-4, "num": 31, "scale": "log"} (optional),
+            "impact_parameter_km": 0 (optional, undeflected B-plane distance)
+        }
+    """
+    try:
+        kwargs, asteroid_info = deflection_optimizer.parse_miss_distance_request(request.data)
+        
+        result = deflection_optimizer.miss_distance_curves(**kwargs)
+        if asteroid_info:
+            result['asteroid_info'] = asteroid_info
+        
+        return Response(result, status=status.HTTP_200_OK)
+        
+    except (ValueError, TypeError, KeyError) as e:
+        return Response(
+            {'error': f'Invalid data format: {str(e)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except LookupError as e:
+        # NASA has no such asteroid (KeyError, also a LookupError, is caught above)
+        return Response({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+
+
 @api_view(['POST'])
 def calculate_impact_from_asteroid(request):
     """
@@ -186,7 +782,10 @@ def calculate_impact_from_asteroid(request):
             "asteroid_id": "3542519",
             "impact_lat": 40.7128,
             "impact_lon": -74.0060,
-            "impact_angle": 45
+            "impact_angle": 45,
+            "mode": "exact" | "table" (optional, default: exact),
+            "sensitivity": true (optional, adds derivatives and elasticities),
+            "session": true | "session_id": "<id>" (optional, incremental what-if runs)
         }
     """
     try:
@@ -196,6 +795,30 @@ def calculate_impact_from_asteroid(request):
         impact_lat = float(data.get('impact_lat', 0))
         impact_lon = float(data.get('impact_lon', 0))
         impact_angle = float(data.get('impact_angle', 45))
+        mode = data.get('mode', 'exact')
+        
+        if mode not in physics_engine.MODES:
+            return Response(
+                {'error': 'Invalid mode. Choose: exact or table'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        sensitivity = bool(data.get('sensitivity', False))
+        use_session = _uses_session(data)
+        
+        # Repeated scenarios skip the NASA lookup, the physics and the geocoding
+        cache_key = simulation_cache.make_key('impact_from_asteroid', {
+            'asteroid_id': asteroid_id,
+            'impact_lat': impact_lat,
+            'impact_lon': impact_lon,
+            'impact_angle': impact_angle,
+            'mode': mode,
+            'sensitivity': sensitivity
+        })
+        if not use_session:
+            result = simulation_cache.get(cache_key)
+            if result is not None:
+                return _cached_response(_with_impact_location(result, impact_lat, impact_lon), True)
         
         # Fetch asteroid data
         asteroid_data = nasa_api.get_asteroid_by_id(asteroid_id)
@@ -204,27 +827,15 @@ def calculate_impact_from_asteroid(request):
             return Response(asteroid_data, status=status.HTTP_404_NOT_FOUND)
         
         # Run impact simulation with asteroid data
-        result = physics_engine.calculate_full_impact_simulation(
-            diameter_km=asteroid_data['diameter_km'],
-            velocity_kmps=asteroid_data['velocity_kmps'],
-            impact_lat=impact_lat,
-            impact_lon=impact_lon,
-            impact_angle=impact_angle
-        )
-        
-        # Calculate casualties using accurate geocoding
-        blast_radius = result['blast_zones']['total_destruction_radius_km']
-        energy_megatons = result['energy']['energy_megatons_tnt']
-        
-        casualties = casualty_calculator.calculate_casualties(
-            impact_lat=impact_lat,
-            impact_lon=impact_lon,
-            blast_radius_km=blast_radius,
-            energy_megatons=energy_megatons
-        )
-        
-        # Add casualties to result
-        result['casualties'] = casualties
+        result = _run_impact_simulation(data, {
+            'diameter_km': asteroid_data['diameter_km'],
+            'velocity_kmps': asteroid_data['velocity_kmps'],
+            'impact_lat': impact_lat,
+            'impact_lon': impact_lon,
+            'impact_angle': impact_angle,
+            'mode': mode,
+            'sensitivity': sensitivity
+        })
         
         # Add asteroid metadata
         result['asteroid_info'] = {
@@ -233,7 +844,11 @@ def calculate_impact_from_asteroid(request):
             'is_potentially_hazardous': asteroid_data['is_potentially_hazardous']
         }
         
-        return Response(result, status=status.HTTP_200_OK)
+        if use_session:
+            return Response(result, status=status.HTTP_200_OK)
+        
+        simulation_cache.set(cache_key, result)
+        return _cached_response(result, False)
         
     except (ValueError, TypeError) as e:
         return Response(
@@ -299,6 +914,182 @@ def get_planetary_imagery(request):
         )
 
 
+@api_view(['POST'])
+def submit_job(request):
+    """
+    POST /api/jobs
+    Queue a long-running simulation; poll /api/jobs/<id> for progress
+    
+    Body:
+        {
+            "kind": "deflection_sweep" | "deflection_miss_distance" | "impact_grid"
+                    | "monte_carlo" | "catalog_sync" | "threat_ranking",
+            "params": { ... }  // same fields as the matching synchronous endpoint
+        }
+    
+    params are checked before the job is queued, so invalid ones get a 400
+    (404 for an unknown asteroid_id) instead of a failed job.
+    """
+    try:
+        data = request.data
+        params = data.get('params') or {}
+        
+        if not isinstance(params, dict):
+            return Response(
+                {'error': 'params must be an object'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        job = job_queue.submit(data.get('kind', ''), params)
+        
+        return Response(job.to_status_dict(), status=status.HTTP_202_ACCEPTED)
+        
+    except (ValueError, TypeError, KeyError) as e:
+        return Response({'error': f'Invalid job: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+    except LookupError as e:
+        return Response({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+
+
+@api_view(['GET', 'DELETE'])
+def job_status(request, job_id):
+    """
+    GET /api/jobs/<id>
+    Job status and progress (DELETE cancels a queued or running job)
+    """
+    if request.method == 'DELETE':
+        job_queue.cancel(job_id)
+    
+    try:
+        job = SimulationJob.objects.get(id=job_id)
+    except SimulationJob.DoesNotExist:
+        return Response({'error': f'Job {job_id} not found or expired'}, status=status.HTTP_404_NOT_FOUND)
+    
+    return Response(job.to_status_dict(), status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def job_result(request, job_id):
+    """
+    GET /api/jobs/<id>/result
+    Result of a finished job (202 with the status while it is still running)
+    """
+    try:
+        job = SimulationJob.objects.get(id=job_id)
+    except SimulationJob.DoesNotExist:
+        return Response({'error': f'Job {job_id} not found or expired'}, status=status.HTTP_404_NOT_FOUND)
+    
+    if job.status == SimulationJob.SUCCEEDED:
+        return Response(job.result, status=status.HTTP_200_OK)
+    if job.status == SimulationJob.FAILED:
+        return Response(job.to_status_dict(), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if job.status == SimulationJob.CANCELLED:
+        return Response(job.to_status_dict(), status=status.HTTP_410_GONE)
+    
+    return Response(job.to_status_dict(), status=status.HTTP_202_ACCEPTED)
+
+
+async def stream_monte_carlo(request):
+    """
+    GET /api/stream/monte-carlo
+    Server-sent events with running percentiles of a Monte Carlo impact ensemble
+    
+    Query params:
+        - diameter_km: Median diameter (log-normal spread diameter_sigma, default 0.3)
+        - velocity_kmps: Mean velocity (normal spread velocity_sigma, default 3)
+        - density: Density in kg/m^3 (optional)
+        - samples: Ensemble size (default 10000)
+        - batch_size: Samples per progress event (default 1000)
+        - seed: Random seed (optional)
+    
+    Events: open (stream id), progress, complete | cancelled
+    """
+    from django.conf import settings
+    
+    try:
+        params = simulation_streams.parse_monte_carlo(request.GET, settings.STREAM_MAX_SAMPLES)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    return _sse_response(request, simulation_streams.monte_carlo, params)
+
+
+async def stream_impact_grid(request):
+    """
+    GET /api/stream/impact-grid
+    Server-sent events with diameter x velocity grid tiles as they complete
+    
+    Query params:
+        - diameter_min_km, diameter_max_km, diameter_num: Log-spaced diameters
+        - velocity_min_kmps, velocity_max_kmps, velocity_num: Linear velocities
+        - impact_angle: Entry angle in degrees (default 45)
+        - density: Density in kg/m^3 (optional)
+        - tile_rows: Diameter rows per tile (default 8)
+    
+    Events: open (stream id), grid, tile, complete | cancelled
+    """
+    from django.conf import settings
+    
+    try:
+        query = request.GET
+        params = {
+            'diameter_min_km': float(query.get('diameter_min_km', 0.01)),
+            'diameter_max_km': float(query.get('diameter_max_km', 10)),
+            'diameter_num': int(query.get('diameter_num', 64)),
+            'velocity_min_kmps': float(query.get('velocity_min_kmps', 11.2)),
+            'velocity_max_kmps': float(query.get('velocity_max_kmps', 72)),
+            'velocity_num': int(query.get('velocity_num', 64)),
+            'impact_angle': float(query.get('impact_angle', 45)),
+            'density': float(query['density']) if query.get('density') else None,
+            'tile_rows': int(query.get('tile_rows', 8))
+        }
+    except ValueError as e:
+        return JsonResponse({'error': f'Invalid data format: {str(e)}'}, status=400)
+    
+    points = params['diameter_num'] * params['velocity_num']
+    if (params['diameter_min_km'] <= 0 or params['diameter_max_km'] < params['diameter_min_km']
+            or params['velocity_min_kmps'] <= 0 or params['velocity_max_kmps'] < params['velocity_min_kmps']):
+        return JsonResponse({'error': 'Invalid grid ranges'}, status=400)
+    if params['diameter_num'] < 1 or params['velocity_num'] < 1 or params['tile_rows'] < 1:
+        return JsonResponse({'error': 'Grid sizes and tile_rows must be positive'}, status=400)
+    if points > settings.STREAM_MAX_GRID_POINTS:
+        return JsonResponse(
+            {'error': f'Grid has {points} points; the limit is {settings.STREAM_MAX_GRID_POINTS}'},
+            status=400
+        )
+    
+    return _sse_response(request, simulation_streams.grid_tiles, params)
+
+
+def _sse_response(request, generator, params):
+    """
+    Stream a simulation generator as text/event-stream
+    
+    Under ASGI each batch runs in a worker thread so the event loop stays free;
+    under WSGI the worker iterates the generator directly.
+    """
+    stream_id, cancelled = simulation_streams.open()
+    events = generator(params, cancelled)
+    
+    if isinstance(request, ASGIRequest):
+        content = simulation_streams.async_event_stream(stream_id, events)
+    else:
+        content = simulation_streams.event_stream(stream_id, events)
+    
+    response = StreamingHttpResponse(content, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Don't let proxies buffer the events
+    return response
+
+
+@api_view(['GET'])
+def simulation_cache_stats(request):
+    """
+    GET /api/simulation-cache
+    Hit rate and size of the POST simulation result cache (this process only)
+    """
+    return Response(simulation_cache.stats(), status=status.HTTP_200_OK)
+
+
 @api_view(['GET'])
 def health_check(request):
     """
@@ -2,10 +2,63 @@
 ASGI config for backend project.
 """
 
+import asyncio
+import contextvars
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from asgiref.sync import sync_to_async
+from django.core.handlers import asgi
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
-application = get_asgi_application()
+# receive() of the request being handled, for send_response()
+_receive = contextvars.ContextVar('asgi_receive')
+
+
+class ASGIHandler(asgi.ASGIHandler):
+    """
+    Django's ASGI handler, also ending streamed responses when the client disconnects
+    
+    Django 4.2 only watches for http.disconnect while it reads the request
+    body, and uvicorn drops sends to a closed connection silently, so a
+    server-sent-event stream would otherwise be computed to the end after
+    its client has gone.
+    """
+    
+    async def handle(self, scope, receive, send):
+        token = _receive.set(receive)
+        try:
+            await super().handle(scope, receive, send)
+        finally:
+            _receive.reset(token)
+    
+    async def send_response(self, response, send):
+        if not response.streaming:
+            return await super().send_response(response, send)
+        
+        sending = asyncio.ensure_future(super().send_response(response, send))
+        disconnect = asyncio.ensure_future(_wait_for_disconnect(_receive.get()))
+        try:
+            await asyncio.wait((sending, disconnect), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            disconnect.cancel()
+            if not sending.done():
+                # Client gone: cancelling unwinds the response's generators
+                sending.cancel()
+        try:
+            await sending
+        except asyncio.CancelledError:
+            if not disconnect.done() or disconnect.cancelled():
+                raise
+            await sync_to_async(response.close, thread_sensitive=True)()
+
+
+async def _wait_for_disconnect(receive):
+    # The request body has been read, so the next message is the disconnect
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+django.setup(set_prefix=False)
+application = ASGIHandler()
@@ -164,6 +164,87 @@ REST_FRAMEWORK = {
 NASA_API_KEY = config('NASA_API_KEY', default='8Bzer5xzem5a4ZGqHrw4d9oR2KGdZ8f8gJeqscQC')
 NASA_API_BASE_URL = 'https://api.nasa.gov/neo/rest/v1'
 
+# Limits for streamed (?format=ndjson) asteroid listings
+NEO_FEED_MAX_DAYS = config('NEO_FEED_MAX_DAYS', default=366, cast=int)
+NEO_BROWSE_MAX_PAGES = config('NEO_BROWSE_MAX_PAGES', default=50, cast=int)
+
+# Full /neo/browse walks (hazardous_only / browse listings with cursors)
+# NEO_BROWSE_CONCURRENCY: pages requested from NASA in parallel
+# NEO_BROWSE_PAGE_BUDGET: uncached NASA pages fetched per request (cached pages are free)
+# NEO_BROWSE_QUOTA_RESERVE: stop fetching when NASA's X-RateLimit-Remaining reaches this
+# NEO_BROWSE_CACHE_PAGES / NEO_BROWSE_CACHE_TTL: parsed-page cache size and lifetime
+NEO_BROWSE_CONCURRENCY = config('NEO_BROWSE_CONCURRENCY', default=4, cast=int)
+NEO_BROWSE_PAGE_BUDGET = config('NEO_BROWSE_PAGE_BUDGET', default=25, cast=int)
+NEO_BROWSE_QUOTA_RESERVE = config('NEO_BROWSE_QUOTA_RESERVE', default=50, cast=int)
+NEO_BROWSE_CACHE_PAGES = config('NEO_BROWSE_CACHE_PAGES', default=2000, cast=int)
+NEO_BROWSE_CACHE_TTL = config('NEO_BROWSE_CACHE_TTL', default=6 * 60 * 60, cast=int)
+
+# Asteroid detail lookups (/api/asteroids/<id> and /api/asteroids/batch)
+# NEO_DETAIL_CACHE_SIZE / NEO_DETAIL_CACHE_TTL: parsed-record cache size and lifetime
+# NEO_BATCH_CONCURRENCY: NASA requests in flight for one batch
+NEO_DETAIL_CACHE_SIZE = config('NEO_DETAIL_CACHE_SIZE', default=5000, cast=int)
+NEO_DETAIL_CACHE_TTL = config('NEO_DETAIL_CACHE_TTL', default=60 * 60, cast=int)
+NEO_BATCH_MAX_IDS = config('NEO_BATCH_MAX_IDS', default=100, cast=int)
+NEO_BATCH_CONCURRENCY = config('NEO_BATCH_CONCURRENCY', default=8, cast=int)
+
+# Local catalog for /api/asteroids/query (api.catalog_store)
+# NEO_CATALOG_SYNC_PAGES: browse pages loaded per sync (0 = whole catalog)
+# NEO_CATALOG_TTL: seconds before a background refresh is started
+NEO_CATALOG_SYNC_PAGES = config('NEO_CATALOG_SYNC_PAGES', default=100, cast=int)
+NEO_CATALOG_TTL = config('NEO_CATALOG_TTL', default=6 * 60 * 60, cast=int)
+NEO_QUERY_MAX_LIMIT = config('NEO_QUERY_MAX_LIMIT', default=1000, cast=int)
+NEO_CHANGES_MAX_LIMIT = config('NEO_CHANGES_MAX_LIMIT', default=5000, cast=int)
+# NEO_CATALOG_SNAPSHOT_PATH: snapshot file loaded at startup and rewritten after
+# each sync (api.catalog_snapshot; manage.py export_catalog / import_catalog)
+# NEO_CATALOG_SNAPSHOT_CHECK: seconds between checks for a snapshot replaced by
+# another worker or import_catalog
+NEO_CATALOG_SNAPSHOT_PATH = config('NEO_CATALOG_SNAPSHOT_PATH', default='')
+NEO_CATALOG_SNAPSHOT_CHECK = config('NEO_CATALOG_SNAPSHOT_CHECK', default=30, cast=int)
+
+# Conditional GET (api.conditional)
+# CONDITIONAL_GET_CACHE_SIZE: ETag validators remembered per view
+CONDITIONAL_GET_CACHE_SIZE = config('CONDITIONAL_GET_CACHE_SIZE', default=10000, cast=int)
+
+# Start-up budget checked by manage.py profile_startup
+# STARTUP_BUDGET_MS: Django setup plus the first response, in milliseconds
+STARTUP_BUDGET_MS = config('STARTUP_BUDGET_MS', default=1000, cast=int)
+
+# Impact physics lookup tables (approximate "table" mode)
+# PHYSICS_TABLE_PATH: .npz file to load tables from (written after a build if missing)
+# PHYSICS_TABLES_PRELOAD: also build/load them in AppConfig.ready (gunicorn
+# always does so in its master, before forking workers; see gunicorn.conf.py)
+PHYSICS_TABLE_PATH = config('PHYSICS_TABLE_PATH', default='')
+PHYSICS_TABLES_PRELOAD = config('PHYSICS_TABLES_PRELOAD', default=False, cast=bool)
+
+# Result cache for POST simulation endpoints (per process, LRU + TTL)
+# SIMULATION_CACHE_COORD_PRECISION: decimal places of lat/lon kept in the cache key
+SIMULATION_CACHE_ENABLED = config('SIMULATION_CACHE_ENABLED', default=True, cast=bool)
+SIMULATION_CACHE_SIZE = config('SIMULATION_CACHE_SIZE', default=1024, cast=int)
+SIMULATION_CACHE_TTL = config('SIMULATION_CACHE_TTL', default=60 * 60, cast=int)
+SIMULATION_CACHE_COORD_PRECISION = config('SIMULATION_CACHE_COORD_PRECISION', default=3, cast=int)
+
+# Process-pool size for large deflection sweeps requested with "parallel": true
+# DEFLECTION_SWEEP_MAX_POINTS: grid limit of the synchronous /api/deflection-sweep
+# (larger sweeps go through a deflection_sweep job)
+DEFLECTION_SWEEP_WORKERS = config('DEFLECTION_SWEEP_WORKERS', default=4, cast=int)
+DEFLECTION_SWEEP_MAX_POINTS = config('DEFLECTION_SWEEP_MAX_POINTS', default=250000, cast=int)
+
+# Background simulation jobs (api.jobs): queue state lives in the database
+# JOB_RESULT_TTL: seconds a finished job and its result are kept
+# JOB_TIMEOUT: seconds after which a job still "running" is marked failed
+# JOB_MAX_GRID_POINTS: impact_grid size; the result is one JSON row of about
+# 300 bytes per point (larger grids: /api/stream/impact-grid)
+# JOB_MAX_SAMPLES: monte_carlo ensemble size (samples are kept in memory)
+JOB_WORKERS = config('JOB_WORKERS', default=2, cast=int)
+JOB_RESULT_TTL = config('JOB_RESULT_TTL', default=24 * 60 * 60, cast=int)
+JOB_TIMEOUT = config('JOB_TIMEOUT', default=60 * 60, cast=int)
+JOB_MAX_GRID_POINTS = config('JOB_MAX_GRID_POINTS', default=20000, cast=int)
+JOB_MAX_SAMPLES = config('JOB_MAX_SAMPLES', default=1000000, cast=int)
+
+# Limits for server-sent-event simulation streams
+STREAM_MAX_SAMPLES = config('STREAM_MAX_SAMPLES', default=200000, cast=int)
+STREAM_MAX_GRID_POINTS = config('STREAM_MAX_GRID_POINTS', default=250000, cast=int)
+
 # Cache Configuration (for rate limiting and response caching)
 CACHES = {
     'default': {
@@ -0,0 +1,21 @@
+"""
+Gunicorn worker class for the ASGI application (see gunicorn.conf.py)
+"""
+import os
+
+from uvicorn.workers import UvicornWorker
+
+
+class ASGIWorker(UvicornWorker):
+    """
+    Uvicorn worker with a bound on requests in flight
+    
+    Every in-flight sync view holds its own thread and database connection,
+    so WEB_MAX_IN_FLIGHT (default 64, open SSE streams included) caps both
+    per worker; uvicorn answers 503 beyond it instead of piling up threads.
+    """
+    
+    CONFIG_KWARGS = dict(
+        UvicornWorker.CONFIG_KWARGS,
+        limit_concurrency=int(os.environ.get('WEB_MAX_IN_FLIGHT', 64))
+    )
@@ -0,0 +1,49 @@
+"""
+Gunicorn settings (read from the working directory: gunicorn backend.asgi:application)
+
+The app is preloaded in the master, so Django, the physics lookup tables
+(built in when_ready, or loaded from PHYSICS_TABLE_PATH) and the catalog
+snapshot (NEO_CATALOG_SNAPSHOT_PATH) are loaded once and inherited by every
+forked worker. Snapshot columns and index arrays are read-only file
+mappings shared through the page cache, and preloaded numpy tables are
+never written, so their pages stay shared after fork. When a worker
+refreshes the catalog it writes a new snapshot and the other workers map
+it on their next check (NEO_CATALOG_SNAPSHOT_CHECK).
+
+Concurrency: workers are uvicorn (ASGI) processes so the server-sent-event
+streams run as async views on the event loop. The DRF views are sync;
+Django runs each request's sync code in a thread of its own (one
+ThreadSensitiveContext per ASGI request), so a slow NASA call (10 s
+timeout) blocks only its own request, not the worker (checked by
+api.tests.test_asgi). The costs against threaded WSGI workers are a
+thread hop per request and no fixed thread pool: each in-flight sync
+request holds a thread and a database connection, which
+backend.workers.ASGIWorker bounds with WEB_MAX_IN_FLIGHT per worker.
+Size WEB_CONCURRENCY to CPU cores (numpy physics is CPU-bound) and
+WEB_MAX_IN_FLIGHT to the database connection limit / WEB_CONCURRENCY.
+"""
+import os
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'backend.workers.ASGIWorker'
+preload_app = True
+
+
+def when_ready(server):
+    # Import the URLconf and the lazily imported engines once in the master,
+    # so no worker pays for them on its first request. The table-mode lookup
+    # tables take seconds to build under a lock, so build them here too
+    # rather than in the first mode=table request of each worker.
+    from api.lazy import warm_up
+    from api.physics import physics_engine
+    warm_up()
+    physics_engine.lookup_tables.get()
+
+
+def pre_fork(server, worker):
+    # Background threads started while loading (name index build) do not
+    # survive fork; finish them so workers inherit a complete index
+    from api.catalog_store import catalog_store
+    catalog_store.join_background()